@@ -8,8 +8,27 @@
 from django.db import models
 
 
+class BackfillChunks(models.Model):
+    board_name = models.ForeignKey('JobBoardWebsites', models.DO_NOTHING, db_column='board_name')
+    first_page = models.IntegerField()
+    last_page = models.IntegerField()
+    planned_total = models.IntegerField()
+    next_page = models.IntegerField(blank=True, null=True)
+    status = models.CharField()
+    leased_by = models.CharField(blank=True, null=True)
+    lease_expires = models.DateTimeField(blank=True, null=True)
+    attempts = models.IntegerField()
+    updated_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        managed = False
+        db_table = 'backfill_chunks'
+        unique_together = (('board_name', 'first_page'),)
+
+
 class Companies(models.Model):
     name = models.CharField()
+    name_clean = models.CharField(blank=True, null=True)
     size = models.SmallIntegerField(blank=True, null=True)
     country_code = models.ForeignKey('Countries', models.DO_NOTHING, db_column='country_code')
     website_url = models.CharField(blank=True, null=True)
@@ -95,14 +114,28 @@ class Locations(models.Model):
     street = models.CharField(blank=True, null=True)
     latitude = models.DecimalField(max_digits=65535, decimal_places=65535)
     longitude = models.DecimalField(max_digits=65535, decimal_places=65535)
+    place_key = models.CharField(unique=True)
 
     class Meta:
         managed = False
         db_table = 'locations'
 
 
+class NameAliases(models.Model):
+    pk = models.CompositePrimaryKey('kind', 'scope', 'raw_clean')
+    kind = models.CharField()
+    scope = models.CharField()
+    raw_clean = models.CharField()
+    target = models.CharField()
+
+    class Meta:
+        managed = False
+        db_table = 'name_aliases'
+
+
 class OfferCategories(models.Model):
     name = models.CharField(primary_key=True)
+    name_clean = models.CharField(blank=True, null=True)
 
     class Meta:
         managed = False
@@ -135,6 +168,8 @@ class Offers(models.Model):
     publish_date = models.DateTimeField()
     expire_date = models.DateTimeField()
     raw_json = models.JSONField(blank=True, null=True)
+    external_uid = models.CharField(blank=True, null=True)
+    content_hash = models.CharField(max_length=64, blank=True, null=True)
 
     class Meta:
         managed = False
@@ -216,6 +251,7 @@ class SkillLevels(models.Model):
 
 class Skills(models.Model):
     name = models.CharField(primary_key=True)
+    name_clean = models.CharField(blank=True, null=True)
 
     class Meta:
         managed = False
@@ -0,0 +1,19 @@
+# src/job_market_tools/management/commands/backfill_place_keys.py
+from django.core.management.base import BaseCommand
+
+from job_market_tools.services.locations import backfill_place_keys
+
+
+class Command(BaseCommand):
+    help = (
+        "Compute locations.place_key for rows created before the column "
+        "existed, merging locations that fall onto the same key."
+    )
+
+    def handle(self, *args, **options):
+        result = backfill_place_keys()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['keyed']} locations keyed, {result['merged']} duplicates merged."
+            )
+        )
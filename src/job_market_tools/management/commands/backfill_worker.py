@@ -0,0 +1,90 @@
+# src/job_market_tools/management/commands/backfill_worker.py
+import json
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+
+from job_market_tools.scraper.base import SCRAPER_REGISTRY
+from job_market_tools.services.backfill_chunks import chunk_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Help the distributed backfill of BOARD: claim page chunks from "
+        "backfill_chunks until every chunk is done, then exit.  Start as many "
+        "workers on as many hosts as the board tolerates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("board", help="registered board name")
+        parser.add_argument(
+            "--chunk-pages", type=int, default=20,
+            help="pages per chunk when this worker makes the plan",
+        )
+        parser.add_argument(
+            "--lease-seconds", type=float, default=120,
+            help="lease length; a chunk of a worker silent for that long is "
+                 "handed to another",
+        )
+        parser.add_argument(
+            "--interval", type=float, default=10,
+            help="seconds between claim attempts while other workers hold "
+                 "the remaining chunks",
+        )
+        parser.add_argument(
+            "--max-in-flight", type=int, default=8,
+            help="concurrent detail requests of this worker",
+        )
+        parser.add_argument(
+            "--config", action="append", default=[], metavar="KEY=VALUE",
+            help="extra scraper config (VALUE is parsed as JSON, else kept as "
+                 "a string); repeatable",
+        )
+        parser.add_argument(
+            "--status", action="store_true",
+            help="print the chunks per status and exit",
+        )
+
+    def handle(self, *args, **options):
+        board = options["board"]
+        cls = SCRAPER_REGISTRY.get(board)
+        if not cls:
+            raise CommandError(
+                f"No scraper registered under '{board}'; known boards: "
+                f"{', '.join(sorted(SCRAPER_REGISTRY))}"
+            )
+        if options["status"]:
+            self.stdout.write(", ".join(f"{k}: {v}" for k, v in chunk_counts(board).items()))
+            return
+
+        config = {}
+        for item in options["config"]:
+            key, sep, value = item.partition("=")
+            if not sep:
+                raise CommandError(f"--config expects KEY=VALUE, got {item!r}")
+            try:
+                config[key] = json.loads(value)
+            except ValueError:
+                config[key] = value
+        scraper = cls(**{
+            **config,
+            "name":          board,
+            "backfill":      "chunks",
+            "backfill_only": True,
+            "chunk_pages":   options["chunk_pages"],
+            "lease_seconds": options["lease_seconds"],
+            "max_in_flight": options["max_in_flight"],
+        })
+
+        done = threading.Event()
+        scraper.start(options["interval"], on_exit=lambda _: done.set())
+        try:
+            while not done.wait(1):             # wake up for Ctrl-C
+                pass
+        except KeyboardInterrupt:
+            self.stdout.write("Interrupted – releasing the current chunk…")
+        finally:
+            scraper.stop()
+        self.stdout.write(self.style.SUCCESS(
+            f"Backfill worker stopped: {chunk_counts(board)}"
+        ))
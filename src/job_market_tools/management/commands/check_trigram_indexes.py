@@ -0,0 +1,82 @@
+# src/job_market_tools/management/commands/check_trigram_indexes.py
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from job_market_tools.db_schema.database import Companies, OfferCategories, Skills
+from job_market_tools.services.normalizer import _clean_name
+
+# tables the normalizers search with `name_clean % …`, and a probe value
+TABLES = [
+    (Companies,       "acme software"),
+    (Skills,          "python"),
+    (OfferCategories, "backend"),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the normalizers' trigram lookups (`name_clean % …`) are "
+        "planned as index scans.  With --fill, populate missing name_clean "
+        "values first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fill", action="store_true",
+            help="compute name_clean for rows where it is NULL",
+        )
+        parser.add_argument(
+            "--natural", action="store_true",
+            help="don't disable seq scans – show the plan the planner picks "
+                 "for the current table sizes",
+        )
+
+    def handle(self, *args, **options):
+        with connection.cursor() as cur:
+            cur.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if not cur.fetchone():
+                raise CommandError("pg_trgm extension is not installed")
+
+        if options["fill"]:
+            for model, _ in TABLES:
+                n = self._fill(model)
+                self.stdout.write(f"{model._meta.db_table}: filled {n} name_clean values")
+
+        failed = []
+        for model, probe in TABLES:
+            qs = model.objects.filter(name_clean__trigram_similar=probe)
+            with transaction.atomic():
+                with connection.cursor() as cur:
+                    cur.execute("ANALYZE " + model._meta.db_table)
+                    if not options["natural"]:
+                        # tiny tables are seq-scanned regardless – only ask
+                        # whether the index *can* serve the query
+                        cur.execute("SET LOCAL enable_seqscan = off")
+                plan = qs.explain()
+            ok = "Index Scan" in plan and "name_clean" in plan
+            self.stdout.write(
+                f"{'OK  ' if ok else 'FAIL'} {model._meta.db_table}\n"
+                + "\n".join("      " + line for line in plan.splitlines())
+            )
+            if not ok:
+                failed.append(model._meta.db_table)
+
+        if failed:
+            raise CommandError(
+                f"no trigram index scan on: {', '.join(failed)} – see "
+                "db_schema/README.md for the CREATE INDEX statements"
+            )
+        self.stdout.write(self.style.SUCCESS("All trigram lookups use their index."))
+
+    def _fill(self, model, chunk_size: int = 1000) -> int:
+        pk = model._meta.pk.attname
+        rows = model.objects.filter(name_clean__isnull=True).values_list(pk, "name")
+        batch, total = [], 0
+        for key, name in rows.iterator(chunk_size=chunk_size):
+            batch.append(model(**{pk: key, "name": name, "name_clean": _clean_name(name)}))
+            if len(batch) >= chunk_size:
+                total += model.objects.bulk_update(batch, ["name_clean"])
+                batch = []
+        if batch:
+            total += model.objects.bulk_update(batch, ["name_clean"])
+        return total
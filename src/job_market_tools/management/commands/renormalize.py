@@ -0,0 +1,100 @@
+# src/job_market_tools/management/commands/renormalize.py
+from django.core.management.base import BaseCommand, CommandError
+
+from job_market_tools.services import renormalize as R
+from job_market_tools.services.aliases import forget_aliases
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-apply the current normalization rules to stored offers: refresh "
+        "name_clean, merge duplicate companies / skills / categories and "
+        "re-normalize every offer from raw_json.  Stop the scrapers first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--checkpoint", metavar="PATH",
+            help="JSON file recording progress; an interrupted run started "
+                 "with the same file continues where it stopped",
+        )
+        parser.add_argument(
+            "--restart", action="store_true",
+            help="ignore an existing checkpoint file and start over",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=2,
+            help="writer threads (= DB connections) re-normalizing offers",
+        )
+        parser.add_argument(
+            "--normalize-workers", type=int, default=0,
+            help="processes matching names ahead of the writers (0 = off)",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=500,
+            help="offers per cursor fetch, write batch and checkpoint",
+        )
+        parser.add_argument(
+            "--no-merge", action="store_true",
+            help="don't merge duplicate canonical rows",
+        )
+        parser.add_argument(
+            "--prune", action="store_true",
+            help="finally delete companies, skills and categories no offer uses",
+        )
+
+    def handle(self, *args, **options):
+        path = options["checkpoint"]
+        if options["restart"] and not path:
+            raise CommandError("--restart needs --checkpoint")
+        cp = R.Checkpoint(None if options["restart"] else path)
+        cp.path = path
+        if cp.state["done"]:
+            self.stdout.write(f"Resuming after: {', '.join(cp.state['done'])}")
+
+        if not cp.is_done("clean"):
+            changed = R.refresh_clean_names()
+            self.stdout.write(f"name_clean refreshed: {changed}")
+            cp.finish("clean")
+
+        if not cp.is_done("aliases"):
+            n = forget_aliases(R.MODELS)
+            self.stdout.write(f"aliases dropped: {n}")
+            cp.finish("aliases")
+
+        for kind in ([] if options["no_merge"] else R.MODELS):
+            step = f"merge:{kind}"
+            if cp.is_done(step):
+                continue
+            merges = R.plan_merges(kind)
+            deleted = R.apply_merges(kind, merges)
+            self.stdout.write(f"{kind}: merged {deleted} duplicates")
+            cp.finish(step)
+
+        if not cp.is_done("offers"):
+            def progress(counts):
+                self.stdout.write(
+                    f"offers: {counts['seen']} read, up to id "
+                    f"{cp.state['last_offer_id']} done – {counts}"
+                )
+
+            counts = R.renormalize_offers(
+                cp,
+                workers=options["workers"],
+                normalize_workers=options["normalize_workers"],
+                chunk_size=options["chunk_size"],
+                progress=progress,
+            )
+            self.stdout.write(f"offers re-normalized: {counts}")
+            if cp.state["failed"]:
+                self.stdout.write(self.style.WARNING(
+                    f"{len(cp.state['failed'])} offers failed, see the log: "
+                    f"{cp.state['failed'][:20]}"
+                ))
+            cp.finish("offers")
+
+        if options["prune"] and not cp.is_done("prune"):
+            self.stdout.write(f"pruned: {R.prune()}")
+            cp.finish("prune")
+
+        self.stdout.write(self.style.SUCCESS("Re-normalization finished."))
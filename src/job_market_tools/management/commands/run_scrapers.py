@@ -1,18 +1,113 @@
 # src/job_market_tools/management/commands/run_scrapers.py
-from django.core.management.base import BaseCommand
-from job_market_tools.scraper.manager import ScraperManager
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from job_market_tools.scraper import ScraperManager, ScraperSupervisor
+from job_market_tools.scraper.base import SCRAPER_REGISTRY
 
 class Command(BaseCommand):
-    help = "Start up your scrapers"
+    help = (
+        "Run scrapers until SIGINT / SIGTERM, restarting any that crash.  "
+        "Without --board every registered board is started."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--board", action="append", default=[], metavar="NAME[:INTERVAL[:MAX_IN_FLIGHT]]",
+            help="board to run, optionally with its own polling interval (s) and "
+                 "number of concurrent detail requests; repeatable",
+        )
+        parser.add_argument(
+            "--interval", type=float, default=10,
+            help="default polling interval in seconds",
+        )
+        parser.add_argument(
+            "--max-in-flight", type=int, default=8,
+            help="default number of concurrent detail requests per board",
+        )
+        parser.add_argument(
+            "--config", action="append", default=[], metavar="KEY=VALUE",
+            help="extra scraper config for every board, e.g. ingest_writers=2 "
+                 "(VALUE is parsed as JSON, else kept as a string); repeatable",
+        )
+        parser.add_argument(
+            "--restart-backoff", type=float, default=5.0,
+            help="seconds before restarting a crashed scraper; doubles per crash",
+        )
+        parser.add_argument(
+            "--max-backoff", type=float, default=300.0,
+            help="upper bound of the restart delay",
+        )
+        parser.add_argument(
+            "--processes", action="store_true",
+            help="run every board in its own worker process instead of a thread",
+        )
+        parser.add_argument(
+            "--heartbeat-timeout", type=float, default=300.0,
+            help="with --processes: seconds without scraper progress before a "
+                 "board process counts as hung and is restarted",
+        )
+        parser.add_argument(
+            "--rate-limit-dir", metavar="DIR",
+            help="share the per-host request rate limits through lock files in "
+                 "DIR with every other scraper process on this machine",
+        )
+        parser.add_argument("--quiet", action="store_true", help="no progress output")
+        parser.add_argument(
+            "--list", action="store_true", help="list the registered boards and exit",
+        )
 
     def handle(self, *args, **options):
-        mgr = ScraperManager()
-        mgr.register("justjoin", verbose=True)
-        mgr.start("justjoin", 10)
-        self.stdout.write("Scraper started. Ctrl-C to stop.")
+        if options["list"]:
+            self.stdout.write("\n".join(sorted(SCRAPER_REGISTRY)))
+            return
+
+        config = {"verbose": not options["quiet"]}
+        if options["rate_limit_dir"]:
+            config["rate_limit_dir"] = options["rate_limit_dir"]
+        for item in options["config"]:
+            key, sep, value = item.partition("=")
+            if not sep:
+                raise CommandError(f"--config expects KEY=VALUE, got {item!r}")
+            try:
+                config[key] = json.loads(value)
+            except ValueError:
+                config[key] = value
+
+        if options["processes"]:
+            mgr = ScraperManager(
+                mode="process", heartbeat_timeout=options["heartbeat_timeout"]
+            )
+        else:
+            mgr = ScraperManager()
+        sup = ScraperSupervisor(
+            mgr,
+            backoff=options["restart_backoff"],
+            max_backoff=options["max_backoff"],
+            verbose=not options["quiet"],
+        )
+        for spec in options["board"] or sorted(SCRAPER_REGISTRY):
+            name, interval, in_flight = self._parse_board(spec, options)
+            try:
+                mgr.register(name, **{**config, "max_in_flight": in_flight})
+            except ValueError as e:
+                raise CommandError(f"{e}; known boards: {', '.join(sorted(SCRAPER_REGISTRY))}")
+            sup.add(name, interval)
+
+        self.stdout.write(
+            f"Supervising {', '.join(mgr.list_scrapers())}. Ctrl-C to stop."
+        )
+        sup.run()
+        self.stdout.write("All scrapers stopped.")
+
+    @staticmethod
+    def _parse_board(spec, options):
+        name, *rest = spec.split(":")
+        if len(rest) > 2:
+            raise CommandError(f"--board expects NAME[:INTERVAL[:MAX_IN_FLIGHT]], got {spec!r}")
         try:
-            while True:
-                pass
-        except KeyboardInterrupt:
-            self.stdout.write("\nStopping…")
-            mgr.stop("justjoin")
+            interval = float(rest[0]) if rest and rest[0] else options["interval"]
+            in_flight = int(rest[1]) if len(rest) > 1 else options["max_in_flight"]
+        except ValueError:
+            raise CommandError(f"bad interval / concurrency in --board {spec!r}")
+        return name, interval, in_flight
@@ -1,2 +1,4 @@
 from .boards import *
-from .manager import ScraperManager
\ No newline at end of file
+from .manager import ScraperManager
+from .supervisor import ScraperSupervisor
+from .process import BoardProcess
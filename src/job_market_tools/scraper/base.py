@@ -2,8 +2,15 @@
 import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
 import traceback
 
+from django.db import close_old_connections
+
+from .breaker import TRANSIENT, CircuitBreaker, classify_error, retry_after
+from .transport import HttpTransport
+
 SCRAPER_REGISTRY: dict[str, type["BaseScraper"]] = {}
 
 def register_scraper(name: str):
@@ -15,15 +22,55 @@ def register_scraper(name: str):
 
 class BaseScraper(ABC):
     """Abstract base: all scrapers must implement start/stop/fetch."""
+
+    # Headers every request of the board carries; `config["headers"]` wins.
+    DEFAULT_HEADERS: dict[str, str] = {}
+    # Requests / s (and burst) allowed per API host; `config["rate_limit"]`
+    # and `config["rate_burst"]` win.  None = unlimited.
+    RATE_LIMIT: float | None = None
+    RATE_BURST: float | None = None
+
     def __init__(self, **kwargs):
         self._thread = None
         self._stop_event = threading.Event()
+        self._on_exit: Optional[Callable[["BaseScraper"], None]] = None
         self.config = kwargs
+        self.interval: float = 60               # set by start()
+        # wall-clock time the loop thread last made progress – or, while it
+        # sleeps between runs, when it is due back; read by `BoardProcess`
+        self.progress_at: float = time.time()
         # ─────────── progress / debug output ───────────
         # `verbose` defaults to **True** so you get progress messages
         # out of the box.  Set `verbose=False` when you start a scraper
         # if you want it silent.
         self.verbose: bool = kwargs.get("verbose", True)
+        # ─────────── bounded request fan-out ───────────
+        # `max_in_flight` caps how many detail requests run concurrently;
+        # the connection pool is sized so every worker gets a socket.
+        self.max_in_flight: int = max(1, kwargs.get("max_in_flight", 8))
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # ─────────── shared keep-alive HTTP session ───────────
+        self.http = HttpTransport(
+            headers        = self.DEFAULT_HEADERS | kwargs.get("headers", {}),
+            timeout        = kwargs.get("timeout", (5, 30)),
+            pool_size      = kwargs.get("pool_size", max(10, self.max_in_flight)),
+            max_retries    = kwargs.get("max_retries", 5),
+            backoff_factor = kwargs.get("backoff_factor", 0.5),
+            rate_limit     = kwargs.get("rate_limit", self.RATE_LIMIT),
+            rate_burst     = kwargs.get("rate_burst", self.RATE_BURST),
+            rate_limit_dir = kwargs.get("rate_limit_dir"),
+        )
+        # ─────────── failure backoff / circuit breaker ───────────
+        # transient loop failures (429, 5xx, network, DB) are retried after
+        # a jittered doubling delay; `breaker_threshold` of them in a row
+        # pause the board for `breaker_cooldown` seconds.
+        self.breaker = CircuitBreaker(
+            threshold   = kwargs.get("breaker_threshold", 5),
+            backoff     = kwargs.get("error_backoff", 5.0),
+            max_backoff = kwargs.get("max_error_backoff", 900.0),
+            cooldown    = kwargs.get("breaker_cooldown", 120.0),
+        )
 
 # ------------------------------------------------------------------— helpers
     def _log(self, msg: str, *args, **kwargs) -> None:
@@ -33,52 +80,150 @@ class BaseScraper(ABC):
         name = self.config.get("name", self.__class__.__name__)
         print(f"[{name}] " + msg.format(*args, **kwargs))
 
+    def _gather(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Run ``fn(item)`` for every item on the scraper's thread pool, at most
+        `max_in_flight` at a time, and return the results in input order.
+
+        With ``return_exceptions=True`` a failing item yields its exception
+        in place of a result instead of aborting the whole batch.
+        """
+        items = list(items)
+        if len(items) <= 1 or self.max_in_flight == 1:
+            futures = None
+        else:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_in_flight,
+                        thread_name_prefix=f"{self.config.get('name', 'scraper')}-io",
+                    )
+            futures = [self._executor.submit(fn, item) for item in items]
+
+        out: list[Any] = []
+        for i, item in enumerate(items):
+            try:
+                out.append(futures[i].result() if futures else fn(item))
+            except Exception as e:
+                if not return_exceptions:
+                    for f in futures or ():
+                        f.cancel()
+                    raise
+                out.append(e)
+        return out
+
     @abstractmethod
     def fetch_offers_page(self, page: int = 1):
         """Fetch a page of offers. Must be implemented by subclasses."""
         ...
-    
+
     @abstractmethod
-    def fetch_offer_details(self, offer_ids: list[str]):
-        """Fetch details for a list of offers. Must be implemented by subclasses."""
+    def fetch_offer_detail(self, offer_id: str):
+        """Fetch details for a single offer. Must be implemented by subclasses."""
         ...
 
+    def fetch_offer_details(
+        self, offer_ids: list[str], return_exceptions: bool = False
+    ) -> list:
+        """Fetch details for a list of offers concurrently, in input order."""
+        return self._gather(self.fetch_offer_detail, offer_ids, return_exceptions)
+
     @abstractmethod
     def loop(self):
         """Main loop for the scraper. Must be implemented by subclasses."""
         ...
 
+    def _mark_progress(self, idle: float = 0.0) -> None:
+        """Record that the loop thread is working, or will sleep *idle* seconds."""
+        self.progress_at = time.time() + idle
+
     def _run_loop(self, interval: float):
         while not self._stop_event.is_set():
+            self._mark_progress()
+            self.breaker.before_call()
             try:
                 self.loop()
             except Exception as e:
-                # extract the traceback object
-                tb = e.__traceback__
-                # walk to the last frame in this traceback
-                while tb.tb_next:
-                    tb = tb.tb_next
-                lineno   = tb.tb_lineno
-                filename = tb.tb_frame.f_code.co_filename
-                funcname = tb.tb_frame.f_code.co_name
-
-                self._log(
-                    "ERROR in {func} at {file}:{line}: {err!r}",
-                    func=funcname, file=filename, line=lineno, err=e
-                )
-                # optionally, print full traceback
-                traceback.print_exc()
-            finally:
-                time.sleep(interval)
-
-    def start(self, interval: float = 60):
-        """Spawn a background thread that fetches every `interval` seconds."""
+                delay = self._loop_failed(e, interval)
+            else:
+                if self.breaker.success():
+                    self._log("Recovered – circuit closed")
+                delay = self._next_interval(interval)
+            self._mark_progress(idle=delay)
+            # returns as soon as stop() is called
+            self._stop_event.wait(delay)
+
+    def _loop_failed(self, e: Exception, interval: float) -> float:
+        """Log a failed `loop()` and return the seconds to wait before the next."""
+        kind = classify_error(e)
+        if kind in TRANSIENT:
+            if kind == "database":
+                close_old_connections()     # reconnect on the next attempt
+            delay = self.breaker.failure(kind, retry_after(e))
+            self._log(
+                "{kind} failure #{n} ({err!r}) – circuit {state}, retry in {d:.1f}s",
+                kind=kind, n=self.breaker.failures, err=e,
+                state=self.breaker.state, d=delay,
+            )
+            return delay
+
+        # extract the traceback object
+        tb = e.__traceback__
+        # walk to the last frame in this traceback
+        while tb.tb_next:
+            tb = tb.tb_next
+        lineno   = tb.tb_lineno
+        filename = tb.tb_frame.f_code.co_filename
+        funcname = tb.tb_frame.f_code.co_name
+
+        self._log(
+            "ERROR in {func} at {file}:{line}: {err!r}",
+            func=funcname, file=filename, line=lineno, err=e
+        )
+        # optionally, print full traceback
+        traceback.print_exc()
+        return self._next_interval(interval)
+
+    def _thread_main(self, interval: float):
+        try:
+            self._run_loop(interval)
+        except BaseException:
+            self._log("Scraper thread died")
+            traceback.print_exc()
+        finally:
+            if self._on_exit is not None:
+                self._on_exit(self)
+
+    def _next_interval(self, interval: float) -> float:
+        """Seconds to sleep before the next `loop()`; override to adapt."""
+        return interval
+
+    def start(
+        self,
+        interval: float = 60,
+        on_exit: Optional[Callable[["BaseScraper"], None]] = None,
+    ):
+        """
+        Spawn a background thread that fetches every `interval` seconds.
+        `on_exit(scraper)` is called from that thread when it ends – after
+        `stop()` or because it crashed.
+        """
         if self._thread and self._thread.is_alive():
             print(f"{self.__class__.__name__} already running")
             return
         self._stop_event.clear()
+        self.interval = interval
+        self._on_exit = on_exit
         self._thread = threading.Thread(
-            target=self._run_loop, args=(interval,), daemon=False
+            target=self._thread_main,
+            args=(interval,),
+            name=self.config.get("name", self.__class__.__name__),
+            daemon=False,
         )
         self._thread.start()
         self._log("Started scraper (interval={i}s)", i=interval)
@@ -89,7 +234,29 @@ class BaseScraper(ABC):
             return
         self._stop_event.set()
         self._thread.join()
-        self._log("Stopped scraper")
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+        self._log(
+            "Stopped scraper (HTTP requests={requests}, "
+            "connections opened={opened}, reused={reused}, "
+            "rate-limited={throttled} for {waited}s)",
+            **self.http.stats(),
+        )
+        self.http.close()
+
+    def is_alive(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def stopping(self) -> bool:
+        """True once `stop()` has been requested."""
+        return self._stop_event.is_set()
 
     def status(self) -> str:
-        return "running" if self._thread and self._thread.is_alive() else "stopped"
+        """``running``, ``backing off``, ``circuit open`` / ``half-open`` or ``stopped``."""
+        if not self.is_alive():
+            return "stopped"
+        if self.breaker.state != CircuitBreaker.CLOSED:
+            return f"circuit {self.breaker.state}"
+        return "backing off" if self.breaker.failures else "running"
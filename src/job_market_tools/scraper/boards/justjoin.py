@@ -1,6 +1,5 @@
 # src/job_market_tools/scraper/boards/justjoin.py
 from datetime import datetime
-import requests
 from ..resumable import ResumablePagedScraper
 from ..base import register_scraper
 
@@ -8,6 +7,11 @@ from ..base import register_scraper
 class JustJoinScraper(ResumablePagedScraper):
     OFFERS_PAGE_URL = "https://api.justjoin.it/v2/user-panel/offers"
     OFFER_PAGE_URL  = "https://api.justjoin.it/v1/offers/"
+    DEFAULT_HEADERS = {"Accept": "application/json", "version": "2"}
+    # api.justjoin.it is shared by the listing and detail calls of every
+    # instance; stay well below the point where it starts answering 429
+    RATE_LIMIT = 5.0
+    RATE_BURST = 10
 
     # ---------------------- ResumablePagedScraper hooks ------------------
     def _listing_uid(self, listing):              # ← unique per offer
@@ -18,17 +22,17 @@ class JustJoinScraper(ResumablePagedScraper):
         return datetime.fromisoformat(listing["publishedAt"].replace("Z", "+00:00"))
 
     def _total_pages(self):
-        resp = requests.get(
-            self.OFFERS_PAGE_URL,
-            params={"page": 1, "sortBy": "published", "orderBy": "DESC"},
-            headers={"Accept": "application/json", "version": "2"}
-        )
-        resp.raise_for_status()
-        return resp.json()["meta"]["totalPages"]
+        # same request as fetch_offers_page(1) → served from the page cache
+        return self._page_payload(1)["meta"]["totalPages"]
+
+    def _request_page(self, page):
+        params  = {"page": page, "sort": "newest"} | self.config.get("params", {})
+        return self.http.get_json(self.OFFERS_PAGE_URL, params=params)
 
     def _make_offer_payload(self, offer):
         return {
             "job_board_name": "justjoin",
+            "external_uid":      offer["slug"],
             "company_name":      offer["companyName"],
             "company_country_code": offer["countryCode"],
             "title":             offer["title"],
@@ -63,17 +67,7 @@ class JustJoinScraper(ResumablePagedScraper):
 
     # ---------------------- board-specific fetchers ----------------------
     def fetch_offers_page(self, page: int = 1):
-        params  = {"page": page, "sort": "newest"} | self.config.get("params", {})
-        headers = {"Accept": "application/json", "version": "2"} | self.config.get("headers", {})
-        resp = requests.get(self.OFFERS_PAGE_URL, params=params, headers=headers)
-        resp.raise_for_status()
-        return resp.json()["data"]
+        return self._page_payload(page)["data"]
 
-    def fetch_offer_details(self, offer_ids):
-        headers = {"Accept": "application/json", "version": "2"} | self.config.get("headers", {})
-        out = []
-        for oid in offer_ids:
-            resp = requests.get(self.OFFER_PAGE_URL + oid, headers=headers)
-            resp.raise_for_status()
-            out.append(resp.json())
-        return out
+    def fetch_offer_detail(self, offer_id):
+        return self.http.get_json(self.OFFER_PAGE_URL + offer_id)
@@ -0,0 +1,147 @@
+# src/job_market_tools/scraper/breaker.py
+"""
+Failure handling for `BaseScraper._run_loop`.
+
+`classify_error` sorts an exception escaping ``loop()`` into a kind.  The
+transient kinds – the board rate-limiting us, its servers failing, the
+network or our database being unavailable – are fed to a `CircuitBreaker`
+that spaces the retries out:
+
+* after each consecutive failure the loop waits a jittered, doubling delay
+  (``backoff``, ``2 × backoff``, … up to ``max_backoff``) – usually far
+  shorter than the polling interval, so a short blip is caught up quickly;
+* after ``threshold`` consecutive failures the circuit *opens*: nothing is
+  requested for ``cooldown`` seconds (doubling while the outage lasts),
+  then one *half-open* probe run decides between closing the circuit and
+  opening it again.
+
+A ``Retry-After`` sent with a 429 / 503 is a lower bound for the delay.
+Any other exception is most likely a bug; it is logged with its traceback
+and the loop keeps its normal interval.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Optional
+
+import requests
+from django.db import InterfaceError, OperationalError
+
+from ..services.ingest_queue import IngestFailed
+from .transport import parse_retry_after
+
+TRANSIENT = frozenset({"rate_limited", "server", "network", "database"})
+
+
+def classify_error(exc: BaseException) -> str:
+    """
+    ``rate_limited`` (HTTP 429), ``server`` (5xx), ``client`` (other 4xx),
+    ``network`` (connection errors, timeouts), ``database`` (connection-level
+    DB errors) or ``error`` for everything else.  Failed ingest writes are
+    classified by their first error.
+    """
+    if isinstance(exc, IngestFailed) and exc.__cause__ is not None:
+        return classify_error(exc.__cause__)
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        code = exc.response.status_code
+        if code == 429:
+            return "rate_limited"
+        if code >= 500:
+            return "server"
+        return "client"
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout,
+                        requests.exceptions.RetryError)):
+        return "network"
+    if isinstance(exc, (OperationalError, InterfaceError)):
+        return "database"
+    return "error"
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds requested by the ``Retry-After`` header of a failed response."""
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    return parse_retry_after(response.headers.get("Retry-After"))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure counter of one scraper loop.
+
+    * ``threshold``   – consecutive transient failures that open the circuit
+    * ``backoff``     – delay after the first failure
+    * ``max_backoff`` – cap of every delay, the open-circuit cooldown included
+    * ``cooldown``    – how long a freshly opened circuit stays open
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        backoff: float = 5.0,
+        max_backoff: float = 900.0,
+        cooldown: float = 120.0,
+    ):
+        self.threshold = max(1, threshold)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0                    # consecutive transient failures
+        self.last_error: Optional[str] = None
+        self._opened = 0                     # times opened during this outage
+        self._retry_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Move an open circuit whose cooldown is over to half-open."""
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() >= (self._retry_at or 0):
+                self.state = self.HALF_OPEN
+
+    def success(self) -> bool:
+        """Record a clean run; True if it ended an outage."""
+        with self._lock:
+            recovered = self.failures > 0
+            self.state = self.CLOSED
+            self.failures = self._opened = 0
+            self._retry_at = None
+        return recovered
+
+    def failure(self, kind: str, min_delay: Optional[float] = None) -> float:
+        """Record a transient failure of *kind*; returns the seconds to wait."""
+        with self._lock:
+            self.failures += 1
+            self.last_error = kind
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                self.state = self.OPEN
+                self._opened += 1
+                delay = self.cooldown * 2 ** (self._opened - 1)
+            else:
+                delay = self.backoff * 2 ** (self.failures - 1)
+            # "equal jitter": keep half the delay, randomise the rest so
+            # scrapers failing together don't retry in lock-step
+            delay = min(delay, self.max_backoff)
+            delay = delay / 2 + random.uniform(0, delay / 2)
+            if min_delay:
+                delay = max(delay, min_delay)
+            self._retry_at = time.monotonic() + delay
+            return delay
+
+    def snapshot(self) -> dict:
+        """``state``, ``failures``, ``last_error`` and ``retry_in`` seconds."""
+        with self._lock:
+            retry_in = (
+                round(max(0.0, self._retry_at - time.monotonic()), 1)
+                if self._retry_at is not None else None
+            )
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "last_error": self.last_error,
+                "retry_in": retry_in,
+            }
@@ -0,0 +1,47 @@
+# src/job_market_tools/scraper/cache.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class PageCache:
+    """
+    Small thread-safe LRU with a per-entry TTL.
+
+    Used for listing pages within one scraper run: the binary-search probes,
+    total-page discovery and ingestion all ask for the same pages, but board
+    listings shift as new offers arrive, so entries only live `ttl` seconds.
+    """
+
+    def __init__(self, maxsize: int = 64, ttl: float = 120):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry and now - entry[0] < self.ttl:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()                    # network call – outside the lock
+
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
@@ -1,22 +1,42 @@
 # src/job_market_tools/scraper/manager.py
+import threading
+
 from .base import BaseScraper, SCRAPER_REGISTRY
+from .process import BoardProcess
 
 class ScraperManager:
-    def __init__(self):
-        self._instances: dict[str, BaseScraper] = {}
+    """
+    Registry of running scrapers.
+
+    ``mode="thread"`` (default) runs every board as a thread of this
+    process; ``mode="process"`` runs each board in its own worker process
+    (`BoardProcess`), supervised through heartbeats.  ``process_options``
+    are passed to `BoardProcess` (``heartbeat``, ``heartbeat_timeout``,
+    ``stop_timeout``).
+    """
+
+    def __init__(self, mode: str = "thread", **process_options):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown mode '{mode}'")
+        self.mode = mode
+        self.process_options = process_options
+        self._instances: dict[str, BaseScraper | BoardProcess] = {}
 
     def register(self, name: str, **config):
         cls = SCRAPER_REGISTRY.get(name)
         if not cls:
             raise ValueError(f"No scraper registered under '{name}'")
         config.setdefault("name", name)
-        self._instances[name] = cls(**config)
+        if self.mode == "process":
+            self._instances[name] = BoardProcess(name, config, **self.process_options)
+        else:
+            self._instances[name] = cls(**config)
 
-    def start(self, name: str, interval: float = 60):
+    def start(self, name: str, interval: float = 60, on_exit=None):
         scraper = self._instances.get(name)
         if not scraper:
             raise ValueError(f"Scraper '{name}' not registered")
-        scraper.start(interval)
+        scraper.start(interval, on_exit=on_exit)
 
     def stop(self, name: str):
         scraper = self._instances.get(name)
@@ -24,6 +44,21 @@ class ScraperManager:
             return
         scraper.stop()
 
+    def stop_all(self):
+        """Stop every scraper concurrently; returns once all have drained."""
+        threads = [
+            threading.Thread(target=self.stop, args=(name,), name=f"stop-{name}")
+            for name in self._instances
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def is_alive(self, name: str) -> bool:
+        scraper = self._instances.get(name)
+        return bool(scraper and scraper.is_alive())
+
     def status(self, name: str) -> str:
         scraper = self._instances.get(name)
         return scraper.status() if scraper else "not registered"
@@ -0,0 +1,195 @@
+# src/job_market_tools/scraper/process.py
+"""
+Process-per-board execution for `ScraperManager(mode="process")`.
+
+`BoardProcess` stands in for a scraper instance inside the manager: it has
+the same ``start`` / ``stop`` / ``status`` / ``is_alive`` surface, but the
+scraper itself lives in a child process – with its own interpreter, GIL,
+memory and Django DB connection – so boards use separate cores and a leak
+or crash in one board cannot take the others down.
+
+The child publishes its scraper's progress stamp (`BaseScraper.progress_at`,
+moved by the scraper thread after every page and every run, and pushed
+ahead by the planned sleep between runs) and its `status()`, i.e. the
+circuit-breaker state, through shared memory every ``heartbeat`` seconds.
+A scraper thread stuck in an HTTP call or a DB query stops moving the
+stamp even though the child's main thread keeps running, so the parent
+treats a live process whose stamp is older than ``heartbeat_timeout`` as
+hung, kills it and reports the exit like a crash, so `ScraperSupervisor`
+restarts it.
+
+Children are started with the ``spawn`` method (never fork a process that
+runs threads) and ignore SIGINT: a Ctrl-C on the terminal reaches the whole
+process group, and shutdown is coordinated by the parent through a shared
+stop event.
+"""
+import multiprocessing
+import signal
+import threading
+import time
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict, Optional
+
+_ctx = multiprocessing.get_context("spawn")
+_STATE_LEN = 31
+
+
+# ──────────────────────────────────────────────────────────
+# Child side
+# ──────────────────────────────────────────────────────────
+def _board_main(
+    name: str,
+    config: Dict[str, Any],
+    interval: float,
+    stop,
+    heartbeat,
+    state,
+    beat_every: float,
+) -> None:
+    """Entry point of a board process; exit code 1 = the scraper died."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    import django
+    django.setup()
+    from django.db import connection
+
+    from . import boards  # noqa: F401  (fills SCRAPER_REGISTRY)
+    from .base import SCRAPER_REGISTRY
+
+    scraper = SCRAPER_REGISTRY[name](**config)
+    scraper.start(interval)
+    try:
+        while scraper.is_alive():
+            heartbeat.value = scraper.progress_at
+            state.value = scraper.status().encode()[:_STATE_LEN]
+            if stop.wait(beat_every):
+                break
+    finally:
+        # a scraper that stopped itself (e.g. `backfill_only` done) is no crash
+        died = not scraper.is_alive() and not (stop.is_set() or scraper.stopping())
+        scraper.stop()
+        connection.close()
+    raise SystemExit(1 if died else 0)
+
+
+# ──────────────────────────────────────────────────────────
+# Parent side
+# ──────────────────────────────────────────────────────────
+class BoardProcess:
+    """
+    Handle of one board running in a child process.
+
+    * ``heartbeat``         – seconds between the child's heartbeats
+    * ``heartbeat_timeout`` – seconds without scraper progress after which
+      the child counts as hung and is killed; must exceed the slowest page
+      (HTTP retries and rate-limit waits included)
+    * ``stop_timeout``      – seconds `stop()` waits for a drain before
+      killing the child
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Dict[str, Any],
+        heartbeat: float = 1.0,
+        heartbeat_timeout: float = 300.0,
+        stop_timeout: float = 60.0,
+    ):
+        self.config = config
+        self.name = name
+        self.heartbeat = heartbeat
+        self.heartbeat_timeout = heartbeat_timeout
+        self.stop_timeout = stop_timeout
+        self.interval: float = 60
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._stop_event = _ctx.Event()
+        self._beat = _ctx.Value("d", 0.0, lock=False)
+        self._state = _ctx.Array("c", _STATE_LEN + 1)
+        self._stopping = False
+        self._on_exit: Optional[Callable[["BoardProcess"], None]] = None
+        self._watcher: Optional[threading.Thread] = None
+
+    def _log(self, msg: str, *args, **kwargs) -> None:
+        if self.config.get("verbose", True):
+            print(f"[{self.name}] " + msg.format(*args, **kwargs))
+
+    # ------------------------------------------------------------------— scraper surface
+    def start(
+        self,
+        interval: float = 60,
+        on_exit: Optional[Callable[["BoardProcess"], None]] = None,
+    ) -> None:
+        if self.is_alive():
+            print(f"{self.name} already running")
+            return
+        self.interval = interval
+        self._on_exit = on_exit
+        self._stopping = False
+        self._stop_event.clear()
+        self._beat.value = time.time()
+        self._state.value = b"running"
+        self._process = _ctx.Process(
+            target=_board_main,
+            args=(self.name, self.config, interval, self._stop_event,
+                  self._beat, self._state, self.heartbeat),
+            name=f"board-{self.name}",
+        )
+        self._process.start()
+        self._watcher = threading.Thread(
+            target=self._watch, name=f"watch-{self.name}", daemon=True
+        )
+        self._watcher.start()
+        self._log("Started board process pid={pid}", pid=self._process.pid)
+
+    def stop(self) -> None:
+        """Ask the child to drain and wait for it; kill it if it hangs."""
+        if not self._process:
+            return
+        self._stopping = True
+        self._stop_event.set()
+        self._process.join(self.stop_timeout)
+        if self._process.is_alive():
+            self._log("No exit after {t}s – killing", t=self.stop_timeout)
+            self._process.kill()
+            self._process.join()
+        if self._watcher:
+            self._watcher.join()
+        self._log("Board process exited (code {code})", code=self._process.exitcode)
+
+    def stopping(self) -> bool:
+        return self._stopping
+
+    def is_alive(self) -> bool:
+        return bool(self._process and self._process.is_alive())
+
+    def heartbeat_age(self) -> Optional[float]:
+        """Seconds since the child's last heartbeat, None when not running."""
+        if not self.is_alive():
+            return None
+        return max(0.0, time.time() - self._beat.value)
+
+    def status(self) -> str:
+        """The child scraper's `status()`, ``unresponsive`` or ``stopped``."""
+        age = self.heartbeat_age()
+        if age is None:
+            return "stopped"
+        if age >= self.heartbeat_timeout:
+            return "unresponsive"
+        return self._state.value.decode()
+
+    # ------------------------------------------------------------------— watchdog
+    def _watch(self) -> None:
+        """Wait for the child to exit – killing it if it stops beating."""
+        process = self._process
+        while not wait([process.sentinel], timeout=self.heartbeat_timeout):
+            age = time.time() - self._beat.value
+            if age > self.heartbeat_timeout and not self._stopping:
+                # a hung child may not run its SIGTERM handler either
+                self._log("No heartbeat for {a:.0f}s – killing", a=age)
+                process.kill()
+        process.join()
+        if process.exitcode == 0:
+            self._stopping = True       # finished on its own – not a crash
+        if self._on_exit is not None:
+            self._on_exit(self)
@@ -0,0 +1,209 @@
+# src/job_market_tools/scraper/ratelimit.py
+"""
+Per-host request rate limiting for `HttpTransport`.
+
+Every host gets one token bucket per process, shared by all scrapers
+and all of their detail-fetch workers: ``rate`` tokens per second refill a
+bucket of ``burst`` tokens and each request takes one.  A request
+finding the bucket empty reserves the next token and sleeps until it is
+due, so concurrent callers are spaced out evenly at exactly ``rate``
+requests per second instead of sleeping a conservative fixed amount.
+
+With a ``shared_dir`` the bucket state lives in ``<shared_dir>/<host>.bucket``
+and is updated under an exclusive ``flock``, so board processes
+(``run_scrapers --processes``) or several ``run_scrapers`` on one machine
+draw from the same budget.
+
+A 429 that gets past the transport's retries empties the host's bucket
+for the ``Retry-After`` period, which pauses every caller of that host
+and not just the one that hit the limit.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+# ─────────── optional cross-process lock ───────────
+try:
+    import fcntl                       # POSIX only
+except ModuleNotFoundError:            # in-process buckets still work
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    * ``rate``  – tokens refilled per second (sustained requests / s)
+    * ``burst`` – bucket capacity (requests allowed back-to-back)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1.0, burst or rate)
+        self._tokens = self.burst
+        self._stamp = self._now()
+        self._lock = threading.Lock()
+        self.throttled = 0                  # requests that had to wait
+        self.waited = 0.0                   # seconds spent waiting
+
+    # ------------------------------------------------------------------— state
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            yield
+
+    def _load(self) -> Tuple[float, float]:
+        return self._tokens, self._stamp
+
+    def _save(self, tokens: float, stamp: float) -> None:
+        self._tokens, self._stamp = tokens, stamp
+
+    def _update(self, cost: float, ceiling: Optional[float] = None) -> float:
+        """Refill, take *cost* tokens and return the seconds until they are due."""
+        with self._locked():
+            tokens, stamp = self._load()
+            now = self._now()
+            tokens = min(self.burst, tokens + max(0.0, now - stamp) * self.rate) - cost
+            if ceiling is not None:
+                tokens = min(tokens, ceiling)
+            self._save(tokens, now)
+        return max(0.0, -tokens / self.rate)
+
+    # ------------------------------------------------------------------— API
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is due; returns the seconds slept."""
+        wait = self._update(1.0)
+        if wait > 0:
+            with self._lock:
+                self.throttled += 1
+                self.waited += wait
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no token for the next *seconds*."""
+        self._update(0.0, ceiling=-seconds * self.rate)
+
+    def tighten(self, rate: float, burst: Optional[float] = None) -> None:
+        """Lower the limits to *rate* / *burst* where those are stricter."""
+        with self._locked():
+            self.rate = min(self.rate, rate)
+            self.burst = min(self.burst, max(1.0, burst or rate))
+
+
+class SharedTokenBucket(TokenBucket):
+    """`TokenBucket` whose state is kept in *path* for every process on the host."""
+
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None):
+        if fcntl is None:
+            raise RuntimeError("shared rate limits need fcntl (POSIX)")
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        super().__init__(rate, burst)
+
+    @staticmethod
+    def _now() -> float:
+        return time.time()                  # comparable across processes
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        # the flock is per open file, so threads still need the mutex
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _load(self) -> Tuple[float, float]:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        raw = os.read(self._fd, 64).split()
+        try:
+            return float(raw[0]), float(raw[1])
+        except (IndexError, ValueError):    # new or garbled file: full bucket
+            return self.burst, self._now()
+
+    def _save(self, tokens: float, stamp: float) -> None:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.ftruncate(self._fd, 0)
+        os.write(self._fd, f"{tokens!r} {stamp!r}".encode())
+
+
+# ──────────────────────────────────────────────────────────
+# Process-wide registry
+# ──────────────────────────────────────────────────────────
+_buckets: Dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+def bucket_for(
+    host: str,
+    rate: float,
+    burst: Optional[float] = None,
+    shared_dir: Optional[str] = None,
+) -> TokenBucket:
+    """
+    The bucket of *host* in this process, created on first use.  When
+    boards configure different limits for one host the strictest wins.
+    """
+    with _registry_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            if shared_dir:
+                os.makedirs(shared_dir, exist_ok=True)
+                bucket = SharedTokenBucket(
+                    os.path.join(shared_dir, f"{host}.bucket"), rate, burst
+                )
+            else:
+                bucket = TokenBucket(rate, burst)
+            _buckets[host] = bucket
+        else:
+            bucket.tighten(rate, burst)
+        return bucket
+
+
+class RateLimiter:
+    """The per-host limits one `HttpTransport` applies to its requests."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        shared_dir: Optional[str] = None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.shared_dir = shared_dir
+        self._hosts: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlsplit(url).hostname or ""
+        bucket = self._hosts.get(host)
+        if bucket is None:
+            bucket = self._hosts[host] = bucket_for(
+                host, self.rate, self.burst, self.shared_dir
+            )
+        return bucket
+
+    def acquire(self, url: str) -> float:
+        return self.bucket(url).acquire()
+
+    def pause(self, url: str, seconds: float) -> None:
+        self.bucket(url).pause(seconds)
+
+    def stats(self) -> Dict[str, float]:
+        """``throttled`` requests and seconds ``waited`` on this limiter's hosts."""
+        buckets = self._hosts.values()
+        return {
+            "throttled": sum(b.throttled for b in buckets),
+            "waited": round(sum(b.waited for b in buckets), 1),
+        }
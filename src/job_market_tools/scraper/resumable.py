@@ -1,15 +1,22 @@
 # src/job_market_tools/scraper/resumable.py
-import math, time
-from datetime import datetime, timezone as dt_timezone
-from typing import List, Dict
+import math, os, socket, threading, time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+from functools import partial
+from typing import List, Dict, Iterable, Iterator, Tuple
 from django.utils import timezone
 
-from ..db_schema.database import(
-    Offers,
-    ScraperState,
+from ..db_schema.database import ScraperState
+from ..services.aliases import alias_stats
+from ..services.backfill_chunks import (
+    ChunkLease, chunk_counts, claim_chunk, finish_plan, plan_chunks,
 )
-from ..services.offer_ingest import create_offer
+from ..services.dedupe import SeenUids, existing_uids
+from ..services.ingest_queue import IngestQueue
+from ..services.offer_ingest import create_offers, sync_stats, unchanged_offers
 from .base import BaseScraper
+from .cache import PageCache
 
 from contextlib import nullcontext
 
@@ -28,8 +35,45 @@ class ResumablePagedScraper(BaseScraper):
       * `_total_pages() -> int`
 
     All the heavy lifting (binary search, resume, monitor) is done here.
+
+    Boards that route their listing requests through `_page_payload`
+    (implementing `_request_page`) get a per-run page cache for free.
+
+    Pass ``loader="copy"`` to write backfill pages through
+    `services.bulk_load` (staging tables + ``COPY``) instead of the ORM.
+
+    Offers are written by `ingest_writers` (default 1) background threads
+    fed through a bounded `IngestQueue`; ``ingest_writers=0`` writes inline
+    on the scraper thread.  ``normalize_workers=N`` moves name cleaning and
+    fuzzy matching into N processes (`services.normalize_pool`).
+
+    ``backfill="chunks"`` splits backfills into chunks of `chunk_pages`
+    (default 20) pages in ``backfill_chunks`` that every worker configured
+    this way – on any host – claims under a lease of `lease_seconds`
+    (default 120), see `services.backfill_chunks`.  PostgreSQL only.
+    With ``backfill_only=True`` the scraper stops once the board is back
+    in monitor mode.
     """
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._page_cache = PageCache(
+            maxsize = kwargs.get("page_cache_size", 64),
+            ttl     = kwargs.get("page_cache_ttl", 120),
+        )
+        # known UIDs of this board, warmed on the first loop() run
+        self._seen = SeenUids(kwargs.get("name", ""))
+        # adaptive monitor polling, see `_observe_arrivals`
+        self._poll_interval: float | None = None
+        self._last_tick: float | None = None
+        # DB writes, see `_write_listings`; started by loop(), closed by stop()
+        self._ingest: IngestQueue | None = None
+        self._normalize_pool = None             # optional, `normalize_workers`
+        self._state_lock = threading.Lock()     # watermark, updated by writers
+        # publish time of the oldest listing that failed to write since the
+        # last save – the watermark is kept below it, see `_mark_failed`
+        self._retry_below: datetime | None = None
+
     # ------------------------------------------------------------------— helpers
     @staticmethod
     def _aware(dt: datetime) -> datetime:
@@ -45,6 +89,10 @@ class ResumablePagedScraper(BaseScraper):
     def _total_pages(self) -> int: ...
     # ↑↑↑-----------------------------------------------------------------------
 
+    # Optional: raw response body for a listing page, see `_page_payload`
+    def _request_page(self, page: int) -> Dict:
+        raise NotImplementedError
+
     # Optional: override if detail calls are expensive
     def _need_details(self, listing: Dict) -> bool:
         """Return False if the info in the listing row alone is enough."""
@@ -52,8 +100,41 @@ class ResumablePagedScraper(BaseScraper):
     # ------------------------------------------------------------------— public API
     def loop(self) -> None:
         if not hasattr(self, "_state"):
+            from ..services.lookups import warm_lookup_cache
+            from ..services.normalizer import company_index_stats, warm_company_index
+            self._log("Cached {n} lookup rows", n=warm_lookup_cache())
+            warm_company_index()
+            self._log("Company index: {names} names ({kib} KiB in memory)",
+                      **company_index_stats())
             self._state = self._load_state()
+            n = self._seen.warm()
+            self._log("Loaded {n} known UIDs ({kb} KiB in memory)",
+                      n=n, kb=self._seen.memory_bytes() // 1024)
+        # (re)started here rather than with the state – `stop()` closes both,
+        # and a stopped scraper may be looped again
+        if self._normalize_pool is None and self.config.get("normalize_workers"):
+            from ..services.normalize_pool import NormalizePool
+            self._normalize_pool = NormalizePool(self.config["normalize_workers"])
+            self._log("Normalizing names in {n} worker processes",
+                      n=self._normalize_pool.workers)
+        writers = self.config.get("ingest_writers", 1)
+        if self._ingest is None and writers > 0:
+            self._ingest = IngestQueue(
+                writer     = self._write_payloads,
+                workers    = writers,
+                maxsize    = self.config.get("ingest_queue_size", 1000),
+                batch_size = self.config.get("ingest_batch_size", 100),
+                name       = self.config.get("name", "scraper"),
+            )
+
+        self._page_cache.clear()                # cache is scoped to one run
+        with self._state_lock:                  # earlier failures already hold
+            self._retry_below = None            # the watermark back; retry them
 
+        if self._state.mode != "backfill" and self.config.get("backfill_only"):
+            self._log("Nothing to backfill – stopping")
+            self._stop_event.set()
+            return
         if self._state.mode == "backfill":
             self._run_backfill()
         else:
@@ -82,14 +163,25 @@ class ResumablePagedScraper(BaseScraper):
         published_at: datetime,
         mode: str | None = None,
     ):
-        self._state.last_uid     = newest_uid
-        self._state.last_seen_at = published_at
-        if mode:
-            self._state.mode = mode
-        self._state.updated_at = timezone.now()
-        self._state.save(
-            update_fields=["last_uid", "last_seen_at", "mode", "updated_at"]
-        )
+        self._flush_ingest()    # never persist a watermark ahead of the DB
+        with self._state_lock:
+            self._state.last_uid     = newest_uid
+            self._state.last_seen_at = published_at
+            self._hold_watermark()
+            if mode:
+                self._state.mode = mode
+            self._state.updated_at = timezone.now()
+            self._state.save(
+                update_fields=["last_uid", "last_seen_at", "mode", "updated_at"]
+            )
+            # the saved watermark now sends the next run back to the failures
+            self._retry_below = None
+
+    def _hold_watermark(self):
+        """Keep the in-memory watermark below `_retry_below`; needs the lock."""
+        if self._retry_below is not None and self._state.last_seen_at >= self._retry_below:
+            self._state.last_uid     = ""
+            self._state.last_seen_at = self._retry_below - timedelta(microseconds=1)
 
     def _job_board_obj(self):
         from ..services.lookups import job_board
@@ -97,8 +189,8 @@ class ResumablePagedScraper(BaseScraper):
 
     # ------------------------------------------------------------------— main loops
     # 1) Initial/Resume – binary search to the first page containing duplicates
-    def _run_backfill(self):
-        self._log("Backfill started – finding oldest unseen offers")
+    def _first_dup_page(self) -> Tuple[int, int]:
+        """``(first page holding known offers, total pages)``; total + 1 if none."""
         last_page = self._total_pages()
         self._log("Board reports {p} total pages", p=last_page)
         lo, hi = 1, last_page
@@ -109,18 +201,29 @@ class ResumablePagedScraper(BaseScraper):
             mid = (lo + hi) // 2
             self._log("Binary-search probe page {p}", p=mid)
             lst = self.fetch_offers_page(mid)
+            self._mark_progress()
             if self._page_has_duplicates(lst):
                 first_dup_page = mid
                 hi = mid - 1
             else:
                 lo = mid + 1
+        return first_dup_page, last_page
+
+    def _run_backfill(self):
+        if self.config.get("backfill") == "chunks":
+            return self._run_chunked_backfill()
+        self._log("Backfill started – finding oldest unseen offers")
+        first_dup_page, _ = self._first_dup_page()
 
         pages_to_ingest = range(first_dup_page - 1, 0, -1)   # newest → oldest
+        # network runs `prefetch_pages` ahead of the DB writer (this thread)
+        bundles = self._prefetched_pages(pages_to_ingest)
 
         # pick iterator: tqdm progress bar if available & verbose, else plain range
         iterator = (
             tqdm(
-                pages_to_ingest,
+                bundles,
+                total      = len(pages_to_ingest),
                 unit       = "page",
                 desc       = f"{self.config.get('name','scraper')} backfill",
                 colour     = "cyan",              # ignored in non-TTY
@@ -128,73 +231,436 @@ class ResumablePagedScraper(BaseScraper):
                 leave      = False,               # clear when done
             )
             if self.verbose and tqdm
-            else pages_to_ingest
+            else bundles
         )
 
         # tqdm is a context manager → close() is automatic
         with (iterator if tqdm and self.verbose else nullcontext(iterator)) as it:
-            for page in it:
-                self._ingest_page(page)
+            for page, bundle in it:
+                if self._stop_event.is_set():
+                    bundles.close()                 # cancel pending prefetches
+                    self._log("Stop requested – backfill paused before page {p}",
+                              p=page)
+                    return
+                self._write_page_bundle(page, bundle)
+
+        self._log("Page cache: {h} hits / {m} requests",
+                  h=self._page_cache.hits, m=self._page_cache.misses)
+        self._log_ingest_stats()
 
-        # we are caught up – flip to monitor mode
-        self._save_state(self._state.last_uid, self._state.last_seen_at, mode="monitor")
+        # we are caught up – flip to monitor mode.  Everything down to the
+        # first known page has been read, so the watermark may move up to
+        # today's newest listing even when it was held back below an offer
+        # the search could not find again (else monitor ⇄ backfill forever);
+        # failures of this run still hold it back in `_save_state`.
+        newest_uid, newest_published = self._state.last_uid, self._state.last_seen_at
+        top = self.fetch_offers_page(1)
+        if top and self._listing_published_at(top[0]) > newest_published:
+            newest_uid = self._listing_uid(top[0])
+            newest_published = self._listing_published_at(top[0])
+        self._save_state(newest_uid, newest_published, mode="monitor")
         self._log("Backfill complete – switching to monitor mode")
 
-    # 2) Regular watch – only page 1 every loop
+    # 1b) Distributed – the same pages as chunks of a `backfill_chunks` plan
+    def _run_chunked_backfill(self):
+        """
+        Claim and read chunks of the board's backfill plan (making the plan
+        if there is none yet) until none is left to claim.  The last worker
+        to finish flips the board to monitor mode; the others come back on
+        their next tick until it has.
+        """
+        board = self.config["name"]
+        worker = self.config.get("worker_id") or f"{socket.gethostname()}:{os.getpid()}:{board}"
+        left = plan_chunks(board, self._plan_backfill, self.config.get("chunk_pages", 20))
+        if left is None:
+            self._log("Backfill finished by another worker – switching to monitor mode")
+            self._state = self._load_state()
+            return
+        self._log("Distributed backfill as {w} – {n} chunks left", w=worker, n=left)
+
+        while not self._stop_event.is_set():
+            lease = claim_chunk(board, worker, self.config.get("lease_seconds", 120))
+            if lease is None:
+                break
+            with lease:
+                if not self._read_chunk(lease):
+                    return
+        if self._stop_event.is_set():
+            return
+
+        self._log_ingest_stats()
+        if finish_plan(board):
+            self._state = self._load_state()
+            self._log("Backfill complete – switching to monitor mode")
+        else:
+            self._log("Waiting for chunks leased by other workers: {c}",
+                      c=chunk_counts(board))
+
+    def _plan_backfill(self) -> Tuple[int, int] | None:
+        """
+        `plan_chunks` callback: the pages to read and the board's page count.
+        Moves the watermark to today's newest listing first – everything
+        above it is left to the monitor, everything below to the chunks.
+        """
+        self._log("Planning distributed backfill – finding oldest unseen offers")
+        first_dup_page, total = self._first_dup_page()
+        top = self.fetch_offers_page(1)
+        if top and self._listing_published_at(top[0]) >= self._state.last_seen_at:
+            self._save_state(self._listing_uid(top[0]), self._listing_published_at(top[0]))
+        if first_dup_page <= 1:
+            return None
+        self._log("Planned pages 1–{p} of {t}", p=first_dup_page - 1, t=total)
+        return first_dup_page - 1, total
+
+    def _read_chunk(self, lease: ChunkLease) -> bool:
+        """
+        Read the pages of a leased chunk, recording progress after each.
+        False if stopped or the lease was lost midway.
+        """
+        self._page_cache.clear()            # fresh page count for the shift
+        pages = lease.pages(self._total_pages(), self.config.get("chunk_overlap", 1))
+        planned = dict(pages)
+        self._log("Chunk {a}–{b}: reading pages {p}–{q} (attempt {n})",
+                  a=lease.first_page, b=lease.last_page,
+                  p=pages[0][0] if pages else "-", q=pages[-1][0] if pages else "-",
+                  n=lease.attempts)
+        bundles = self._prefetched_pages(page for page, _ in pages)
+        try:
+            for page, bundle in bundles:
+                if self._stop_event.is_set():
+                    self._log("Stop requested – chunk released before page {p}", p=page)
+                    return False
+                self._write_page_bundle(page, bundle)
+                self._flush_ingest()        # never record progress ahead of the DB
+                if not lease.progress(planned[page] + 1):
+                    self._log("Lease on chunk {a}–{b} lost – dropping it",
+                              a=lease.first_page, b=lease.last_page)
+                    return False
+        finally:
+            bundles.close()                 # cancel pending prefetches
+        lease.finish()
+        return True
+
+    # 2) Regular watch – walk from page 1 down to the watermark every loop
     def _run_monitor(self):
-        self._log("Monitor tick – refreshing page 1")
-        lst = self.fetch_offers_page(1)
-        newest_published = self._listing_published_at(lst[0])
-        newest_uid       = self._listing_uid(lst[0])
-        self._log("Newest listing UID={u} published at {t}",
-                    u=newest_uid, t=newest_published.isoformat())
-
-        for offer in lst:
-            uid = self._listing_uid(offer)
-            if self._is_duplicate(uid):
-                self._log("Reached duplicate UID={u} – page processed", u=uid)
+        """
+        Read pages newest-first until an offer older than the `ScraperState`
+        watermark (or the known offer at it) shows up, so bursts larger than
+        one page between ticks are not lost; known offers above a watermark
+        held back by a failed write are skipped.  New offers are only ingested once it
+        has: after `monitor_max_pages` (default 10) pages without reaching
+        it nothing is written and the watermark stays put, so the backfill's
+        binary search still sees the whole gap as unread.
+        """
+        self._log("Monitor tick – reading new offers from page 1")
+        watermark = self._state.last_seen_at
+        max_pages = self.config.get("monitor_max_pages", 10)
+        newest_uid, newest_published = self._state.last_uid, watermark
+        page_size = new_count = 0
+        caught_up = False
+        fresh_pages: List[List[Dict]] = []
+
+        for page in range(1, max_pages + 1):
+            lst = self.fetch_offers_page(page)
+            self._mark_progress()
+            if not lst:
+                caught_up = True
                 break
-            self._ingest_single_listing(offer)
+            if page == 1:
+                page_size = len(lst)
+                if self._listing_published_at(lst[0]) >= watermark:  # never regress
+                    newest_published = self._listing_published_at(lst[0])
+                    newest_uid       = self._listing_uid(lst[0])
+                self._log("Newest listing UID={u} published at {t}",
+                          u=newest_uid, t=newest_published.isoformat())
+
+            known = self._existing_uids(self._listing_uid(l) for l in lst)
+            fresh = []
+            for offer in lst:
+                uid = self._listing_uid(offer)
+                published_at = self._listing_published_at(offer)
+                if published_at < watermark or (uid in known and published_at <= watermark):
+                    self._log("Reached known UID={u} on page {p}", u=uid, p=page)
+                    caught_up = True
+                    break
+                if uid in known:            # above a held-back watermark
+                    continue
+                fresh.append(offer)
+            fresh_pages.append(fresh)
+            new_count += len(fresh)
+            if caught_up:
+                break
+
+        mode = None
+        if caught_up:
+            for fresh in fresh_pages:
+                self._ingest_listings(fresh)
+        else:
+            # ingesting the top pages now would make them look known to the
+            # backfill's search, which would then skip the gap below them
+            self._log("No known offer within {n} pages – scheduling backfill",
+                      n=max_pages)
+            newest_uid, newest_published = self._state.last_uid, watermark
+            mode = "backfill"
 
         # update the watermark even if no new offers were ingested
-        self._save_state(newest_uid, newest_published)
+        self._save_state(newest_uid, newest_published, mode=mode)
+        self._observe_arrivals(new_count, page_size)
+        self._log_ingest_stats()
+
+    # ------------------------------------------------------------------— adaptive polling
+    def _observe_arrivals(self, new_count: int, page_size: int) -> None:
+        """
+        Derive the next monitor interval from the arrival rate: aim for about
+        half a page of new offers per tick, poll at `min_interval` when a
+        whole page filled up and back off ×1.5 towards `max_interval` while
+        nothing new arrives.
+        """
+        base = self.interval
+        lo = self.config.get("min_interval", base / 4)
+        hi = self.config.get("max_interval", base * 8)
+        now = time.monotonic()
+        elapsed = now - self._last_tick if self._last_tick else None
+        self._last_tick = now
+        current = self._poll_interval or base
+
+        if page_size and new_count >= page_size:
+            target = lo
+        elif new_count == 0:
+            target = current * 1.5
+        elif elapsed:
+            rate = new_count / elapsed                  # offers per second
+            target = 0.5 * current + 0.5 * (page_size / 2) / rate
+        else:
+            target = current
+        self._poll_interval = min(max(target, lo), hi)
+        self._log("{n} new offers – next poll in {s:.0f}s",
+                  n=new_count, s=self._poll_interval)
+
+    def _next_interval(self, interval: float) -> float:
+        state = getattr(self, "_state", None)
+        if not state or state.mode != "monitor":
+            self._poll_interval, self._last_tick = None, None
+            return interval
+        return self._poll_interval or interval
+
+    # ------------------------------------------------------------------— page cache
+    def _page_payload(self, page: int) -> Dict:
+        """
+        Raw listing response for *page*, shared within the current run by the
+        binary-search probes, `_total_pages` and ingestion.
+        """
+        params = tuple(sorted((k, str(v)) for k, v in self.config.get("params", {}).items()))
+        return self._page_cache.get_or_load(
+            (page, params), lambda: self._request_page(page)
+        )
 
     # ------------------------------------------------------------------— ingestion helpers
     def _page_has_duplicates(self, listings: List[Dict]) -> bool:
-        return any(self._is_duplicate(self._listing_uid(l)) for l in listings)
+        """
+        Binary-search probe.  Asks the DB directly – one ``IN`` query – since
+        a filter miss is stale for rows other processes wrote after `warm()`,
+        and a wrong "no" here would send the backfill down the whole board.
+        """
+        known = existing_uids(self.config["name"], (self._listing_uid(l) for l in listings))
+        for uid in known:
+            self._seen.add(uid)
+        return bool(known)
 
-    def _is_duplicate(self, uid: str) -> bool:
-        return Offers.objects.filter(raw_json__slug=uid).exists()   # adjust when you store uid
+    def _existing_uids(self, uids: Iterable[str]) -> set[str]:
+        """
+        Already-ingested subset of *uids*.  The in-memory filter answers
+        misses; the DB is only asked to confirm its (rare) positive hits.
+        """
+        return existing_uids(self.config["name"], uids, seen=self._seen)
+
+    def _ingest_listings(self, listings: List[Dict]):
+        """
+        Fetch details for all *listings* as one concurrent batch, then ingest
+        them in their original order.  A failed detail fetch skips that
+        offer and holds the watermark below it (`_mark_failed`), so the next
+        monitor run reads it again.  Backfills only log it: their binary
+        search cannot find a single missing offer among known ones, and a
+        chunked backfill's workers don't own the watermark.
+        """
+        self._write_listings(zip(listings, self._fetch_details(listings)))
+
+    def _fetch_details(self, listings: List[Dict]) -> List[Dict | Exception]:
+        """Details (or the listing itself, or the fetch error) per listing."""
+        need = [l for l in listings if self._need_details(l)]
+        fetched = self.fetch_offer_details(
+            [self._listing_uid(l) for l in need], return_exceptions=True
+        )
+        details = {self._listing_uid(l): d for l, d in zip(need, fetched)}
+        return [details.get(self._listing_uid(l), l) for l in listings]
+
+    # ------------------------------------------------------------------— backfill pipeline
+    def _fetch_page_bundle(self, page: int) -> List[Tuple[Dict, Dict | Exception]]:
+        """
+        Network half of a backfill page: the listings plus their details.
+        Runs on prefetch workers, so it must not touch the database – the
+        duplicate filter is applied by the writer in `_write_page_bundle`.
+        """
+        listings = self.fetch_offers_page(page)
+        return list(zip(listings, self._fetch_details(listings)))
 
-    def _ingest_page(self, page: int):
-        for listing in self.fetch_offers_page(page):
+    def _write_page_bundle(self, page: int, bundle: List[Tuple[Dict, Dict | Exception]]):
+        known = self._existing_uids(self._listing_uid(l) for l, _ in bundle)
+        fresh = []
+        for listing, det in bundle:
             uid = self._listing_uid(listing)
-            if self._is_duplicate(uid):
+            if uid in known:
                 self._log("Skip duplicate UID={u} on page {p}", u=uid, p=page)
                 continue
-            self._ingest_single_listing(listing)
+            fresh.append((listing, det))
+        self._write_listings(fresh)
+        self._mark_progress()
 
-    def _ingest_single_listing(self, listing: Dict):
+    def _prefetched_pages(self, pages: Iterable[int]) -> Iterator[Tuple[int, List]]:
+        """
+        Yield ``(page, bundle)`` in order while up to `prefetch_pages`
+        (default 2) upcoming pages are fetched in the background.  A page is
+        only scheduled once an earlier one has been handed to the consumer,
+        so at most `prefetch_pages + 1` pages are held in memory.
+        """
+        depth = self.config.get("prefetch_pages", 2)
+        pages = iter(pages)
+        if depth <= 0:
+            for page in pages:
+                yield page, self._fetch_page_bundle(page)
+            return
+
+        pool = ThreadPoolExecutor(
+            max_workers=depth,
+            thread_name_prefix=f"{self.config.get('name', 'scraper')}-prefetch",
+        )
+        window: deque = deque()
+        try:
+            for page in pages:
+                window.append((page, pool.submit(self._fetch_page_bundle, page)))
+                if len(window) >= depth:
+                    break
+            while window:
+                page, fut = window.popleft()
+                bundle = fut.result()
+                nxt = next(pages, None)
+                if nxt is not None:
+                    window.append((nxt, pool.submit(self._fetch_page_bundle, nxt)))
+                yield page, bundle
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    # ------------------------------------------------------------------— writer
+    def _flush_ingest(self):
+        """Wait until the writers have committed everything queued so far."""
+        if self._ingest:
+            self._ingest.join()
+
+    def _log_ingest_stats(self):
+        """Write counters accumulated since the last call, one line each."""
+        self._flush_ingest()
+        if self._ingest:
+            self._log("Ingest queue: {written} written, {failed} failed in "
+                      "{batches} batches (avg {avg_batch}), depth {depth} "
+                      "(max {max_depth}), write {avg_write_ms} ms avg / "
+                      "{max_write_ms} ms max", **self._ingest.stats(reset=True))
+        aliases = alias_stats(reset=True)
+        if aliases["misses"] or aliases["lru_hits"] or aliases["db_hits"]:
+            self._log("Name aliases: {r:.0%} hit rate ({l} cached, {d} from table, "
+                      "{m} fuzzy-matched)", r=aliases["hit_rate"],
+                      l=aliases["lru_hits"], d=aliases["db_hits"], m=aliases["misses"])
+        skipped = unchanged_offers(reset=True)
+        if skipped:
+            self._log("Skipped {n} unchanged offers by fingerprint", n=skipped)
+        changed = {
+            table: f"+{st['inserted']}/-{st['deleted']} (kept {st['kept']})"
+            for table, st in sync_stats(reset=True).items()
+        }
+        if changed:
+            self._log("Child rows: {c}", c=", ".join(f"{t} {v}" for t, v in changed.items()))
+
+    def _write_listings(self, pairs: Iterable[Tuple[Dict, Dict | Exception]]):
+        ready = []
+        for listing, det in pairs:
+            uid = self._listing_uid(listing)
+            if isinstance(det, Exception):
+                self._log("Detail fetch failed for UID={u}: {err!r} – skipped",
+                          u=uid, err=det)
+                self._mark_failed(listing)
+                continue
+            self._log("Ingesting UID={u}", u=uid)
+            ready.append((listing, det))
+        if not ready:
+            return
+
+        # --------------------- queue for the writers (blocks while full) …
+        if self._ingest:
+            for listing, det in ready:
+                self._ingest.put(
+                    self._make_offer_payload(det),
+                    on_done=partial(self._mark_ingested, listing),
+                    on_fail=partial(self._mark_failed, listing),
+                )
+            return
+
+        # --------------------- … or write inline, one batch per page
+        try:
+            self._write_payloads([self._make_offer_payload(det) for _, det in ready])
+        except Exception:
+            for listing, _ in ready:
+                self._mark_failed(listing)
+            raise
+        for listing, _ in ready:
+            self._mark_ingested(listing)
+
+    def _write_payloads(self, payloads: List[Dict]):
+        if self._normalize_pool:        # fuzzy matching off the GIL, as aliases
+            self._normalize_pool.prenormalize(payloads)
+        if self._state.mode == "backfill" and self.config.get("loader") == "copy":
+            from ..services.bulk_load import bulk_load_offers     # PostgreSQL only
+            bulk_load_offers(payloads)
+        else:
+            create_offers(payloads)
+
+    def _mark_ingested(self, listing: Dict):
+        """Record a *written* listing – runs on a writer thread when queued."""
         uid = self._listing_uid(listing)
-        self._log("Ingesting UID={u}", u=uid)
         published_at = self._listing_published_at(listing)
-        details = listing
-        if self._need_details(listing):
-            details = self.fetch_offer_details([uid])[0]
-
-        # --------------------- send to ingest service
-        create_offer(self._make_offer_payload(details))
+        self._seen.add(uid)
 
         # update in-memory watermark so _save_state has newest values
-        if published_at > self._state.last_seen_at:
-            self._state.last_uid     = uid
-            self._state.last_seen_at = published_at
+        with self._state_lock:
+            if published_at > self._state.last_seen_at:
+                self._state.last_uid     = uid
+                self._state.last_seen_at = published_at
+                self._hold_watermark()
+
+    def _mark_failed(self, listing: Dict):
+        """
+        Record a listing that did *not* reach the DB.  Until the next save the
+        watermark stays just below it – neither newer writes nor the monitor's
+        page-1 watermark can move past it – so the next run reads it again.
+        """
+        published_at = self._listing_published_at(listing)
+        with self._state_lock:
+            if self._retry_below is None or published_at < self._retry_below:
+                self._retry_below = published_at
+            self._hold_watermark()
+
+    def stop(self):
+        super().stop()
+        if self._ingest:                # flush what the scraper already queued
+            self._ingest.close()
+            self._ingest = None
+        if self._normalize_pool:
+            self._normalize_pool.close()
+            self._normalize_pool = None
 
     # BOARD IMPLEMENTATION MUST OVERRIDE ↓↓↓
     def _make_offer_payload(self, details: Dict) -> Dict:
         """
         Convert the data returned by the board into the dict expected by
-        `services.offer_ingest.create_offer`.  Board-specific, so not supplied
+        `services.offer_ingest.create_offers`.  Board-specific, so not supplied
         here.
         """
         ...
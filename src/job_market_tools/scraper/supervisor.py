@@ -0,0 +1,159 @@
+# src/job_market_tools/scraper/supervisor.py
+"""
+Keeps the scrapers of a `ScraperManager` running until asked to stop.
+
+The supervisor thread sleeps on a single `threading.Event` – it is woken
+only by a scraper thread exiting, a due restart or `stop()` (called from
+the SIGINT / SIGTERM handlers `run()` installs) – so it costs no CPU while
+the scrapers work.
+
+A scraper whose thread dies without `stop()` having been called is started
+again after an exponential backoff; a scraper that stayed up for
+``reset_after`` seconds before crashing starts over at the base delay.
+On stop every scraper is drained concurrently (`ScraperManager.stop_all`).
+"""
+import signal
+import threading
+import time
+from typing import Dict, Optional
+
+from .base import BaseScraper
+from .manager import ScraperManager
+
+
+class ScraperSupervisor:
+    """
+    * ``backoff``     – seconds before the first restart of a crashed scraper
+    * ``max_backoff`` – upper bound of the doubling delay
+    * ``reset_after`` – uptime after which a crash counts as the first again
+    """
+
+    def __init__(
+        self,
+        manager: ScraperManager,
+        backoff: float = 5.0,
+        max_backoff: float = 300.0,
+        reset_after: float = 600.0,
+        verbose: bool = True,
+    ):
+        self.manager = manager
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.reset_after = reset_after
+        self.verbose = verbose
+        self._intervals: Dict[str, float] = {}
+        self._started_at: Dict[str, float] = {}
+        self._crashes: Dict[str, int] = {}
+        self._restarts: Dict[str, int] = {}
+        self._due: Dict[str, float] = {}            # name → monotonic restart time
+        self._exited: list[str] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+    # ------------------------------------------------------------------— helpers
+    def _log(self, msg: str, *args, **kwargs) -> None:
+        if self.verbose:
+            print("[supervisor] " + msg.format(*args, **kwargs))
+
+    def _on_exit(self, scraper: BaseScraper) -> None:
+        """Runs on the exiting scraper thread; hands over to `run()`."""
+        if scraper.stopping():
+            return
+        with self._lock:
+            self._exited.append(scraper.config.get("name"))
+        self._wake.set()
+
+    def _start(self, name: str) -> None:
+        self._started_at[name] = time.monotonic()
+        self.manager.start(name, self._intervals[name], on_exit=self._on_exit)
+
+    # ------------------------------------------------------------------— API
+    def add(self, name: str, interval: float) -> None:
+        """Supervise the registered scraper *name*, polling every *interval* s."""
+        if name not in self.manager.list_scrapers():
+            raise ValueError(f"Scraper '{name}' not registered")
+        self._intervals[name] = interval
+
+    def run(self) -> None:
+        """
+        Start every added scraper and supervise them until `stop()` – or
+        SIGINT / SIGTERM when called from the main thread.  Returns after
+        all scrapers have drained.
+        """
+        restore = {}
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                restore[sig] = signal.signal(sig, self._on_signal)
+        try:
+            for name in self._intervals:
+                self._start(name)
+            while not self._stop.is_set():
+                self._wake.wait(self._next_timeout())
+                self._wake.clear()
+                self._handle_exits()
+                self._restart_due()
+        finally:
+            self._log("Draining {n} scraper(s)…", n=len(self._intervals))
+            self.manager.stop_all()
+            for sig, handler in restore.items():
+                signal.signal(sig, handler)
+
+    def stop(self) -> None:
+        """Ask `run()` to stop all scrapers and return."""
+        self._stop.set()
+        self._wake.set()
+
+    def status(self) -> Dict[str, dict]:
+        """Per scraper: ``state``, ``restarts`` and seconds to a pending restart."""
+        now = time.monotonic()
+        with self._lock:
+            due = dict(self._due)
+        return {
+            name: {
+                "state": self.manager.status(name),
+                "restarts": self._restarts.get(name, 0),
+                "restart_in": round(max(0.0, due[name] - now), 1) if name in due else None,
+            }
+            for name in self._intervals
+        }
+
+    # ------------------------------------------------------------------— supervision
+    def _on_signal(self, signum, frame) -> None:
+        self._log("{sig} received – stopping (repeat to force)",
+                  sig=signal.Signals(signum).name)
+        signal.signal(signum, signal.SIG_DFL)
+        self.stop()
+
+    def _next_timeout(self) -> Optional[float]:
+        """Seconds until the next pending restart; None = wait for an event."""
+        with self._lock:
+            if not self._due:
+                return None
+            return max(0.0, min(self._due.values()) - time.monotonic())
+
+    def _handle_exits(self) -> None:
+        with self._lock:
+            exited, self._exited = self._exited, []
+        now = time.monotonic()
+        for name in exited:
+            if now - self._started_at.get(name, now) >= self.reset_after:
+                self._crashes[name] = 0
+            self._crashes[name] = self._crashes.get(name, 0) + 1
+            delay = min(self.max_backoff, self.backoff * 2 ** (self._crashes[name] - 1))
+            with self._lock:
+                self._due[name] = now + delay
+            self._log("{name} crashed – restart in {d:.1f}s", name=name, d=delay)
+
+    def _restart_due(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            due = [name for name, at in self._due.items() if at <= now]
+            for name in due:
+                del self._due[name]
+        for name in due:
+            if self._stop.is_set():
+                return
+            self._restarts[name] = self._restarts.get(name, 0) + 1
+            self._log("Restarting {name}", name=name)
+            self._start(name)
@@ -0,0 +1,133 @@
+# src/job_market_tools/scraper/transport.py
+"""
+Pooled keep-alive HTTP transport shared by every board.
+
+One ``requests.Session`` per scraper instance, so TCP/TLS connections to
+the board API are reused across listing and detail calls instead of being
+re-established for every request.  Transient failures (429 / 5xx) are
+retried by urllib3 with exponential backoff, honouring ``Retry-After``.
+With ``rate_limit`` set, every request first takes a token from its host's
+bucket (see `ratelimit`).
+"""
+from __future__ import annotations
+
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .ratelimit import RateLimiter
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpTransport:
+    """
+    Thin wrapper around a ``requests.Session`` with a sized connection pool.
+
+    * ``headers``        – merged into the session once, sent with every call
+    * ``timeout``        – ``(connect, read)`` seconds, or a single float
+    * ``pool_size``      – max keep-alive connections kept per host
+    * ``max_retries``    – retry budget for 429 / 5xx / connection errors
+    * ``backoff_factor`` – sleep ``factor * 2 ** (n - 1)`` between retries
+    * ``rate_limit``     – max requests / s per host, shared process-wide
+    * ``rate_burst``     – requests a host may get back-to-back
+    * ``rate_limit_dir`` – directory sharing the buckets across processes
+    """
+
+    def __init__(
+        self,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | tuple[float, float] = (5, 30),
+        pool_size: int = 10,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        rate_limit: float | None = None,
+        rate_burst: float | None = None,
+        rate_limit_dir: str | None = None,
+    ):
+        self.timeout = timeout
+        self.limiter = (
+            RateLimiter(rate_limit, rate_burst, rate_limit_dir) if rate_limit else None
+        )
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,          # let callers raise_for_status()
+        )
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        self.session.headers.update(headers or {})
+
+    # ------------------------------------------------------------------— requests
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        if self.limiter is None:
+            return self.session.get(url, **kwargs)
+        self.limiter.acquire(url)
+        resp = self.session.get(url, **kwargs)
+        if resp.status_code == 429:
+            # still limited after the retries: hold back every caller of the host
+            pause = parse_retry_after(resp.headers.get("Retry-After"))
+            self.limiter.pause(url, pause if pause is not None else 1.0 / self.limiter.rate)
+        return resp
+
+    def get_json(self, url: str, **kwargs: Any) -> Any:
+        """GET *url*, raise on HTTP errors and return the decoded body."""
+        resp = self.get(url, **kwargs)
+        resp.raise_for_status()
+        return resp.json()
+
+    # ------------------------------------------------------------------— stats
+    def stats(self) -> dict[str, float]:
+        """
+        Connection counters summed over every host pool of the session.
+
+        ``opened`` is the number of TCP connections established, ``reused`` the
+        number of requests that went over an already-open keep-alive socket,
+        ``throttled`` / ``waited`` count the requests delayed by the rate limit
+        and the seconds they waited (process-wide for the hosts used).
+        """
+        pools = self._adapter.poolmanager.pools
+        requests_sent = opened = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:                # evicted meanwhile
+                continue
+            requests_sent += pool.num_requests
+            opened += pool.num_connections
+        return {
+            "requests": requests_sent,
+            "opened": opened,
+            "reused": max(requests_sent - opened, 0),
+            **(self.limiter.stats() if self.limiter else {"throttled": 0, "waited": 0.0}),
+        }
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,133 @@
+# src/job_market_tools/services/aliases.py
+"""
+Raw-name aliases: ``(kind, scope, cleaned raw string) → canonical row``.
+
+The normalizers record every decision of their fuzzy path in the
+``name_aliases`` table, so a raw string that has been seen once (``python
+3``, ``Acme Sp. z o.o.`` …) resolves with a primary-key lookup next time –
+or with no query at all from the in-process LRU in front of the table.
+
+*scope* narrows the key where the match depends on more than the name
+(the country for companies) and is ``""`` otherwise.  *target* is the
+canonical row's primary key as text.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from django.db import transaction
+
+from ..db_schema.database import NameAliases
+
+AliasKey = Tuple[str, str, str]             # (kind, scope, raw_clean)
+
+_LRU_SIZE = 50_000
+_lru: "OrderedDict[AliasKey, str]" = OrderedDict()
+_lock = threading.Lock()
+_stats: Dict[str, int] = {"lru_hits": 0, "db_hits": 0, "misses": 0}
+
+
+def _lru_put(key: AliasKey, target: str) -> None:
+    with _lock:
+        _lru[key] = target
+        _lru.move_to_end(key)
+        while len(_lru) > _LRU_SIZE:
+            _lru.popitem(last=False)
+
+
+def resolve_alias(kind: str, scope: str, raw_clean: str) -> str | None:
+    """Canonical target for the alias, or None if the string is new."""
+    return resolve_aliases(kind, scope, [raw_clean]).get(raw_clean)
+
+
+def resolve_aliases(kind: str, scope: str, raw_cleans: Iterable[str]) -> Dict[str, str]:
+    """
+    Known targets for many strings of one *kind* – LRU first, the rest with
+    a single ``IN`` query.  Strings without an alias are left out.
+    """
+    scope = scope or ""
+    found: Dict[str, str] = {}
+    todo: List[str] = []
+    with _lock:
+        for raw_clean in dict.fromkeys(raw_cleans):
+            key = (kind, scope, raw_clean)
+            target = _lru.get(key)
+            if target is None:
+                todo.append(raw_clean)
+            else:
+                _lru.move_to_end(key)
+                found[raw_clean] = target
+        _stats["lru_hits"] += len(found)
+
+    if todo:
+        rows = dict(
+            NameAliases.objects.filter(kind=kind, scope=scope, raw_clean__in=todo)
+            .values_list("raw_clean", "target")
+        )
+        for raw_clean, target in rows.items():
+            _lru_put((kind, scope, raw_clean), target)
+        found.update(rows)
+        with _lock:
+            _stats["db_hits"] += len(rows)
+            _stats["misses"] += len(todo) - len(rows)
+    return found
+
+
+def remember_alias(kind: str, scope: str, raw_clean: str, target) -> None:
+    """Store the decision of a fuzzy match, see `remember_aliases`."""
+    remember_aliases(kind, scope, {raw_clean: target})
+
+
+def remember_aliases(kind: str, scope: str, targets: Mapping[str, Any]) -> None:
+    """
+    Store ``raw_clean → target`` decisions with one insert.  Runs in the
+    caller's transaction; the LRU only learns the aliases once it is
+    committed, so a rolled-back target row is never handed out.
+    """
+    scope = scope or ""
+    if not targets:
+        return
+    NameAliases.objects.bulk_create(
+        [
+            NameAliases(kind=kind, scope=scope, raw_clean=raw_clean, target=str(target))
+            for raw_clean, target in targets.items()
+        ],
+        ignore_conflicts=True,
+    )
+    entries = [((kind, scope, raw_clean), str(t)) for raw_clean, t in targets.items()]
+
+    def learn() -> None:
+        for key, target in entries:
+            _lru_put(key, target)
+
+    transaction.on_commit(learn)
+
+
+def invalidate_aliases() -> None:
+    """Forget the LRU, e.g. after canonical rows have been merged."""
+    with _lock:
+        _lru.clear()
+
+
+def forget_aliases(kinds: Iterable[str]) -> int:
+    """
+    Delete every stored alias of *kinds* (and the LRU), e.g. when the
+    cleaning rules changed and the old decisions no longer apply.
+    """
+    deleted, _ = NameAliases.objects.filter(kind__in=list(kinds)).delete()
+    invalidate_aliases()
+    return deleted
+
+
+def alias_stats(reset: bool = False) -> Dict[str, float]:
+    """LRU / table hits, misses (= fuzzy matches run) and the hit rate."""
+    with _lock:
+        st: Dict[str, float] = dict(_stats)
+        if reset:
+            for k in _stats:
+                _stats[k] = 0
+    total = st["lru_hits"] + st["db_hits"] + st["misses"]
+    st["hit_rate"] = round((st["lru_hits"] + st["db_hits"]) / total, 3) if total else 0.0
+    return st
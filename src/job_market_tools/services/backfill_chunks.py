@@ -0,0 +1,258 @@
+# src/job_market_tools/services/backfill_chunks.py
+"""
+Work queue of a distributed backfill (PostgreSQL only).
+
+The page range a backfill has to read – found by the binary search of
+`ResumablePagedScraper` – is cut into chunks of ``chunk_pages`` pages and
+stored in ``backfill_chunks``.  Any number of workers (threads, processes
+or hosts sharing the database) then repeatedly
+
+* `claim_chunk` – ``SELECT … FOR UPDATE SKIP LOCKED``, so concurrent
+  claimers neither wait for nor get the same row – under a lease of
+  ``lease_seconds``;
+* read its pages while a `ChunkLease` renews the lease from a background
+  thread and records the next page to read after every page;
+* mark it done, or release it to the next worker when they fail or stop.
+
+A worker that dies simply stops renewing: once its lease has expired the
+chunk can be claimed again and resumes at the recorded page.  Lease times
+come from the database clock, so the hosts' clocks need not agree.
+
+`finish_plan` deletes the plan and flips ``scraper_state`` to ``monitor``
+once every chunk is done; both it and `plan_chunks` hold a per-board
+advisory lock while writing, so a plan is stored once and finished once.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ..db_schema.database import BackfillChunks, ScraperState
+
+PENDING, LEASED, DONE = "pending", "leased", "done"
+
+
+def _lock_board(board: str) -> None:
+    """Per-board advisory lock, held until the surrounding transaction ends."""
+    with connection.cursor() as cur:
+        cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [f"backfill_chunks:{board}"])
+
+
+# ──────────────────────────────────────────────────────────
+# Plan
+# ──────────────────────────────────────────────────────────
+_MISSING = object()
+
+
+def _find_plan(board: str):
+    """Unfinished chunks of *board*'s plan, None if finished, else `_MISSING`."""
+    if ScraperState.objects.filter(board_name=board, mode="monitor").exists():
+        return None
+    chunks = BackfillChunks.objects.filter(board_name=board)
+    if chunks.exists():
+        return chunks.exclude(status=DONE).count()
+    return _MISSING
+
+
+def plan_chunks(
+    board: str,
+    plan: Callable[[], Optional[Tuple[int, int]]],
+    chunk_pages: int = 20,
+) -> Optional[int]:
+    """
+    Make sure *board* has a backfill plan and return its unfinished chunks.
+
+    *plan* returns ``(last_page, total_pages)`` – pages ``1..last_page``
+    need reading, the board had ``total_pages`` – or None when nothing
+    does.  It probes the board over HTTP, so it runs outside any
+    transaction; the advisory lock is only taken to insert the chunks, and
+    a worker that finds another one's plan under it keeps that plan.
+    None if another worker already finished the backfill
+    (``scraper_state`` is back at ``monitor``).
+    """
+    found = _find_plan(board)
+    if found is not _MISSING:
+        return found
+    span = plan()
+
+    with transaction.atomic():
+        _lock_board(board)
+        found = _find_plan(board)
+        if found is not _MISSING:           # planned while we were probing
+            return found
+        if not span:
+            return 0
+        last_page, total = span
+        now = timezone.now()
+        BackfillChunks.objects.bulk_create(
+            BackfillChunks(
+                board_name_id=board,
+                first_page=first,
+                last_page=min(first + chunk_pages - 1, last_page),
+                planned_total=total,
+                status=PENDING,
+                attempts=0,
+                updated_at=now,
+            )
+            for first in range(1, last_page + 1, chunk_pages)
+        )
+    return -(-last_page // chunk_pages)
+
+
+@transaction.atomic
+def finish_plan(board: str) -> bool:
+    """
+    If every chunk of *board* is done, drop the plan and switch the board
+    to ``monitor``.  False while chunks are still pending or leased.
+    """
+    _lock_board(board)
+    chunks = BackfillChunks.objects.filter(board_name=board)
+    if chunks.exclude(status=DONE).exists():
+        return False
+    chunks.delete()
+    ScraperState.objects.filter(board_name=board).update(
+        mode="monitor", updated_at=timezone.now()
+    )
+    return True
+
+
+def chunk_counts(board: str) -> Dict[str, int]:
+    """Chunks of *board* per status (``pending`` / ``leased`` / ``done``)."""
+    counts = dict.fromkeys((PENDING, LEASED, DONE), 0)
+    rows = BackfillChunks.objects.filter(board_name=board).values_list("status")
+    for (status,) in rows:
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+# ──────────────────────────────────────────────────────────
+# Leases
+# ──────────────────────────────────────────────────────────
+def claim_chunk(board: str, worker: str, lease_seconds: float = 120) -> Optional["ChunkLease"]:
+    """
+    Lease the oldest claimable chunk of *board* to *worker* – pending, or
+    leased by a worker whose lease has run out.  None when there is none.
+    """
+    with connection.cursor() as cur:
+        cur.execute(
+            """UPDATE backfill_chunks c
+                  SET status = 'leased', leased_by = %s,
+                      lease_expires = now() + make_interval(secs => %s),
+                      attempts = c.attempts + 1, updated_at = now()
+                WHERE c.id = (
+                      SELECT id FROM backfill_chunks
+                       WHERE board_name = %s
+                         AND (status = 'pending'
+                              OR (status = 'leased' AND lease_expires < now()))
+                       ORDER BY last_page DESC
+                       LIMIT 1
+                         FOR UPDATE SKIP LOCKED)
+            RETURNING id, first_page, last_page, planned_total, next_page, attempts""",
+            [worker, lease_seconds, board],
+        )
+        row = cur.fetchone()
+    return ChunkLease(worker, lease_seconds, *row) if row else None
+
+
+class ChunkLease:
+    """
+    One claimed chunk.  Used as a context manager it renews the lease every
+    ``lease_seconds / 3`` from a daemon thread and, unless `finish()` was
+    called, releases the chunk on exit – also when an exception escapes.
+
+    Page numbers are stored as planned.  A newest-first listing grows at
+    the top, so by the time the chunk is read its offers have moved down by
+    the pages added since; `pages` shifts the range by that amount, reads
+    ``overlap`` extra pages at both ends for offers that moved by less than
+    whole pages, and goes newest first, so offers pushed down while the
+    chunk is being read land on pages still to come.
+    """
+
+    def __init__(
+        self,
+        worker: str,
+        lease_seconds: float,
+        id: int,
+        first_page: int,
+        last_page: int,
+        planned_total: int,
+        next_page: Optional[int],
+        attempts: int,
+    ):
+        self.worker = worker
+        self.lease_seconds = lease_seconds
+        self.id = id
+        self.first_page = first_page
+        self.last_page = last_page
+        self.planned_total = planned_total
+        self.next_page = next_page
+        self.attempts = attempts
+        self.lost = False                # another worker took the chunk over
+        self._finished = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _update(self, sql: str, params: List = ()) -> bool:
+        """Run ``UPDATE … SET <sql>`` on the chunk if this worker still holds it."""
+        with connection.cursor() as cur:
+            cur.execute(
+                f"UPDATE backfill_chunks SET {sql}, updated_at = now() "
+                "WHERE id = %s AND leased_by = %s AND status = 'leased'",
+                [*params, self.id, self.worker],
+            )
+            held = cur.rowcount == 1
+        if not held:
+            self.lost = True
+        return held
+
+    # ------------------------------------------------------------------— pages
+    def pages(self, total_pages: int, overlap: int = 1) -> List[Tuple[int, int]]:
+        """``(page to read, planned page)`` pairs, newest first."""
+        shift = max(0, total_pages - self.planned_total)
+        resume = self.next_page if self.next_page is not None else self.first_page
+        start = max(1, resume - overlap)
+        end = min(self.last_page + overlap, self.planned_total)
+        return [(p + shift, p) for p in range(start, end + 1)]
+
+    def progress(self, planned_page: int) -> bool:
+        """Record that the chunk continues at *planned_page*; False if lost."""
+        self.next_page = planned_page
+        return self._update("next_page = %s", [planned_page])
+
+    def finish(self) -> bool:
+        self._finished = True
+        return self._update(
+            "status = 'done', next_page = NULL, leased_by = NULL, lease_expires = NULL"
+        )
+
+    def release(self) -> bool:
+        """Hand the chunk back; it resumes at the recorded page."""
+        return self._update("status = 'pending', leased_by = NULL, lease_expires = NULL")
+
+    # ------------------------------------------------------------------— heartbeat
+    def _renew(self) -> None:
+        try:
+            while not self._stop.wait(self.lease_seconds / 3):
+                if not self._update(
+                    "lease_expires = now() + make_interval(secs => %s)",
+                    [self.lease_seconds],
+                ):
+                    return
+        finally:
+            connection.close()           # the thread's own connection
+
+    def __enter__(self) -> "ChunkLease":
+        self._thread = threading.Thread(
+            target=self._renew, name=f"lease-{self.id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        if not self._finished and not self.lost:
+            self.release()
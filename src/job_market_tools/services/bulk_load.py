@@ -0,0 +1,308 @@
+# src/job_market_tools/services/bulk_load.py
+"""
+COPY-based bulk loader for large backfills (PostgreSQL only).
+
+``bulk_load_offers`` takes the same payloads as
+``offer_ingest.create_offers`` and produces the same rows, but instead of
+ORM inserts it
+
+1. normalizes companies, skills and categories in Python (fuzzy matching
+   can't be done in SQL) – once per distinct raw value, skills and
+   categories as one batch each – and resolves locations by `place_key`,
+2. streams every offer and child row into ``TEMP`` staging tables with
+   ``COPY … FROM STDIN`` (psycopg2 ``copy_expert``),
+3. merges them with a handful of set-based statements: missing lookup rows
+   are inserted and foreign keys resolved in the database, offers are
+   upserted on ``(job_board_name, external_uid)`` and the child tables of
+   every *changed* offer are rewritten.
+
+Offers whose ``content_hash`` is unchanged are dropped before step 1.
+Payloads without an ``external_uid`` go through ``create_offer``.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from django.db import connection, transaction
+
+from .locations import place_key, resolve_locations
+from .normalizer import normalize_categories, normalize_company, normalize_skills
+from .offer_ingest import content_fingerprint, create_offer, find_unchanged
+
+logger = logging.getLogger(__name__)
+
+# ──────────────────────────────────────────────────────────
+# Staging tables – (column, type) in COPY order
+# ──────────────────────────────────────────────────────────
+_STAGES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "stage_offers": (
+        ("board", "varchar"), ("uid", "varchar"), ("company_id", "integer"),
+        ("title", "varchar"), ("description", "text"), ("apply_url", "varchar"),
+        ("experience_level", "varchar"), ("workplace_type", "varchar"),
+        ("working_time", "varchar"), ("publish_date", "timestamptz"),
+        ("expire_date", "timestamptz"), ("raw_json", "jsonb"),
+        ("content_hash", "char(64)"),
+    ),
+    "stage_categories": (
+        ("board", "varchar"), ("uid", "varchar"), ("ord", "integer"),
+        ("category_name", "varchar"),
+    ),
+    "stage_skills": (
+        ("board", "varchar"), ("uid", "varchar"), ("ord", "integer"),
+        ("skill_name", "varchar"), ("skill_level", "integer"),
+    ),
+    "stage_optional_skills": (
+        ("board", "varchar"), ("uid", "varchar"), ("ord", "integer"),
+        ("skill_name", "varchar"), ("skill_level", "integer"),
+    ),
+    "stage_languages": (
+        ("board", "varchar"), ("uid", "varchar"), ("ord", "integer"),
+        ("language_code", "varchar"), ("language_level", "varchar"),
+    ),
+    "stage_locations": (
+        ("board", "varchar"), ("uid", "varchar"), ("location_id", "integer"),
+    ),
+    "stage_salaries": (
+        ("board", "varchar"), ("uid", "varchar"), ("ord", "integer"),
+        ("currency", "varchar"), ("salary_min", "integer"),
+        ("salary_max", "integer"), ("is_gross", "boolean"),
+        ("unit", "varchar"), ("type", "varchar"),
+    ),
+}
+
+_NULL = r"\N"
+
+
+# ──────────────────────────────────────────────────────────
+# Public entry point
+# ──────────────────────────────────────────────────────────
+@transaction.atomic
+def bulk_load_offers(payloads: Sequence[Mapping[str, Any]]) -> int:
+    """
+    Load *payloads* via staging tables + ``COPY``; returns the number of
+    offers inserted or updated.
+    """
+    keyed: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+    for data in payloads:
+        if data.get("external_uid"):
+            keyed[(data["job_board_name"], data["external_uid"])] = data
+        else:
+            create_offer(data)
+
+    fingerprints = {k: content_fingerprint(d) for k, d in keyed.items()}
+    for k in find_unchanged(fingerprints):
+        del keyed[k]
+    if not keyed:
+        return 0
+
+    logger.debug("bulk_load_offers staging %d offers", len(keyed))
+    try:
+        rows = _stage_rows(keyed, fingerprints)
+        with connection.cursor() as cur:
+            for table, cols in _STAGES.items():
+                cur.execute(f"DROP TABLE IF EXISTS {table}")
+                cur.execute(
+                    f"CREATE TEMP TABLE {table} "
+                    f"({', '.join(f'{c} {t}' for c, t in cols)}) ON COMMIT DROP"
+                )
+                cur.copy_expert(
+                    f"COPY {table} ({', '.join(c for c, _ in cols)}) "
+                    f"FROM STDIN WITH (FORMAT csv, NULL '{_NULL}')",
+                    _csv(rows[table]),
+                )
+            for stmt in _MERGE_SQL:
+                cur.execute(stmt)
+            cur.execute("SELECT count(*) FROM stage_ids")
+            written = cur.fetchone()[0]
+    except Exception:
+        logger.exception("Error in bulk_load_offers | %d payloads", len(keyed))
+        raise
+
+    logger.debug("bulk_load_offers wrote %d offers", written)
+    return written
+
+
+# ──────────────────────────────────────────────────────────
+# Payload → staging rows
+# ──────────────────────────────────────────────────────────
+def _stage_rows(
+    keyed: Mapping[Tuple[str, str], Mapping[str, Any]],
+    fingerprints: Mapping[Tuple[str, str], str],
+) -> Dict[str, List[Tuple[Any, ...]]]:
+    """
+    Flatten payloads into staging rows.  Lookup values are transformed the
+    same way as the helpers in ``services.lookups`` so both load paths
+    write identical keys.
+    """
+    rows: Dict[str, List[Tuple[Any, ...]]] = {table: [] for table in _STAGES}
+    companies: Dict[Tuple[str, str | None], int] = {}
+    skills = normalize_skills(
+        sk["name"]
+        for d in keyed.values()
+        for sk in (*d.get("skills_required", []), *d.get("skills_optional", []))
+    )
+    categories = normalize_categories(
+        raw for d in keyed.values() for raw in d.get("categories", [])
+    )
+    places = resolve_locations(loc for d in keyed.values() for loc in d.get("locations", []))
+
+    def company_id(name: str, cc: str | None) -> int:
+        if (name, cc) not in companies:
+            companies[(name, cc)] = normalize_company(name, cc).pk
+        return companies[(name, cc)]
+
+    def skill(raw: str) -> str:
+        return skills[raw].name
+
+    def category(raw: str) -> str:
+        return categories[raw].name
+
+    for (board, uid), data in keyed.items():
+        rows["stage_offers"].append((
+            board, uid,
+            company_id(data["company_name"], data.get("company_country_code")),
+            data["title"], data.get("description", ""), data["apply_url"],
+            data["experience_level"].capitalize(),
+            data["workplace_type"].lower(),
+            data["working_time"].lower(),
+            data["publish_date"], data["expire_date"],
+            json.dumps(data.get("raw_json") or {}),
+            fingerprints[(board, uid)],
+        ))
+        for i, raw in enumerate(data.get("categories", [])):
+            rows["stage_categories"].append((board, uid, i, category(raw)))
+        for i, sk in enumerate(data.get("skills_required", [])):
+            # `lookups.skill_level` coercion: a missing level fails the
+            # offer here just as it does in `create_offers`
+            rows["stage_skills"].append((
+                board, uid, i, skill(sk["name"]), int(sk.get("level")),
+            ))
+        for i, sk in enumerate(data.get("skills_optional", [])):
+            rows["stage_optional_skills"].append((
+                board, uid, i, skill(sk["name"]), int(sk.get("level") or 1),
+            ))
+        for i, lang in enumerate(data.get("languages", [])):
+            level = lang.get("level")
+            rows["stage_languages"].append((
+                board, uid, i, lang["code"].lower(), level and level.upper(),
+            ))
+        for loc in data.get("locations", []):
+            rows["stage_locations"].append((board, uid, places[place_key(loc)].pk))
+        for i, sal in enumerate(data.get("salaries", [])):
+            rows["stage_salaries"].append((
+                board, uid, i, sal["currency"].upper(), int(sal["min"]),
+                None if sal.get("max") is None else int(sal["max"]),
+                bool(sal["is_gross"]), sal["unit"].lower(), sal["type"].lower(),
+            ))
+    return rows
+
+
+def _csv(rows: Iterable[Tuple[Any, ...]]) -> io.StringIO:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow(_NULL if v is None else v for v in row)
+    buf.seek(0)
+    return buf
+
+
+# ──────────────────────────────────────────────────────────
+# Set-based merge, executed in order
+# ──────────────────────────────────────────────────────────
+_MERGE_SQL: List[str] = [
+    # --- lookup rows the staged data references -------------------------
+    """INSERT INTO job_board_websites (name, website_url)
+       SELECT DISTINCT board, 'https://' || board FROM stage_offers
+       ON CONFLICT DO NOTHING""",
+    """INSERT INTO experience_levels (level)
+       SELECT DISTINCT experience_level FROM stage_offers ON CONFLICT DO NOTHING""",
+    """INSERT INTO workplace_types (type)
+       SELECT DISTINCT workplace_type FROM stage_offers ON CONFLICT DO NOTHING""",
+    """INSERT INTO working_times (type)
+       SELECT DISTINCT working_time FROM stage_offers ON CONFLICT DO NOTHING""",
+    """INSERT INTO skill_levels (level)
+       SELECT skill_level FROM stage_skills
+       UNION SELECT skill_level FROM stage_optional_skills
+       ON CONFLICT DO NOTHING""",
+    """INSERT INTO languages (code, name)
+       SELECT DISTINCT language_code, language_code FROM stage_languages
+       ON CONFLICT DO NOTHING""",
+    """INSERT INTO language_levels (level)
+       SELECT DISTINCT language_level FROM stage_languages
+       WHERE language_level IS NOT NULL ON CONFLICT DO NOTHING""",
+    """INSERT INTO currencies (code, symbol, name)
+       SELECT DISTINCT currency, currency, currency FROM stage_salaries
+       ON CONFLICT DO NOTHING""",
+    """INSERT INTO employment_units (unit)
+       SELECT DISTINCT unit FROM stage_salaries ON CONFLICT DO NOTHING""",
+    """INSERT INTO employment_types (type)
+       SELECT DISTINCT type FROM stage_salaries ON CONFLICT DO NOTHING""",
+    # --- offers: upsert, remember which rows actually changed ------------
+    """DROP TABLE IF EXISTS stage_ids""",
+    """CREATE TEMP TABLE stage_ids (id integer, board varchar, uid varchar)
+       ON COMMIT DROP""",
+    """WITH up AS (
+         INSERT INTO offers (job_board_name, external_uid, company_id, title,
+                             description, apply_url, experience_level,
+                             workplace_type, working_time, publish_date,
+                             expire_date, raw_json, content_hash)
+         SELECT board, uid, company_id, title, description, apply_url,
+                experience_level, workplace_type, working_time, publish_date,
+                expire_date, raw_json, content_hash
+           FROM stage_offers
+         ON CONFLICT (job_board_name, external_uid) DO UPDATE SET
+                company_id       = EXCLUDED.company_id,
+                title            = EXCLUDED.title,
+                description      = EXCLUDED.description,
+                apply_url        = EXCLUDED.apply_url,
+                experience_level = EXCLUDED.experience_level,
+                workplace_type   = EXCLUDED.workplace_type,
+                working_time     = EXCLUDED.working_time,
+                publish_date     = EXCLUDED.publish_date,
+                expire_date      = EXCLUDED.expire_date,
+                raw_json         = EXCLUDED.raw_json,
+                content_hash     = EXCLUDED.content_hash
+          WHERE offers.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+         RETURNING id, job_board_name, external_uid)
+       INSERT INTO stage_ids SELECT * FROM up""",
+    # --- child tables of changed offers: clear … ------------------------
+    *(
+        f"DELETE FROM {table} t USING stage_ids i WHERE t.offer_id = i.id"
+        for table in (
+            "offers_categories", "offers_skills", "offers_optional_skills",
+            "offers_languages", "offers_locations", "offer_salaries",
+        )
+    ),
+    # … and refill; DISTINCT ON keeps the first occurrence like create_offer
+    """INSERT INTO offers_categories (offer_id, category_name)
+       SELECT DISTINCT ON (i.id, s.category_name) i.id, s.category_name
+         FROM stage_categories s JOIN stage_ids i USING (board, uid)
+        ORDER BY i.id, s.category_name, s.ord""",
+    """INSERT INTO offers_skills (offer_id, skill_name, skill_level)
+       SELECT DISTINCT ON (i.id, s.skill_name) i.id, s.skill_name, s.skill_level
+         FROM stage_skills s JOIN stage_ids i USING (board, uid)
+        ORDER BY i.id, s.skill_name, s.ord""",
+    """INSERT INTO offers_optional_skills (offer_id, skill_name, skill_level)
+       SELECT DISTINCT ON (i.id, s.skill_name) i.id, s.skill_name, s.skill_level
+         FROM stage_optional_skills s JOIN stage_ids i USING (board, uid)
+        ORDER BY i.id, s.skill_name, s.ord""",
+    """INSERT INTO offers_languages (offer_id, language_code, language_level)
+       SELECT DISTINCT ON (i.id, s.language_code)
+              i.id, s.language_code, s.language_level
+         FROM stage_languages s JOIN stage_ids i USING (board, uid)
+        ORDER BY i.id, s.language_code, s.ord""",
+    """INSERT INTO offers_locations (offer_id, location_id)
+       SELECT DISTINCT i.id, s.location_id
+         FROM stage_locations s JOIN stage_ids i USING (board, uid)
+       ON CONFLICT DO NOTHING""",
+    """INSERT INTO offer_salaries (offer_id, currency, salary_min, salary_max,
+                                   is_gross, unit, type)
+       SELECT i.id, s.currency, s.salary_min, s.salary_max, s.is_gross,
+              s.unit, s.type
+         FROM stage_salaries s JOIN stage_ids i USING (board, uid)
+        ORDER BY i.id, s.ord""",
+]
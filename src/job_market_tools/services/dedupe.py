@@ -0,0 +1,115 @@
+# src/job_market_tools/services/dedupe.py
+"""
+Duplicate detection for scraped offers.
+
+Offers carry the board's own id in ``offers.external_uid`` (unique per
+board), so "have we seen these?" is a single indexed query per page – or
+none at all when a warmed `SeenUids` filter rules every UID out.
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from ..db_schema.database import Offers
+
+
+def existing_uids(
+    board: str, uids: Iterable[str], seen: "SeenUids | None" = None
+) -> set[str]:
+    """
+    Return the subset of *uids* already stored for job board *board*.
+
+    With a warmed *seen* filter only its positive hits are checked against
+    the database; a page of new offers costs no query at all.
+    """
+    uids = set(uids)
+    if seen is not None:
+        uids = {u for u in uids if u in seen}
+    if not uids:
+        return set()
+    return set(
+        Offers.objects.filter(job_board_name_id=board, external_uid__in=uids)
+        .values_list("external_uid", flat=True)
+    )
+
+
+# ---------------------------------------------------------------------------
+# In-process membership filter
+# ---------------------------------------------------------------------------
+class SeenUids:
+    """
+    Compact set of the external UIDs already stored for one board.
+
+    Each UID is kept as a 64-bit BLAKE2b hash in a sorted ``array('Q')``, i.e.
+    **8 bytes per UID – ~8 MB per million offers** – plus a small unsorted
+    buffer of recent additions that is merged in every `MERGE_EVERY` inserts.
+    Warming briefly needs ~40 bytes per UID while the hashes are sorted.
+
+    A miss is definitive (the UID was never stored), a hit may be a hash
+    collision, so callers confirm hits against the database – see
+    `existing_uids(..., seen=...)`.  Rows written by *other* processes after
+    `warm()` are not known here; ingest is an upsert, so the worst case is a
+    harmless re-ingest.  Where a miss decides more than that – the backfill's
+    binary search – ask the database without the filter.
+    """
+
+    MERGE_EVERY = 4096
+
+    def __init__(self, board: str):
+        self.board = board
+        self._sorted = array("Q")
+        self._recent: set[int] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(uid: str) -> int:
+        return int.from_bytes(
+            hashlib.blake2b(uid.encode(), digest_size=8).digest(), "little"
+        )
+
+    def warm(self, chunk_size: int = 10_000) -> int:
+        """(Re)load every stored UID of the board in one streaming query."""
+        qs = (
+            Offers.objects.filter(job_board_name_id=self.board)
+            .exclude(external_uid=None)
+            .values_list("external_uid", flat=True)
+        )
+        hashes = sorted(self._hash(uid) for uid in qs.iterator(chunk_size=chunk_size))
+        with self._lock:
+            self._sorted = array("Q", hashes)
+            self._recent.clear()
+        return len(hashes)
+
+    def add(self, uid: str) -> None:
+        h = self._hash(uid)
+        with self._lock:
+            if h in self._recent or self._in_sorted(h):
+                return
+            self._recent.add(h)
+            if len(self._recent) >= self.MERGE_EVERY:
+                self._sorted = array(
+                    "Q", heapq.merge(self._sorted, sorted(self._recent))
+                )
+                self._recent.clear()
+
+    def __contains__(self, uid: str) -> bool:
+        h = self._hash(uid)
+        with self._lock:
+            return h in self._recent or self._in_sorted(h)
+
+    def _in_sorted(self, h: int) -> bool:
+        i = bisect_left(self._sorted, h)
+        return i < len(self._sorted) and self._sorted[i] == h
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._recent)
+
+    def memory_bytes(self) -> int:
+        """Approximate resident size of the filter."""
+        return sys.getsizeof(self._sorted) + sys.getsizeof(self._recent)
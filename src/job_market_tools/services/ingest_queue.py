@@ -0,0 +1,229 @@
+# src/job_market_tools/services/ingest_queue.py
+"""
+Bounded ingest queue between scrapers and the database.
+
+Scraper threads `put()` offer payloads and go back to fetching; a small pool
+of writer threads drains the queue in batches and hands each batch to a
+writer function (``create_offers`` by default).  Every writer thread uses
+its own Django DB connection, closed when the thread exits.
+
+The queue is bounded: when the writers fall behind, `put()` blocks and the
+scrapers slow down to the speed of the database instead of buffering
+without limit.
+
+Failed payloads are not dropped silently: their *on_fail* callback runs
+on the writer thread, and `join()` raises `IngestFailed` for the failures
+since the previous `join()`.  Callers use the two to keep their progress
+markers (a watermark, a checkpoint) behind every payload that did not
+reach the database.
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+from django.db import InterfaceError, OperationalError, close_old_connections, connection
+
+from .offer_ingest import create_offers
+
+logger = logging.getLogger(__name__)
+
+Writer = Callable[[Sequence[Mapping[str, Any]]], Any]
+OnDone = Callable[[], None]
+
+_Item = Tuple[Mapping[str, Any], OnDone | None, OnDone | None]
+
+_STOP = object()
+
+
+class IngestFailed(Exception):
+    """
+    Payloads failed to write since the last `IngestQueue.join()`; ``errors``
+    holds their exceptions and the first one is the ``__cause__``.
+    """
+
+    def __init__(self, errors: List[BaseException]):
+        super().__init__(f"{len(errors)} payload(s) failed to write: {errors[0]!r}")
+        self.errors = errors
+
+
+class IngestQueue:
+    """
+    * ``writer``     – called with a list of payloads, from a writer thread
+    * ``workers``    – number of writer threads (= DB connections)
+    * ``maxsize``    – queued payloads before `put()` blocks
+    * ``batch_size`` – max payloads handed to one ``writer`` call
+    * ``max_wait``   – seconds a writer waits to fill a batch once it has
+      at least one payload
+    """
+
+    def __init__(
+        self,
+        writer: Writer = create_offers,
+        workers: int = 2,
+        maxsize: int = 1000,
+        batch_size: int = 100,
+        max_wait: float = 0.2,
+        name: str = "ingest",
+    ):
+        self.writer = writer
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+        self.name = name
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._errors: List[BaseException] = []     # since the last join()
+        self._stats: Dict[str, float] = dict.fromkeys(
+            ("enqueued", "written", "failed", "batches", "max_depth",
+             "write_seconds", "max_write_seconds"), 0
+        )
+        self._threads = [
+            threading.Thread(
+                target=self._worker, name=f"{name}-writer-{i}", daemon=True
+            )
+            for i in range(max(1, workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    # ------------------------------------------------------------------— producer side
+    def put(
+        self,
+        payload: Mapping[str, Any],
+        on_done: OnDone | None = None,
+        on_fail: OnDone | None = None,
+    ) -> None:
+        """
+        Enqueue *payload*, blocking while the queue is full.  On the writer
+        thread, *on_done* runs once the payload is committed and *on_fail*
+        once it has failed on its own as well – before `join()` returns.
+        """
+        self._queue.put((payload, on_done, on_fail))
+        with self._lock:
+            self._stats["enqueued"] += 1
+            self._stats["max_depth"] = max(self._stats["max_depth"], self._queue.qsize())
+
+    def join(self) -> None:
+        """
+        Block until every payload enqueued so far has been processed; raise
+        `IngestFailed` if any of them failed since the previous call.
+        """
+        self._queue.join()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise IngestFailed(errors) from errors[0]
+
+    def close(self) -> None:
+        """Drain the queue, then stop the writer threads."""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for t in self._threads:
+            t.join()
+
+    def stats(self, reset: bool = False) -> Dict[str, float]:
+        """
+        Counters since start (or the last reset): current ``depth``,
+        ``max_depth``, payloads ``written`` / ``failed``, ``batches``, the
+        average batch size and writer latency in milliseconds.
+        """
+        with self._lock:
+            st = dict(self._stats)
+            if reset:
+                for k in self._stats:
+                    self._stats[k] = 0
+        batches = st["batches"] or 1
+        return {
+            "depth":        self._queue.qsize(),
+            "max_depth":    int(st["max_depth"]),
+            "enqueued":     int(st["enqueued"]),
+            "written":      int(st["written"]),
+            "failed":       int(st["failed"]),
+            "batches":      int(st["batches"]),
+            "avg_batch":    round((st["written"] + st["failed"]) / batches, 1),
+            "avg_write_ms": round(1000 * st["write_seconds"] / batches, 1),
+            "max_write_ms": round(1000 * st["max_write_seconds"], 1),
+        }
+
+    # ------------------------------------------------------------------— writer side
+    def _worker(self) -> None:
+        try:
+            while True:
+                batch, stop = self._next_batch()
+                if batch:
+                    self._write(batch)
+                    for _ in batch:
+                        self._queue.task_done()
+                if stop:
+                    self._queue.task_done()
+                    return
+        finally:
+            connection.close()          # this thread's own DB connection
+
+    def _next_batch(self) -> Tuple[List[_Item], bool]:
+        """Block for one item, then gather more until full or `max_wait` passes."""
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _write(self, batch: List[_Item]) -> None:
+        started = time.monotonic()
+        errors: List[BaseException] = []
+        lost: List[_Item] = []
+        try:
+            self.writer([payload for payload, _, _ in batch])
+            done = batch
+        except Exception as e:
+            # one bad payload must not drop the whole batch – retry one by one
+            logger.exception("%s: batch of %d failed, retrying singly",
+                             self.name, len(batch))
+            self._reconnect_after(e)
+            done = []
+            for item in batch:
+                try:
+                    self.writer([item[0]])
+                    done.append(item)
+                except Exception as e:
+                    errors.append(e)
+                    lost.append(item)
+                    logger.exception("%s: payload failed: %s", self.name, item[0])
+                    self._reconnect_after(e)
+        failed = len(errors)
+        elapsed = time.monotonic() - started
+
+        for callbacks, kind in (((c for _, c, _ in done), "on_done"),
+                                ((c for _, _, c in lost), "on_fail")):
+            for callback in callbacks:
+                if callback is None:
+                    continue
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("%s: %s callback failed", self.name, kind)
+        with self._lock:
+            self._errors.extend(errors)
+            self._stats["written"] += len(done)
+            self._stats["failed"] += failed
+            self._stats["batches"] += 1
+            self._stats["write_seconds"] += elapsed
+            self._stats["max_write_seconds"] = max(self._stats["max_write_seconds"], elapsed)
+
+    @staticmethod
+    def _reconnect_after(exc: BaseException) -> None:
+        """Drop this thread's connection after a connection-level DB error."""
+        if isinstance(exc, (OperationalError, InterfaceError)):
+            close_old_connections()
@@ -0,0 +1,228 @@
+# src/job_market_tools/services/locations.py
+"""
+Location resolution by spatial key.
+
+Every ``locations`` row carries a ``place_key`` with a unique index:
+
+    <country>|<geohash>|<city>|<street>
+
+The coordinates are quantized to a geohash cell (precision 7, roughly
+150 m × 150 m), city and street are case- and whitespace-folded.  Offers
+that give the same place with coordinates differing in the last digits
+resolve to one row, and finding it is a unique-index lookup instead of a
+comparison of exact decimals over the whole table.
+
+`resolve_locations` handles all locations of a batch at once: keys seen
+before come from an in-process LRU, the rest cost one ``IN`` query plus one
+``INSERT … ON CONFLICT`` for places that are new.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Mapping
+
+from django.db import connection, transaction
+
+from ..db_schema.database import Locations
+from .lookups import country
+
+GEOHASH_PRECISION = 7
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+_LRU_SIZE = 100_000
+_lru: "OrderedDict[str, Locations]" = OrderedDict()
+_lock = threading.Lock()
+_stats: Dict[str, int] = {"hits": 0, "db_hits": 0, "created": 0}
+
+
+# ──────────────────────────────────────────────────────────
+# Keys
+# ──────────────────────────────────────────────────────────
+def geohash(lat: float, lon: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Standard base-32 geohash of the cell containing (*lat*, *lon*)."""
+    lat_lo, lat_hi, lon_lo, lon_hi = -90.0, 90.0, -180.0, 180.0
+    out: List[str] = []
+    bits, ch, even = 0, 0, True
+    while len(out) < precision:
+        if even:                                    # longitude bit
+            mid = (lon_lo + lon_hi) / 2
+            ch = ch << 1 | (lon >= mid)
+            lon_lo, lon_hi = (mid, lon_hi) if lon >= mid else (lon_lo, mid)
+        else:                                       # latitude bit
+            mid = (lat_lo + lat_hi) / 2
+            ch = ch << 1 | (lat >= mid)
+            lat_lo, lat_hi = (mid, lat_hi) if lat >= mid else (lat_lo, mid)
+        even = not even
+        bits += 1
+        if bits == 5:
+            out.append(_BASE32[ch])
+            bits, ch = 0, 0
+    return "".join(out)
+
+
+def _fold(text: str | None) -> str:
+    return " ".join((text or "").split()).casefold()
+
+
+def place_key(raw: Mapping[str, Any]) -> str:
+    """``place_key`` of an ingest payload location (``country_code``, ``city`` …)."""
+    return "|".join((
+        (raw.get("country_code") or "").upper(),
+        geohash(float(raw["latitude"]), float(raw["longitude"])),
+        _fold(raw["city"]),
+        _fold(raw.get("street")),
+    ))
+
+
+# ──────────────────────────────────────────────────────────
+# Resolution
+# ──────────────────────────────────────────────────────────
+def _lru_put(key: str, obj: Locations) -> None:
+    with _lock:
+        _lru[key] = obj
+        _lru.move_to_end(key)
+        while len(_lru) > _LRU_SIZE:
+            _lru.popitem(last=False)
+
+
+def resolve_locations(raws: Iterable[Mapping[str, Any]]) -> Dict[str, Locations]:
+    """
+    ``{place_key: Locations}`` for every payload location in *raws*,
+    creating missing rows.  The first location seen for a new place
+    provides the stored spelling and coordinates.
+    """
+    wanted: Dict[str, Mapping[str, Any]] = {}
+    for raw in raws:
+        wanted.setdefault(place_key(raw), raw)
+
+    found: Dict[str, Locations] = {}
+    with _lock:
+        for key in wanted:
+            obj = _lru.get(key)
+            if obj is not None:
+                _lru.move_to_end(key)
+                found[key] = obj
+        _stats["hits"] += len(found)
+    todo = [key for key in wanted if key not in found]
+    if not todo:
+        return found
+
+    stored = {obj.place_key: obj for obj in Locations.objects.filter(place_key__in=todo)}
+    found.update(stored)
+
+    new = [
+        Locations(
+            place_key=key,
+            country_code=country(wanted[key].get("country_code")),
+            city=wanted[key]["city"],
+            street=wanted[key].get("street"),
+            latitude=wanted[key]["latitude"],
+            longitude=wanted[key]["longitude"],
+        )
+        for key in todo
+        if key not in stored
+    ]
+    if new:
+        with transaction.atomic():
+            # a concurrent writer may have added the same place meanwhile;
+            # the no-op update makes RETURNING hand back its id as well
+            Locations.objects.bulk_create(
+                new,
+                update_conflicts=True,
+                unique_fields=["place_key"],
+                update_fields=["place_key"],
+            )
+        found.update((obj.place_key, obj) for obj in new)
+
+    def learn() -> None:
+        for key in todo:
+            _lru_put(key, found[key])
+
+    # rows read here may be ones the caller's transaction inserted, so both
+    # they and the new rows are only cached once it commits (at once in
+    # autocommit)
+    transaction.on_commit(learn)
+    with _lock:
+        _stats["db_hits"] += len(stored)
+        _stats["created"] += len(new)
+    return found
+
+
+def invalidate_locations() -> None:
+    """Forget the LRU, e.g. after location rows were merged."""
+    with _lock:
+        _lru.clear()
+
+
+def location_stats(reset: bool = False) -> Dict[str, int]:
+    """LRU ``hits``, rows found by ``db_hits`` and rows ``created``."""
+    with _lock:
+        st = dict(_stats, size=len(_lru))
+        if reset:
+            for k in _stats:
+                _stats[k] = 0
+    return st
+
+
+# ──────────────────────────────────────────────────────────
+# Backfill of rows created before ``place_key``
+# ──────────────────────────────────────────────────────────
+@transaction.atomic
+def backfill_place_keys(chunk_size: int = 5000) -> Dict[str, int]:
+    """
+    Key every location that has no ``place_key`` yet.  Rows that fall onto
+    the same key are merged into the one with the lowest id (or the row
+    already holding the key): ``offers_locations`` is repointed and the
+    duplicates deleted, set-based.  Returns ``{"keyed", "merged"}``.
+    """
+    from .bulk_load import _csv        # bulk_load imports this module
+
+    survivors = dict(
+        Locations.objects.filter(place_key__isnull=False).values_list("place_key", "id")
+    )
+    rows = (
+        Locations.objects.filter(place_key__isnull=True)
+        .order_by("id")
+        .values_list("id", "country_code_id", "city", "street", "latitude", "longitude")
+    )
+    mapping: List[tuple] = []                       # (id, place_key, survivor id)
+    for pk, cc, city, street, lat, lon in rows.iterator(chunk_size=chunk_size):
+        key = place_key({"country_code": cc, "city": city, "street": street,
+                         "latitude": lat, "longitude": lon})
+        mapping.append((pk, key, survivors.setdefault(key, pk)))
+    if not mapping:
+        return {"keyed": 0, "merged": 0}
+
+    with connection.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS location_keys")
+        cur.execute(
+            "CREATE TEMP TABLE location_keys "
+            "(id integer PRIMARY KEY, place_key varchar, survivor integer) ON COMMIT DROP"
+        )
+        cur.copy_expert("COPY location_keys FROM STDIN WITH (FORMAT csv)", _csv(mapping))
+        cur.execute("ANALYZE location_keys")
+        cur.execute(
+            """INSERT INTO offers_locations (offer_id, location_id)
+               SELECT ol.offer_id, k.survivor
+                 FROM offers_locations ol JOIN location_keys k ON ol.location_id = k.id
+                WHERE k.survivor <> k.id
+               ON CONFLICT DO NOTHING"""
+        )
+        cur.execute(
+            """DELETE FROM offers_locations ol USING location_keys k
+                WHERE ol.location_id = k.id AND k.survivor <> k.id"""
+        )
+        cur.execute(
+            """DELETE FROM locations l USING location_keys k
+                WHERE l.id = k.id AND k.survivor <> k.id"""
+        )
+        merged = cur.rowcount
+        cur.execute(
+            """UPDATE locations l SET place_key = k.place_key
+                 FROM location_keys k WHERE l.id = k.id AND k.survivor = k.id"""
+        )
+        keyed = cur.rowcount
+    transaction.on_commit(invalidate_locations)
+    return {"keyed": keyed, "merged": merged}
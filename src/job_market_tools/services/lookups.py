@@ -7,7 +7,8 @@ Add new helpers here any time you introduce another lookup table.
 from __future__ import annotations
 
 import importlib
-from typing import Type
+import threading
+from typing import Any, Type
 
 from django.db import transaction
 from django.db.models import Model
@@ -26,6 +27,46 @@ from ..db_schema.database import (           # adjust if you later split models
     SkillLevels
 )
 
+# ---------------------------------------------------------------------------
+# Process-wide cache
+# ---------------------------------------------------------------------------
+# Lookup rows are tiny and practically never change, so every helper below is
+# served from memory after the first hit.  Rows read or created inside a
+# transaction are only cached once it commits – the row may be one the same
+# transaction inserted – so a rollback can't leave a dangling entry.
+_cache: dict[tuple[Type[Model], Any], Model] = {}
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _remember(key: tuple[Type[Model], Any], obj: Model) -> None:
+    with _cache_lock:
+        _cache[key] = obj
+
+
+def warm_lookup_cache() -> int:
+    """Load every row of the lookup tables into the cache; returns the count."""
+    loaded = 0
+    for model, pk_field in LOOKUP_TABLES:
+        rows = {(model, getattr(obj, pk_field)): obj for obj in model.objects.all()}
+        with _cache_lock:
+            _cache.update(rows)
+        loaded += len(rows)
+    return loaded
+
+
+def invalidate_lookup_cache(model: Type[Model] | None = None) -> None:
+    """Forget cached rows of *model* (or of every lookup table)."""
+    with _cache_lock:
+        for key in [k for k in _cache if model is None or k[0] is model]:
+            del _cache[key]
+
+
+def lookup_cache_stats() -> dict[str, int]:
+    with _cache_lock:
+        return {**_stats, "size": len(_cache)}
+
+
 # ---------------------------------------------------------------------------
 # Generic helper
 # ---------------------------------------------------------------------------
@@ -33,9 +74,18 @@ def _get_or_create(model: Type[Model], pk_field: str, value: str, **defaults):
     """
     Idempotent fetch-or-insert for any “single-column PK” lookup table.
     """
+    key = (model, value)
+    with _cache_lock:
+        obj = _cache.get(key)
+        _stats["hits" if obj is not None else "misses"] += 1
+    if obj is not None:
+        return obj
+
     kwargs = {pk_field: value}
     with transaction.atomic():
         obj, _ = model.objects.get_or_create(defaults=defaults, **kwargs)  # type: ignore[arg-type]
+    # runs at once in autocommit, else when the outermost atomic commits
+    transaction.on_commit(lambda: _remember(key, obj))
     return obj
 
 
@@ -49,17 +99,21 @@ except ModuleNotFoundError:      # `pycountry` optional
     _pc = None                   # type: ignore[assignment]
 
 
-def country(code: str | None):
-    if not code:
-        return None
-    code = code.upper()
-    name = code
+def country_name(code: str) -> str:
+    """English name of an ISO alpha-2 *code*, or the code without `pycountry`."""
     if _pc:
         try:
-            name = _pc.countries.get(alpha_2=code).name  # type: ignore[attr-defined]
+            return _pc.countries.get(alpha_2=code.upper()).name  # type: ignore[attr-defined]
         except Exception:
             pass
-    return _get_or_create(Countries, "code", code, name=name)
+    return code.upper()
+
+
+def country(code: str | None):
+    if not code:
+        return None
+    code = code.upper()
+    return _get_or_create(Countries, "code", code, name=country_name(code))
 
 
 # Language ------------------------------------------------------------------
@@ -88,7 +142,8 @@ def working_time(value: str):
 
 # Currency / employment units / employment types ----------------------------
 def currency(code: str):
-    return _get_or_create(Currencies, "code", code.upper(), symbol=code, name=code)
+    code = code.upper()             # same row `bulk_load` inserts for it
+    return _get_or_create(Currencies, "code", code, symbol=code, name=code)
 
 
 def employment_unit(unit: str):
@@ -111,3 +166,19 @@ def job_board(name: str, website_url: str | None = None):
     """
     defaults = {"website_url": website_url or f"https://{name}"}
     return _get_or_create(JobBoardWebsites, "name", name, **defaults)
+
+
+# Lookup tables and their PK column, in the order `warm_lookup_cache` loads them
+LOOKUP_TABLES: list[tuple[Type[Model], str]] = [
+    (Countries, "code"),
+    (Languages, "code"),
+    (LanguageLevels, "level"),
+    (ExperienceLevels, "level"),
+    (WorkplaceTypes, "type"),
+    (WorkingTimes, "type"),
+    (Currencies, "code"),
+    (EmploymentUnits, "unit"),
+    (EmploymentTypes, "type"),
+    (SkillLevels, "level"),
+    (JobBoardWebsites, "name"),
+]
@@ -0,0 +1,292 @@
+# src/job_market_tools/services/name_index.py
+"""
+In-memory fuzzy-match index over pre-cleaned names.
+
+Names are grouped into partitions (e.g. companies per country) and matched
+with RapidFuzz on the already-cleaned strings, so resolving a name costs a
+few microseconds of CPU instead of a trigram query per lookup.
+
+Exact matches are answered from a dict, and recently resolved variants
+from a bounded LRU next to it; only names in neither pay for a fuzzy scan
+of their partition.  `best_many` scores a whole batch of such names in one
+multi-threaded ``process.cdist`` call when numpy (which rapidfuzz needs
+for it) is installed, and falls back to one scan per name otherwise.
+
+To keep the merge behaviour of the SQL path, a match must also clear the
+``pg_trgm`` similarity floor (0.3) that used to pre-select candidates –
+otherwise short names like "it" would token-set-match every company that
+has the word in it.
+
+`clean_name`, the text cleaning every normalizer applies, lives here too.
+The module imports nothing from Django, so worker processes
+(`normalize_pool`) can use it without setting Django up.
+"""
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from rapidfuzz import fuzz, process
+
+# ─────────── optional batch scoring ───────────
+try:
+    import numpy as np                 # process.cdist returns an ndarray
+except ModuleNotFoundError:            # best_many scans name by name
+    np = None
+
+
+# ——————————————————————————————————————————————————————————————
+# Cleaning
+# ——————————————————————————————————————————————————————————————
+_CORP_SUFFIXES = re.compile(
+    r"\b(sa|sp\.? z\.? o\.? o\.?|llc|inc\.?|ltd\.?|gmbh|s\.?r\.?l\.?|pty|co\.?)\b",
+    flags=re.IGNORECASE,
+)
+_WS = re.compile(r"\s+")
+
+
+def _strip_accents(text: str) -> str:
+    return "".join(
+        ch
+        for ch in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(ch)
+    )
+
+
+def clean_name(raw: str) -> str:
+    """Lower-cased, accent- and punctuation-free name without corporate suffixes."""
+    t = _strip_accents(raw)
+    t = _CORP_SUFFIXES.sub("", t)        # drop “sp. z o.o.” etc.
+    t = re.sub(r"[^\w\s\-]", " ", t)     # punctuation → space
+    t = _WS.sub(" ", t)                  # collapse whitespace
+    return t.strip().lower()
+
+
+# ——————————————————————————————————————————————————————————————
+# Matching
+# ——————————————————————————————————————————————————————————————
+_WORD = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Trigram set of *text* the way ``pg_trgm`` builds it (per padded word)."""
+    out = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        out.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(out)
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Python twin of ``pg_trgm.similarity(a, b)``."""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
+
+
+class NameIndex:
+    """
+    Partitioned list of ``(cleaned name, key)`` pairs.
+
+    *key* is whatever the caller needs back for a hit (a pk, a model
+    instance …).  Searching with ``partition=None`` looks at every partition.
+
+    The per-partition lists are copy-on-write – `add` replaces them instead
+    of appending – so a search only holds the lock to pick them up and
+    scores without it; concurrent lookups don't queue behind one scan.
+    """
+
+    def __init__(
+        self, scorer=fuzz.token_set_ratio, min_similarity: float = 0.3,
+        memo_size: int = 50_000,
+    ):
+        self.scorer = scorer
+        self.min_similarity = min_similarity
+        self.memo_size = memo_size
+        self._names: Dict[Hashable, List[str]] = {}
+        self._keys: Dict[Hashable, List[Any]] = {}
+        # (partition, cleaned) → (key, 100) of every indexed name, also keyed
+        # (None, cleaned) – grows with the index, not with the lookups
+        self._exact: Dict[Tuple[Hashable, str], Tuple[Any, float]] = {}
+        # same keys → (key, score) of fuzzy matches, least recently used first
+        self._memo: "OrderedDict[Tuple[Hashable, str], Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    # ------------------------------------------------------------------— build
+    def load(self, rows: Iterable[Tuple[Hashable, str, Any]]) -> int:
+        """Replace the contents with ``(partition, cleaned, key)`` rows."""
+        names: Dict[Hashable, List[str]] = {}
+        keys: Dict[Hashable, List[Any]] = {}
+        exact: Dict[Tuple[Hashable, str], Tuple[Any, float]] = {}
+        n = 0
+        for part, cleaned, key in rows:
+            names.setdefault(part, []).append(cleaned)
+            keys.setdefault(part, []).append(key)
+            exact.setdefault((part, cleaned), (key, 100))
+            exact.setdefault((None, cleaned), (key, 100))
+            n += 1
+        with self._lock:
+            self._names, self._keys, self._exact = names, keys, exact
+            self._memo = OrderedDict()
+            self.loaded = True
+        return n
+
+    def add(self, partition: Hashable, cleaned: str, key: Any) -> None:
+        with self._lock:
+            # copy-on-write: searches may be scoring the old lists right now
+            self._names[partition] = [*self._names.get(partition, ()), cleaned]
+            self._keys[partition] = [*self._keys.get(partition, ()), key]
+            self._exact.setdefault((partition, cleaned), (key, 100))
+            self._exact.setdefault((None, cleaned), (key, 100))
+
+    def snapshot(self) -> List[Tuple[Hashable, str, Any]]:
+        """Every ``(partition, cleaned, key)`` row, e.g. to `load` elsewhere."""
+        with self._lock:
+            return [
+                (part, name, key)
+                for part, names in self._names.items()
+                for name, key in zip(names, self._keys[part])
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names, self._keys, self._exact = {}, {}, {}
+            self._memo = OrderedDict()
+            self.loaded = False
+
+    # ------------------------------------------------------------------— search
+    def best(
+        self, cleaned: str, partition: Hashable | None = None, cutoff: float = 90
+    ) -> Optional[Tuple[Any, float]]:
+        """``(key, score)`` of the best match scoring at least *cutoff*, or None."""
+        with self._lock:
+            known = self._known((partition, cleaned))
+            if known and known[1] >= cutoff:
+                return known
+            if partition is None:
+                parts = list(self._names)
+            else:
+                parts = [partition] if partition in self._names else []
+            lists = [(self._names[part], self._keys[part]) for part in parts]
+        best: Optional[Tuple[Any, float]] = None
+        for names, keys in lists:
+            # best score first; usually zero or one candidate clears the cutoff
+            hit = self._first_hit(cleaned, names, keys, (
+                (idx, score) for _, score, idx in process.extract(
+                    cleaned, names, scorer=self.scorer, score_cutoff=cutoff, limit=None)
+            ))
+            if hit and (best is None or hit[1] > best[1]):
+                best = hit
+        if best:
+            with self._lock:
+                self._remember((partition, cleaned), best)
+        return best
+
+    def best_many(
+        self, cleaned: Iterable[str], partition: Hashable | None = None, cutoff: float = 90
+    ) -> Dict[str, Tuple[Any, float]]:
+        """
+        `best` for a batch of names: ``{cleaned: (key, score)}`` for those
+        with a match.  The names neither indexed nor memoized are scored
+        against the partition in one ``process.cdist`` call (all cores).
+        """
+        out: Dict[str, Tuple[Any, float]] = {}
+        todo: List[str] = []
+        with self._lock:
+            for c in dict.fromkeys(cleaned):
+                known = self._known((partition, c))
+                if known and known[1] >= cutoff:
+                    out[c] = known
+                else:
+                    todo.append(c)
+            names, keys = self._choices(partition)
+        if not todo or not names:
+            return out
+
+        if np is None:
+            ranked = (
+                ((idx, score) for _, score, idx in process.extract(
+                    c, names, scorer=self.scorer, score_cutoff=cutoff, limit=None))
+                for c in todo
+            )
+        else:
+            scores = process.cdist(
+                todo, names, scorer=self.scorer, score_cutoff=cutoff,
+                dtype=np.float64, workers=-1,      # float64: same scores as extract
+            )
+            ranked = (self._ranked(row, cutoff) for row in scores)
+        found = {}
+        for c, candidates in zip(todo, ranked):
+            hit = self._first_hit(c, names, keys, candidates)
+            if hit:
+                found[c] = hit
+        with self._lock:
+            for c, hit in found.items():
+                self._remember((partition, c), hit)
+        out.update(found)
+        return out
+
+    def _known(self, key: Tuple[Hashable, str]) -> Optional[Tuple[Any, float]]:
+        """Exact or memoized ``(key, score)`` for *key*; needs the lock."""
+        known = self._exact.get(key)
+        if known is None:
+            known = self._memo.get(key)
+            if known is not None:
+                self._memo.move_to_end(key)
+        return known
+
+    def _remember(self, key: Tuple[Hashable, str], hit: Tuple[Any, float]) -> None:
+        """Memoize a fuzzy match, evicting the least recent; needs the lock."""
+        self._memo[key] = hit
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def _choices(self, partition: Hashable | None) -> Tuple[List[str], List[Any]]:
+        """Names and keys *partition* covers, safe to score unlocked; needs the lock."""
+        if partition is not None:
+            return self._names.get(partition, []), self._keys.get(partition, [])
+        return (
+            [n for names in self._names.values() for n in names],
+            [k for keys in self._keys.values() for k in keys],
+        )
+
+    @staticmethod
+    def _ranked(row, cutoff: float) -> Iterable[Tuple[int, float]]:
+        """``(index, score)`` of one ``cdist`` row's hits, best score first."""
+        idx = np.flatnonzero(row >= cutoff)
+        idx = idx[np.argsort(-row[idx], kind="stable")]
+        return ((int(i), float(row[i])) for i in idx)
+
+    def _first_hit(
+        self, cleaned: str, names: List[str], keys: List[Any],
+        candidates: Iterable[Tuple[int, float]],
+    ) -> Optional[Tuple[Any, float]]:
+        """The best-scoring candidate that also clears the trigram floor."""
+        for idx, score in candidates:
+            if trigram_similarity(cleaned, names[idx]) >= self.min_similarity:
+                return keys[idx], score
+        return None
+
+    # ------------------------------------------------------------------— stats
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._names.values())
+
+    def memory_bytes(self) -> int:
+        """Approximate size of the names and bookkeeping lists (not the keys)."""
+        with self._lock:
+            total = sys.getsizeof(self._names) + sys.getsizeof(self._keys)
+            for cache in (self._exact, self._memo):
+                total += sys.getsizeof(cache) + sum(
+                    sys.getsizeof(k) + sys.getsizeof(v) for k, v in cache.items()
+                )
+            for part, names in self._names.items():
+                total += sys.getsizeof(names) + sys.getsizeof(self._keys[part])
+                total += sum(sys.getsizeof(n) for n in names)
+        return total
@@ -0,0 +1,142 @@
+# src/job_market_tools/services/normalize_pool.py
+"""
+Optional process pool for the CPU-bound part of normalization.
+
+Cleaning (`clean_name`) and RapidFuzz scoring are pure Python/C work that
+serializes on the GIL.  `NormalizePool` ships every distinct raw company,
+skill and category name of a batch to worker processes, which clean and
+match them against a snapshot of the canonical names taken when the pool
+started.  The matches come back as ``name_aliases`` rows, written by the
+calling (writer) thread; the regular ingest path then resolves those names
+with alias hits and only genuinely new names reach the normalizers'
+database path.
+
+Workers only import `name_index` – no Django, no DB connections – so the
+pool uses the ``spawn`` start method and is safe to create from a process
+that already runs scraper and writer threads.
+"""
+from __future__ import annotations
+
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Tuple
+
+from .name_index import NameIndex, clean_name
+
+Task = Tuple[str, str, str]                 # (kind, scope, raw name)
+Decision = Tuple[str, str, str, Any]        # (kind, scope, cleaned, target)
+
+# ──────────────────────────────────────────────────────────
+# Worker side
+# ──────────────────────────────────────────────────────────
+_indexes: Dict[str, NameIndex] = {}
+_exact: Dict[str, set] = {}
+_cutoffs: Dict[str, float] = {}                 # `normalizer.CUTOFFS`
+
+
+def _init_worker(
+    snapshot: Mapping[str, List[Tuple[Hashable, str, Any]]],
+    cutoffs: Mapping[str, float],
+) -> None:
+    _cutoffs.update(cutoffs)
+    for kind, rows in snapshot.items():
+        _indexes[kind] = NameIndex()
+        _indexes[kind].load(rows)
+        _exact[kind] = {key for _, _, key in rows}      # canonical names
+
+
+def _resolve(tasks: List[Task]) -> List[Decision]:
+    """Clean and match *tasks*; target is None when nothing matched."""
+    out: List[Decision] = []
+    for kind, scope, raw in tasks:
+        cleaned = clean_name(raw)
+        if not cleaned:
+            continue
+        if kind == "company":                   # key = (pk, name, country)
+            hit = _indexes[kind].best(cleaned, scope or None, cutoff=_cutoffs[kind])
+            target = hit[0][0] if hit else None
+        elif raw.strip() in _exact[kind]:
+            target = raw.strip()
+        else:
+            hit = _indexes[kind].best(cleaned, "", cutoff=_cutoffs[kind])
+            target = hit[0] if hit else None
+        out.append((kind, scope, cleaned, target))
+    return out
+
+
+# ──────────────────────────────────────────────────────────
+# Caller side
+# ──────────────────────────────────────────────────────────
+def payload_tasks(payloads: Iterable[Mapping[str, Any]]) -> List[Task]:
+    """Distinct names of ingest *payloads* that need normalizing."""
+    tasks: Dict[Task, None] = {}
+    for d in payloads:
+        cc = (d.get("company_country_code") or "").upper()
+        tasks[("company", cc, d["company_name"])] = None
+        for sk in (*d.get("skills_required", []), *d.get("skills_optional", [])):
+            tasks[("skill", "", sk["name"])] = None
+        for raw in d.get("categories", []):
+            tasks[("category", "", raw)] = None
+    return list(tasks)
+
+
+class NormalizePool:
+    """
+    * ``workers``    – worker processes (default: CPU count)
+    * ``chunk_size`` – names per task sent to a worker; smaller batches are
+      split evenly over all workers
+    """
+
+    MEMO_LIMIT = 200_000
+
+    def __init__(self, workers: int | None = None, chunk_size: int = 2000):
+        from .normalizer import CUTOFFS, canonical_snapshot     # needs Django
+
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self._done: set[Task] = set()                   # already sent once
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(canonical_snapshot(), CUTOFFS),
+        )
+
+    def resolve(self, tasks: Iterable[Task]) -> List[Decision]:
+        """Clean and match *tasks* on the workers, results in input order."""
+        tasks = list(tasks)
+        if not tasks:
+            return []
+        size = min(self.chunk_size, math.ceil(len(tasks) / self.workers))
+        chunks = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+        return [d for part in self._pool.map(_resolve, chunks) for d in part]
+
+    def prenormalize(self, payloads: Iterable[Mapping[str, Any]]) -> Dict[str, int]:
+        """
+        Resolve every new name of *payloads* on the workers and store the
+        matches as aliases, so the following ingest call finds them without
+        fuzzy matching.  Returns ``{"names": sent, "matched": aliased}``.
+        """
+        from django.db import transaction
+
+        from .aliases import remember_aliases
+
+        tasks = [t for t in payload_tasks(payloads) if t not in self._done]
+        decisions = self.resolve(tasks)
+
+        grouped: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for kind, scope, cleaned, target in decisions:
+            if target is not None:
+                grouped.setdefault((kind, scope), {})[cleaned] = target
+        with transaction.atomic():
+            for (kind, scope), targets in grouped.items():
+                remember_aliases(kind, scope, targets)
+
+        if len(self._done) > self.MEMO_LIMIT:
+            self._done.clear()
+        self._done.update(tasks)
+        return {"names": len(tasks), "matched": sum(map(len, grouped.values()))}
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
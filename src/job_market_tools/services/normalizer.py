@@ -1,110 +1,273 @@
 # src/job_market_tools/services/normalizer.py
 from __future__ import annotations
 
-import re
-import unicodedata
-from typing import Tuple, Optional, List
+import threading
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.db import transaction
+from django.db.models import Q
 from django.contrib.postgres.search import TrigramSimilarity
 from rapidfuzz import fuzz
 
 from ..db_schema.database import Companies, Skills, OfferCategories
+from .aliases import remember_alias, remember_aliases, resolve_alias, resolve_aliases
 from .lookups import country
+from .name_index import NameIndex, clean_name
 
 # ——————————————————————————————————————————————————————————————
 # Shared helpers
 # ——————————————————————————————————————————————————————————————
-_CORP_SUFFIXES = re.compile(
-    r"\b(sa|sp\.? z\.? o\.? o\.?|llc|inc\.?|ltd\.?|gmbh|s\.?r\.?l\.?|pty|co\.?)\b",
-    flags=re.IGNORECASE,
-)
-_WS = re.compile(r"\s+")
-
-
-def _strip_accents(text: str) -> str:
-    return "".join(
-        ch
-        for ch in unicodedata.normalize("NFKD", text)
-        if not unicodedata.combining(ch)
-    )
-
+# Text cleaning lives in `name_index` (no Django imports) so that worker
+# processes of `normalize_pool` can use it too.
+_clean_name = clean_name
 
-def _clean_name(raw: str) -> str:
-    t = _strip_accents(raw)
-    t = _CORP_SUFFIXES.sub("", t)        # drop “sp. z o.o.” etc.
-    t = re.sub(r"[^\w\s\-]", " ", t)     # punctuation → space
-    t = _WS.sub(" ", t)                  # collapse whitespace
-    return t.strip().lower()
+# minimum RapidFuzz score for a raw name to be merged into an existing row,
+# per alias kind; `normalize_pool` workers and `renormalize` use them too
+CUTOFFS = {"company": 90, "skill": 80, "category": 80}
 
 
 # ——————————————————————————————————————————————————————————————
 # Company
 # ——————————————————————————————————————————————————————————————
+# cleaned company names per country, loaded on first use
+_companies = NameIndex()
+_index_load_lock = threading.RLock()            # guards (re)loading any index
+
+
+def warm_company_index() -> int:
+    """(Re)load every company into the in-memory index; returns the count."""
+    with _index_load_lock:
+        return _companies.load(
+            (cc, clean or _clean_name(name), (pk, name, cc))
+            for pk, name, clean, cc in Companies.objects.values_list(
+                "id", "name", "name_clean", "country_code_id"
+            ).iterator(chunk_size=10_000)
+        )
+
+
+def company_index_stats() -> dict:
+    """Size of the company index: number of names and approximate KiB."""
+    return {"names": len(_companies), "kib": _companies.memory_bytes() // 1024}
+
+
+def _company(key: Tuple[int, str, str]) -> Companies:
+    pk, name, cc = key
+    return Companies(id=pk, name=name, country_code_id=cc)
+
+
 def normalize_company(raw_name: str, country_code: str | None = None) -> Companies:
     """
     Return a `Companies` instance representing `raw_name`
     (create both the company and the country row if missing).
+
+    Raw names resolved before come from `name_aliases`; such instances only
+    carry ``id`` and ``country_code``.
     """
     cleaned = _clean_name(raw_name)
     if not cleaned:
         raise ValueError("Company name cannot be empty after cleaning")
 
     country_obj = country(country_code)
+    scope = country_obj.pk if country_obj else ""
+    target = resolve_alias("company", scope, cleaned)
+    if target is not None:
+        return Companies(id=int(target), country_code=country_obj)
 
-    # 1 — candidates from DB
-    qs = Companies.objects.annotate(sim=TrigramSimilarity("name", cleaned))
+    with transaction.atomic():
+        company = _match_company(raw_name, cleaned, country_obj)
+        remember_alias("company", scope, cleaned, company.pk)
+    return company
+
+
+def _match_company(raw_name: str, cleaned: str, country_obj) -> Companies:
+    if not _companies.loaded:
+        with _index_load_lock:
+            if not _companies.loaded:
+                warm_company_index()
+
+    # 1 — in-memory match
+    hit = _companies.best(cleaned, country_obj and country_obj.pk, cutoff=CUTOFFS["company"])
+    if hit:
+        return _company(hit[0])
+
+    # 2 — miss: confirm against the DB (rows added by other processes);
+    #     `%` (similarity ≥ 0.3) is answered by the GIN trigram index
+    qs = Companies.objects.filter(name_clean__trigram_similar=cleaned)
     if country_obj:
         qs = qs.filter(country_code=country_obj)
-    qs = qs.filter(sim__gte=0.3).order_by("-sim")[:20]
+    qs = qs.annotate(sim=TrigramSimilarity("name_clean", cleaned)).order_by("-sim")[:20]
 
-    # 2 — RapidFuzz re-score
     best: Tuple[Optional[Companies], int] = (None, 0)
     for comp in qs:
-        score = fuzz.token_set_ratio(cleaned, _clean_name(comp.name))
+        score = fuzz.token_set_ratio(cleaned, comp.name_clean)
         if score > best[1]:
             best = (comp, score)
 
-    if best[0] and best[1] >= 90:
+    if best[0] and best[1] >= CUTOFFS["company"]:
+        _remember_company(best[0])
         return best[0]
 
     # 3 — insert
     with transaction.atomic():
         company, _ = Companies.objects.get_or_create(
             name=raw_name.strip(),
-            defaults={"country_code": country_obj},
+            defaults={"country_code": country_obj, "name_clean": cleaned},
         )
+        transaction.on_commit(lambda: _remember_company(company))
     return company
 
 
+def _remember_company(company: Companies) -> None:
+    _companies.add(
+        company.country_code_id,
+        _clean_name(company.name),
+        (company.pk, company.name, company.country_code_id),
+    )
+
+
 # ——————————————————————————————————————————————————————————————
 # Skills & categories
 # ——————————————————————————————————————————————————————————————
-def _generic_normalize(model, raw_name: str, threshold: int = 80):
-    cleaned = _clean_name(raw_name)
-    qs = (
-        model.objects.annotate(sim=TrigramSimilarity("name", cleaned))
-        .filter(sim__gte=0.3)
-        .order_by("-sim")[:20]
-    )
+# both tables are small: kept whole in memory, loaded on first use
+_skills = NameIndex()
+_categories = NameIndex()
 
-    best: Tuple[Optional[model], int] = (None, 0)
-    for obj in qs:
-        score = fuzz.token_set_ratio(cleaned, _clean_name(obj.name))
-        if score > best[1]:
-            best = (obj, score)
 
-    if best[0] and best[1] >= threshold:
-        return best[0]
+def _load_index(index: NameIndex, model) -> None:
+    with _index_load_lock:
+        if not index.loaded:
+            index.load(
+                ("", clean or _clean_name(name), name)
+                for name, clean in model.objects.values_list("name", "name_clean").iterator()
+            )
+
+
+def _normalize_many(
+    model, index: NameIndex, kind: str, raw_names: Iterable[str]
+) -> Dict[str, Any]:
+    """
+    Resolve many raw names of one lookup table at once:
+
+    1. every distinct name is cleaned once,
+    2. names resolved before come from `name_aliases` (one ``IN`` query),
+    3. the rest are matched exactly with one ``IN`` query, then fuzzily
+       against the in-memory index in one batch (`NameIndex.best_many`),
+    4. names still unmatched are checked against the table with one ``%``
+       query (rows other processes added) and against each other,
+    5. names without a match are created with a single bulk insert.
+
+    Returns ``{raw name: model instance}``.
+    """
+    cleaned = {raw: _clean_name(raw) for raw in dict.fromkeys(raw_names)}
+    known = resolve_aliases(kind, "", cleaned.values())
+    out = {raw: model(name=known[c]) for raw, c in cleaned.items() if c in known}
+    todo = [raw for raw in cleaned if raw not in out]
+    if not todo:
+        return out
 
+    threshold = CUTOFFS[kind]
+    if not index.loaded:
+        _load_index(index, model)
     with transaction.atomic():
-        obj, _ = model.objects.get_or_create(name=raw_name.strip())
-    return obj
+        exact = set(
+            model.objects.filter(name__in={raw.strip() for raw in todo})
+            .values_list("name", flat=True)
+        )
+        decided: Dict[str, str] = {}                # cleaned → canonical name
+        for raw in todo:
+            if raw.strip() in exact:
+                decided.setdefault(cleaned[raw], raw.strip())
+        hits = index.best_many(
+            (cleaned[raw] for raw in todo if cleaned[raw] not in decided),
+            "", cutoff=threshold,
+        )
+        unmatched: List[str] = []
+        for raw in todo:
+            c = cleaned[raw]
+            if c in decided:
+                continue
+            if c in hits:
+                decided[c] = hits[c][0]
+            else:
+                unmatched.append(raw)
+
+        new: List[str] = []
+        if unmatched:
+            others = NameIndex()                    # DB rows missing in `index`
+            others.load(
+                ("", clean, name)
+                for name, clean in model.objects.filter(
+                    reduce(or_, (Q(name_clean__trigram_similar=cleaned[raw])
+                                 for raw in unmatched))
+                ).values_list("name", "name_clean")
+            )
+            fresh = NameIndex()                     # names created by this call
+            for raw in unmatched:
+                c = cleaned[raw]
+                if c in decided:
+                    continue
+                hit = (others.best(c, "", cutoff=threshold)
+                       or fresh.best(c, "", cutoff=threshold))
+                if hit:
+                    decided[c] = hit[0]
+                else:
+                    decided[c] = raw.strip()
+                    fresh.add("", c, raw.strip())
+                    new.append(raw.strip())
+
+        out.update({raw: model(name=decided[cleaned[raw]]) for raw in todo})
+        model.objects.bulk_create(
+            [model(name=n, name_clean=_clean_name(n)) for n in new],
+            ignore_conflicts=True,
+        )
+        remember_aliases(kind, "", decided)
+
+        def learn() -> None:
+            for name in new:
+                index.add("", _clean_name(name), name)
+
+        transaction.on_commit(learn)
+    return out
+
+
+def canonical_snapshot() -> Dict[str, List[Tuple[Any, str, Any]]]:
+    """
+    ``(partition, cleaned, key)`` rows of all three in-memory indexes, keyed
+    by alias kind – the canonical names `normalize_pool` workers match
+    against.
+    """
+    if not _companies.loaded:
+        warm_company_index()
+    for index, model in ((_skills, Skills), (_categories, OfferCategories)):
+        if not index.loaded:
+            _load_index(index, model)
+    return {
+        "company":  _companies.snapshot(),
+        "skill":    _skills.snapshot(),
+        "category": _categories.snapshot(),
+    }
+
+
+def reset_indexes() -> None:
+    """Forget all in-memory indexes, e.g. after rows were merged or renamed."""
+    with _index_load_lock:
+        for index in (_companies, _skills, _categories):
+            index.clear()
+
+
+def normalize_skills(raw_skills: Iterable[str]) -> Dict[str, Skills]:
+    return _normalize_many(Skills, _skills, "skill", raw_skills)
+
+
+def normalize_categories(raw_cats: Iterable[str]) -> Dict[str, OfferCategories]:
+    return _normalize_many(OfferCategories, _categories, "category", raw_cats)
 
 
 def normalize_skill(raw_skill: str) -> Skills:
-    return _generic_normalize(Skills, raw_skill, threshold=80)
+    return normalize_skills([raw_skill])[raw_skill]
 
 
 def normalize_category(raw_cat: str) -> OfferCategories:
-    return _generic_normalize(OfferCategories, raw_cat, threshold=80)
+    return normalize_categories([raw_cat])[raw_cat]
@@ -2,7 +2,7 @@
 """
 Offer ingestion service – *with full-payload logging*.
 
-* Every call to ``create_offer`` is logged at DEBUG level.
+* Every call to ``create_offer`` / ``create_offers`` is logged at DEBUG level.
 * On any ``IntegrityError`` the whole input payload is logged with stack-trace,
   then re-raised.  Same for any other exception.
 * The helper ``_location_obj`` still logs its own payload on failure.
@@ -13,11 +13,16 @@ Django ``LOGGING`` settings (console handler is enough) to see the output.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import threading
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, Mapping
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 from django.db import transaction
+from django.db.models import Model
 from django.db.utils import IntegrityError
 
 from ..db_schema.database import (
@@ -30,7 +35,14 @@ from ..db_schema.database import (
     OfferSalaries,
     Locations,
 )
-from .normalizer import normalize_company, normalize_skill, normalize_category
+from .locations import place_key, resolve_locations
+from .normalizer import (
+    normalize_categories,
+    normalize_category,
+    normalize_company,
+    normalize_skill,
+    normalize_skills,
+)
 from .lookups import (
     job_board,
     experience_level,
@@ -38,7 +50,6 @@ from .lookups import (
     working_time,
     language,
     language_level,
-    country,
     currency,
     employment_unit,
     employment_type,
@@ -51,132 +62,72 @@ from .lookups import (
 logger = logging.getLogger(__name__)
 
 
+# Child tables synced together with their offer, in this order, and the
+# columns (besides ``offer``) that make two rows equal
+CHILD_MODELS: Dict[type[Model], Tuple[str, ...]] = {
+    OffersCategories:     ("category_name",),
+    OffersSkills:         ("skill_name", "skill_level"),
+    OffersOptionalSkills: ("skill_name", "skill_level"),
+    OffersLanguages:      ("language_code", "language_level"),
+    OffersLocations:      ("location",),
+    OfferSalaries:        ("currency", "salary_min", "salary_max", "is_gross", "unit", "type"),
+}
+
+# Offer columns refreshed when an existing offer is upserted
+_UPSERT_FIELDS = [
+    "apply_url",
+    "company",
+    "title",
+    "description",
+    "experience_level",
+    "workplace_type",
+    "working_time",
+    "publish_date",
+    "expire_date",
+    "raw_json",
+    "content_hash",
+]
+
+
 # ──────────────────────────────────────────────────────────
-# Public entry point
+# Public entry points
 # ──────────────────────────────────────────────────────────
 @transaction.atomic
-def create_offer(data: Mapping[str, Any]) -> Offers:  # noqa: C901  (complexity OK)
+def create_offer(data: Mapping[str, Any]) -> Offers:
     """
     Upsert one offer & all related rows.
 
     *Creates* any missing lookup rows on-the-fly.
+    The offer is keyed on ``(job_board_name, external_uid)`` when the payload
+    carries the board's own id, otherwise on ``(job_board_name, apply_url)``.
+    If the stored offer has the same `content_fingerprint`, it is returned
+    as-is without normalizing or writing anything.
     On failure, the full ``data`` payload is logged for easy debugging.
     """
     # record every call (you can mute DEBUG in prod)
     logger.debug("create_offer payload=%s", data)
 
     try:
-        # ----- local helpers -------------------------------------------------
-        def _dt(val: str | datetime) -> datetime:
-            return val if isinstance(val, datetime) else datetime.fromisoformat(val)
-
-        comp = normalize_company(data["company_name"], data.get("company_country_code"))
-        jb = job_board(data["job_board_name"])
+        key = (
+            {"external_uid": data["external_uid"]}
+            if data.get("external_uid")
+            else {"apply_url": data["apply_url"]}
+        )
+        fingerprint = content_fingerprint(data)
+        unchanged = Offers.objects.filter(
+            job_board_name_id=data["job_board_name"], content_hash=fingerprint, **key
+        ).first()
+        if unchanged:
+            _record_unchanged(1)
+            return unchanged
 
-        # ----- core Offer row ------------------------------------------------
+        resolve = _memoized(_batch_names([data]))
         offer, _ = Offers.objects.update_or_create(
-            job_board_name=jb,
-            apply_url=data["apply_url"],
-            defaults=dict(
-                company=comp,
-                title=data["title"],
-                description=data.get("description", ""),
-                experience_level=experience_level(data["experience_level"]),
-                workplace_type=workplace_type(data["workplace_type"]),
-                working_time=working_time(data["working_time"]),
-                publish_date=_dt(data["publish_date"]),
-                expire_date=_dt(data["expire_date"]),
-                raw_json=data.get("raw_json") or {},
-            ),
+            job_board_name=job_board(data["job_board_name"]),
+            **key,
+            defaults=_offer_fields(data, fingerprint, resolve),
         )
-
-        # --------------------------------------------------------------------
-        # 1) Categories  (UNIQUE: offer_id, category_name FK)
-        # --------------------------------------------------------------------
-        OffersCategories.objects.filter(offer=offer).delete()
-        seen_cats: set[str] = set()
-        for raw in data.get("categories", []):
-            cat = normalize_category(raw)
-            if cat.name in seen_cats:
-                continue
-            OffersCategories.objects.create(offer=offer, category_name=cat)
-            seen_cats.add(cat.name)
-
-        # --------------------------------------------------------------------
-        # 2) Required skills  (UNIQUE: offer_id, skill_name FK)
-        # --------------------------------------------------------------------
-        OffersSkills.objects.filter(offer=offer).delete()
-        seen_req: set[str] = set()
-        for sk in data.get("skills_required", []):
-            sk_obj = normalize_skill(sk["name"])
-            if sk_obj.name in seen_req:
-                continue
-            OffersSkills.objects.create(
-                offer=offer,
-                skill_name=sk_obj,
-                skill_level=skill_level(sk.get("level")),
-            )
-            seen_req.add(sk_obj.name)
-
-        # --------------------------------------------------------------------
-        # 3) Optional skills  (UNIQUE: offer_id, skill_name FK)
-        # --------------------------------------------------------------------
-        OffersOptionalSkills.objects.filter(offer=offer).delete()
-        seen_opt: set[str] = set()
-        for sk in data.get("skills_optional", []):
-            sk_obj = normalize_skill(sk["name"])
-            if sk_obj.name in seen_opt:
-                continue
-            OffersOptionalSkills.objects.create(
-                offer=offer,
-                skill_name=sk_obj,
-                skill_level=skill_level(sk.get("level") or 1),
-            )
-            seen_opt.add(sk_obj.name)
-
-        # --------------------------------------------------------------------
-        # 4) Languages  (UNIQUE: offer_id, language_code FK)
-        # --------------------------------------------------------------------
-        OffersLanguages.objects.filter(offer=offer).delete()
-        seen_lang: set[str] = set()
-        for lang_rec in data.get("languages", []):
-            code = lang_rec["code"].lower()
-            if code in seen_lang:
-                continue
-            OffersLanguages.objects.create(
-                offer=offer,
-                language_code=language(code),
-                language_level=language_level(lang_rec.get("level")),
-            )
-            seen_lang.add(code)
-
-        # --------------------------------------------------------------------
-        # 5) Locations  (UNIQUE: offer_id, location_id FK)
-        # --------------------------------------------------------------------
-        OffersLocations.objects.filter(offer=offer).delete()
-        seen_loc: set[int] = set()
-        for loc in data.get("locations", []):
-            loc_obj = _location_obj(loc)
-            if loc_obj.id in seen_loc:
-                continue
-            OffersLocations.objects.create(offer=offer, location=loc_obj)
-            seen_loc.add(loc_obj.id)
-
-        # --------------------------------------------------------------------
-        # 6) Salaries (delete → insert, duplicates allowed)
-        # --------------------------------------------------------------------
-        OfferSalaries.objects.filter(offer=offer).delete()
-        for sal in data.get("salaries", []):
-            OfferSalaries.objects.create(
-                offer=offer,
-                currency=currency(sal["currency"]),
-                salary_min=sal["min"],
-                salary_max=sal.get("max"),
-                is_gross=sal["is_gross"],
-                unit=employment_unit(sal["unit"]),
-                type=employment_type(sal["type"]),
-            )
-
+        _sync_children({offer.pk: _child_rows(offer, data, resolve)})
         return offer
 
     # ── log & re-raise on IntegrityError ────────────────────────────────────
@@ -190,21 +141,361 @@ def create_offer(data: Mapping[str, Any]) -> Offers:  # noqa: C901  (complexity
         raise
 
 
+@transaction.atomic
+def create_offers(payloads: Sequence[Mapping[str, Any]]) -> List[Offers]:
+    """
+    Upsert a batch of offers (e.g. one scraped page) in a single transaction.
+
+    Offers whose stored fingerprint matches are skipped with one query.  For
+    the rest, lookups are resolved up front, all offers carrying an
+    ``external_uid`` are upserted with one ``INSERT … ON CONFLICT`` and every
+    child table is synced with at most one read, one delete and one insert –
+    a constant number of statements per batch instead of dozens per offer.
+    Payloads without an ``external_uid`` fall back to `create_offer`.
+
+    Returns the ``Offers`` rows aligned with *payloads*; a UID repeated
+    within the batch is written once, from its last payload.
+    """
+    logger.debug("create_offers batch of %d payloads", len(payloads))
+
+    keyed: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+    for data in payloads:
+        if data.get("external_uid"):
+            keyed[(data["job_board_name"], data["external_uid"])] = data
+
+    try:
+        fingerprints = {k: content_fingerprint(d) for k, d in keyed.items()}
+        by_key = find_unchanged(fingerprints)
+        todo = {k: d for k, d in keyed.items() if k not in by_key}
+        # each distinct lookup value once; skills & categories in bulk
+        resolve = _memoized(_batch_names(todo.values()))
+        offers = [
+            Offers(
+                job_board_name=resolve(job_board, board),
+                **_offer_fields(data, fingerprints[(board, uid)], resolve),
+            )
+            for (board, uid), data in todo.items()
+        ]
+        if offers:
+            Offers.objects.bulk_create(
+                offers,
+                update_conflicts=True,
+                unique_fields=["job_board_name", "external_uid"],
+                update_fields=_UPSERT_FIELDS,
+            )
+            _sync_children(
+                {o.pk: _child_rows(o, data, resolve) for o, data in zip(offers, todo.values())}
+            )
+        by_key.update(zip(todo, offers))
+    except IntegrityError:
+        logger.exception("IntegrityError in create_offers | payloads=%s", payloads)
+        raise
+    except Exception:
+        logger.exception("Unexpected error in create_offers | payloads=%s", payloads)
+        raise
+
+    return [
+        by_key[(d["job_board_name"], d["external_uid"])]
+        if d.get("external_uid")
+        else create_offer(d)
+        for d in payloads
+    ]
+
+
+def find_unchanged(
+    fingerprints: Mapping[Tuple[str, str], str],
+) -> Dict[Tuple[str, str], Offers]:
+    """
+    Stored offers whose ``content_hash`` equals the given fingerprint, keyed
+    by ``(job_board_name, external_uid)`` – one query for the whole batch.
+    The hits are counted in `unchanged_offers`.
+    """
+    found: Dict[Tuple[str, str], Offers] = {}
+    if fingerprints:
+        for o in Offers.objects.filter(
+            external_uid__in=[uid for _, uid in fingerprints],
+            content_hash__in=set(fingerprints.values()),
+        ):
+            k = (o.job_board_name_id, o.external_uid)
+            if fingerprints.get(k) == o.content_hash:
+                found[k] = o
+    _record_unchanged(len(found))
+    return found
+
+
+def content_fingerprint(data: Mapping[str, Any]) -> str:
+    """Stable SHA-256 of an ingest payload, independent of dict key order."""
+    canonical = json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+# ──────────────────────────────────────────────────────────
+# Row builders shared by create_offer / create_offers
+# ──────────────────────────────────────────────────────────
+Resolver = Callable[..., Any]
+
+
+def _memoized(primed: Mapping[Tuple[Any, ...], Any] | None = None) -> Resolver:
+    """
+    A resolver that calls each ``fn(*args)`` only once per batch.  *primed*
+    pre-fills results keyed ``(fn, *args)``, see `_batch_names`.
+    """
+    memo: Dict[Tuple[Any, ...], Any] = dict(primed or {})
+
+    def resolve(fn: Callable[..., Any], *args: Any) -> Any:
+        key = (fn, *(
+            tuple(sorted(a.items())) if isinstance(a, Mapping) else a for a in args
+        ))
+        if key not in memo:
+            memo[key] = fn(*args)
+        return memo[key]
+
+    return resolve
+
+
+def _batch_names(payloads: Iterable[Mapping[str, Any]]) -> Dict[Tuple[Any, ...], Any]:
+    """
+    Normalize every skill and category and resolve every location of
+    *payloads* with one batch call per table, keyed for `_memoized` like
+    ``r(normalize_skill, raw)``.
+    """
+    payloads = list(payloads)
+    skills = normalize_skills(
+        sk["name"]
+        for d in payloads
+        for sk in (*d.get("skills_required", []), *d.get("skills_optional", []))
+    )
+    cats = normalize_categories(raw for d in payloads for raw in d.get("categories", []))
+    locs = [loc for d in payloads for loc in d.get("locations", [])]
+    places = _locations(locs)
+    return {
+        **{(normalize_skill, raw): obj for raw, obj in skills.items()},
+        **{(normalize_category, raw): obj for raw, obj in cats.items()},
+        **{(_location_obj, tuple(sorted(loc.items()))): places[place_key(loc)]
+           for loc in locs},
+    }
+
+
+def _dt(val: str | datetime) -> datetime:
+    return val if isinstance(val, datetime) else datetime.fromisoformat(val)
+
+
+def _offer_fields(data: Mapping[str, Any], fingerprint: str, r: Resolver) -> Dict[str, Any]:
+    """Column values of the ``offers`` row (everything but the board)."""
+    return dict(
+        external_uid=data.get("external_uid"),
+        content_hash=fingerprint,
+        apply_url=data["apply_url"],
+        company=r(normalize_company, data["company_name"], data.get("company_country_code")),
+        title=data["title"],
+        description=data.get("description", ""),
+        experience_level=r(experience_level, data["experience_level"]),
+        workplace_type=r(workplace_type, data["workplace_type"]),
+        working_time=r(working_time, data["working_time"]),
+        publish_date=_dt(data["publish_date"]),
+        expire_date=_dt(data["expire_date"]),
+        raw_json=data.get("raw_json") or {},
+    )
+
+
+def _child_rows(
+    offer: Offers, data: Mapping[str, Any], r: Resolver
+) -> Dict[type[Model], List[Model]]:
+    """Unsaved child-table rows for *offer*, keyed by model."""
+    rows: Dict[type[Model], List[Model]] = {m: [] for m in CHILD_MODELS}
+
+    # --------------------------------------------------------------------
+    # 1) Categories  (UNIQUE: offer_id, category_name FK)
+    # --------------------------------------------------------------------
+    seen_cats: set[str] = set()
+    for raw in data.get("categories", []):
+        cat = r(normalize_category, raw)
+        if cat.name in seen_cats:
+            continue
+        rows[OffersCategories].append(OffersCategories(offer=offer, category_name=cat))
+        seen_cats.add(cat.name)
+
+    # --------------------------------------------------------------------
+    # 2) Required skills  (UNIQUE: offer_id, skill_name FK)
+    # --------------------------------------------------------------------
+    seen_req: set[str] = set()
+    for sk in data.get("skills_required", []):
+        sk_obj = r(normalize_skill, sk["name"])
+        if sk_obj.name in seen_req:
+            continue
+        rows[OffersSkills].append(OffersSkills(
+            offer=offer,
+            skill_name=sk_obj,
+            skill_level=r(skill_level, sk.get("level")),
+        ))
+        seen_req.add(sk_obj.name)
+
+    # --------------------------------------------------------------------
+    # 3) Optional skills  (UNIQUE: offer_id, skill_name FK)
+    # --------------------------------------------------------------------
+    seen_opt: set[str] = set()
+    for sk in data.get("skills_optional", []):
+        sk_obj = r(normalize_skill, sk["name"])
+        if sk_obj.name in seen_opt:
+            continue
+        rows[OffersOptionalSkills].append(OffersOptionalSkills(
+            offer=offer,
+            skill_name=sk_obj,
+            skill_level=r(skill_level, sk.get("level") or 1),
+        ))
+        seen_opt.add(sk_obj.name)
+
+    # --------------------------------------------------------------------
+    # 4) Languages  (UNIQUE: offer_id, language_code FK)
+    # --------------------------------------------------------------------
+    seen_lang: set[str] = set()
+    for lang_rec in data.get("languages", []):
+        code = lang_rec["code"].lower()
+        if code in seen_lang:
+            continue
+        rows[OffersLanguages].append(OffersLanguages(
+            offer=offer,
+            language_code=r(language, code),
+            language_level=r(language_level, lang_rec.get("level")),
+        ))
+        seen_lang.add(code)
+
+    # --------------------------------------------------------------------
+    # 5) Locations  (UNIQUE: offer_id, location_id FK)
+    # --------------------------------------------------------------------
+    seen_loc: set[int] = set()
+    for loc in data.get("locations", []):
+        loc_obj = r(_location_obj, loc)
+        if loc_obj.id in seen_loc:
+            continue
+        rows[OffersLocations].append(OffersLocations(offer=offer, location=loc_obj))
+        seen_loc.add(loc_obj.id)
+
+    # --------------------------------------------------------------------
+    # 6) Salaries (duplicates allowed)
+    # --------------------------------------------------------------------
+    for sal in data.get("salaries", []):
+        rows[OfferSalaries].append(OfferSalaries(
+            offer=offer,
+            currency=r(currency, sal["currency"]),
+            salary_min=sal["min"],
+            salary_max=sal.get("max"),
+            is_gross=sal["is_gross"],
+            unit=r(employment_unit, sal["unit"]),
+            type=r(employment_type, sal["type"]),
+        ))
+
+    return rows
+
+
+def _sync_children(rows_by_offer: Dict[int, Dict[type[Model], List[Model]]]) -> None:
+    """
+    Bring every child table of the given offers in line with the payload.
+
+    The current rows are loaded once per table and compared with the wanted
+    ones as multisets, so only rows that actually differ are deleted or
+    inserted (a changed row is a delete plus an insert).  An unchanged
+    re-ingest writes nothing.  Counts accumulate in `sync_stats`.
+    """
+    offer_ids = list(rows_by_offer)
+    for model, fields in CHILD_MODELS.items():
+        sig = _row_signature(model, fields)
+
+        wanted: Dict[Tuple, List[Model]] = defaultdict(list)
+        for rows in rows_by_offer.values():
+            for row in rows[model]:
+                wanted[sig(row)].append(row)
+
+        stale: List[Model] = []
+        kept = 0
+        for row in model.objects.filter(offer_id__in=offer_ids):
+            if wanted.get(sig(row)):
+                wanted[sig(row)].pop()
+                kept += 1
+            else:
+                stale.append(row)
+        fresh = [row for rows in wanted.values() for row in rows]
+
+        if stale:
+            model.objects.filter(pk__in=[row.pk for row in stale]).delete()
+        if fresh:
+            model.objects.bulk_create(fresh)
+        _record_sync(model._meta.db_table, kept, len(fresh), len(stale))
+
+
+def _row_signature(model: type[Model], fields: Tuple[str, ...]) -> Callable[[Model], Tuple]:
+    """Comparable value tuple of a row, coerced like the DB would store it."""
+    fs = [model._meta.get_field(name) for name in ("offer", *fields)]
+    return lambda row: tuple(f.to_python(getattr(row, f.attname)) for f in fs)
+
+
+# ──────────────────────────────────────────────────────────
+# Write-amplification counters
+# ──────────────────────────────────────────────────────────
+_sync_stats: Dict[str, Dict[str, int]] = defaultdict(
+    lambda: {"kept": 0, "inserted": 0, "deleted": 0}
+)
+_sync_lock = threading.Lock()
+_unchanged = 0
+
+
+def _record_sync(table: str, kept: int, inserted: int, deleted: int) -> None:
+    if inserted or deleted:
+        logger.debug("sync %s: kept=%d inserted=%d deleted=%d",
+                     table, kept, inserted, deleted)
+    with _sync_lock:
+        st = _sync_stats[table]
+        st["kept"] += kept
+        st["inserted"] += inserted
+        st["deleted"] += deleted
+
+
+def _record_unchanged(n: int) -> None:
+    global _unchanged
+    if n:
+        with _sync_lock:
+            _unchanged += n
+
+
+def unchanged_offers(reset: bool = False) -> int:
+    """Offers skipped by `content_fingerprint` since the last reset."""
+    global _unchanged
+    with _sync_lock:
+        n = _unchanged
+        if reset:
+            _unchanged = 0
+    return n
+
+
+def sync_stats(reset: bool = False) -> Dict[str, Dict[str, int]]:
+    """
+    Per child table: rows left untouched (``kept``) vs rows ``inserted`` /
+    ``deleted`` by the diff since the last reset.
+    """
+    with _sync_lock:
+        out = {table: dict(st) for table, st in _sync_stats.items()}
+        if reset:
+            _sync_stats.clear()
+    return out
+
+
 # ──────────────────────────────────────────────────────────
 # Helper for geo locations – still logs its own payload
 # ──────────────────────────────────────────────────────────
 def _location_obj(raw: Dict[str, Any]) -> Locations:
     """
-    Fetch or create a ``Locations`` instance with defensive logging.
+    Fetch or create the ``Locations`` row of one payload location, by its
+    `place_key`.
     """
+    return _locations([raw])[place_key(raw)]
+
+
+def _locations(raws: List[Dict[str, Any]]) -> Dict[str, Locations]:
+    """`resolve_locations`, logging the payloads on failure."""
     try:
-        return Locations.objects.get_or_create(
-            country_code=country(raw.get("country_code")),
-            city=raw["city"],
-            street=raw.get("street"),
-            latitude=raw["latitude"],
-            longitude=raw["longitude"],
-        )[0]
+        return resolve_locations(raws)
     except IntegrityError:
-        logger.exception("IntegrityError in _location_obj | payload=%s", raw)
+        logger.exception("IntegrityError in _location_obj | payload=%s", raws)
         raise
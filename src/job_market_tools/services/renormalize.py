@@ -0,0 +1,605 @@
+# src/job_market_tools/services/renormalize.py
+"""
+Re-apply the current normalization rules to stored data.
+
+Tuning `clean_name` or `normalizer.CUTOFFS` only changes how names are
+matched from then on; rows written earlier stay mapped under the old rules.
+The phases here bring them in line (the ``renormalize`` management command
+runs them in order and records progress in a `Checkpoint`):
+
+1. `refresh_clean_names` – recompute ``name_clean`` of companies, skills
+   and categories,
+2. `forget_aliases` – the stored raw-name decisions were made under the old
+   rules and are relearned as offers are re-normalized,
+3. `plan_merges` / `apply_merges` – cluster each table with the new rules
+   and fold every duplicate into one survivor: foreign keys are repointed
+   and the duplicates deleted with a few set-based statements,
+4. `renormalize_offers` – rebuild each offer's payload from ``raw_json``
+   with its board's scraper, normalize the names again and rewrite the
+   company and skill / category links that changed,
+5. `prune` – delete companies, skills and categories no offer references.
+
+Canonical rows are read through server-side cursors, offers a page at a
+time by id, and offers are written in parallel batches by an
+`IngestQueue`, so memory stays flat however many offers there are and no
+transaction outlives one batch.  Merge planning holds only the surviving
+canonical rows (and trigram counts), never the whole table.
+
+Run it with the scrapers stopped – it rewrites the rows they match against.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import Counter, deque
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from django.db import connection, transaction
+from rapidfuzz import fuzz
+
+from ..db_schema.database import Companies, OfferCategories, Offers, Skills
+from ..scraper.base import SCRAPER_REGISTRY
+from ..scraper import boards  # noqa: F401  (fills SCRAPER_REGISTRY)
+from .aliases import invalidate_aliases
+from .bulk_load import _csv
+from .ingest_queue import IngestQueue
+from .name_index import clean_name, trigrams
+from .normalize_pool import NormalizePool
+from .normalizer import (
+    CUTOFFS,
+    normalize_categories,
+    normalize_company,
+    normalize_skills,
+    reset_indexes,
+)
+
+logger = logging.getLogger(__name__)
+
+# alias kind → table of canonical rows
+MODELS = {"company": Companies, "skill": Skills, "category": OfferCategories}
+
+
+# ──────────────────────────────────────────────────────────
+# Checkpoint
+# ──────────────────────────────────────────────────────────
+class Checkpoint:
+    """
+    Progress of a run in a small JSON file: the finished steps, the offer
+    id re-normalization has completed up to and the ids that failed.
+    Without a *path* nothing is persisted.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.state: Dict[str, Any] = {"done": [], "last_offer_id": 0, "failed": []}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                self.state.update(json.load(fh))
+
+    def is_done(self, step: str) -> bool:
+        return step in self.state["done"]
+
+    def finish(self, step: str) -> None:
+        self.state["done"].append(step)
+        self.save()
+
+    def save(self) -> None:
+        """Write the state; the file is replaced atomically."""
+        if not self.path:
+            return
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self.state, fh)
+        os.replace(tmp, self.path)
+
+
+# ──────────────────────────────────────────────────────────
+# Streaming
+# ──────────────────────────────────────────────────────────
+def _stream(sql: str, chunk_size: int = 5000) -> Iterator[Tuple[Any, ...]]:
+    """
+    Rows of *sql* through a server-side cursor, *chunk_size* per round trip.
+    The cursor lives in its own transaction; don't write from the consuming
+    thread while iterating.
+    """
+    with transaction.atomic(), connection.cursor() as cur:
+        cur.execute(f"DECLARE renormalize_rows NO SCROLL CURSOR FOR {sql}")
+        while True:
+            cur.execute(f"FETCH {int(chunk_size)} FROM renormalize_rows")
+            rows = cur.fetchall()
+            if not rows:
+                break
+            yield from rows
+        cur.execute("CLOSE renormalize_rows")
+
+
+# ──────────────────────────────────────────────────────────
+# Phase 1 – name_clean
+# ──────────────────────────────────────────────────────────
+def refresh_clean_names(chunk_size: int = 5000) -> Dict[str, int]:
+    """Recompute ``name_clean`` of every canonical row; changed rows per kind."""
+    changed: Dict[str, int] = {}
+    for kind, model in MODELS.items():
+        pk = model._meta.pk.attname
+        rows = model.objects.values_list(pk, "name", "name_clean")
+        batch: List[Any] = []
+        n = 0
+        for key, name, old in rows.iterator(chunk_size=chunk_size):
+            new = clean_name(name)
+            if new == old:
+                continue
+            batch.append(model(**{pk: key, "name_clean": new}))
+            if len(batch) >= chunk_size:
+                n += model.objects.bulk_update(batch, ["name_clean"])
+                batch = []
+        if batch:
+            n += model.objects.bulk_update(batch, ["name_clean"])
+        changed[kind] = n
+    return changed
+
+
+# ──────────────────────────────────────────────────────────
+# Phase 3 – merge duplicates
+# ──────────────────────────────────────────────────────────
+# (key, name, name_clean, partition) of every canonical row, the rows most
+# offers point to first
+_PLAN_SQL = {
+    "company": """
+        SELECT c.id, c.name, c.name_clean, c.country_code
+          FROM companies c
+          LEFT JOIN (SELECT company_id, count(*) AS n FROM offers GROUP BY company_id) u
+            ON u.company_id = c.id
+         ORDER BY coalesce(u.n, 0) DESC, c.id""",
+    "skill": """
+        SELECT s.name, s.name, s.name_clean, ''
+          FROM skills s
+          LEFT JOIN (SELECT skill_name, count(*) AS n
+                       FROM (SELECT skill_name FROM offers_skills
+                             UNION ALL
+                             SELECT skill_name FROM offers_optional_skills) l
+                      GROUP BY skill_name) u
+            ON u.skill_name = s.name
+         ORDER BY coalesce(u.n, 0) DESC, s.name""",
+    "category": """
+        SELECT c.name, c.name, c.name_clean, ''
+          FROM offer_categories c
+          LEFT JOIN (SELECT category_name, count(*) AS n
+                       FROM offers_categories GROUP BY category_name) u
+            ON u.category_name = c.name
+         ORDER BY coalesce(u.n, 0) DESC, c.name""",
+}
+
+# link table → its column pointing at the canonical row; extra copied columns
+_LINKS = {
+    "skill": [("offers_skills", "skill_name", ("skill_level",)),
+              ("offers_optional_skills", "skill_name", ("skill_level",))],
+    "category": [("offers_categories", "category_name", ())],
+}
+
+
+class _Survivors:
+    """
+    Survivors of `plan_merges`, matched like `NameIndex.best` – best
+    ``scorer`` score of at least the cutoff that also clears the trigram
+    floor – but without scanning every survivor for every row.
+
+    A pair with trigram similarity ``≥ min_similarity`` shares at least
+    ``⌈min_similarity × |grams|⌉`` trigrams of each name, so it also
+    shares one of the ``|grams| - ⌈min_similarity × |grams|⌉ + 1`` rarest
+    trigrams of both (prefix filtering).  Survivors are indexed by
+    those rare trigrams only, and a row is scored against the survivors it
+    shares one with; *df* – trigram → rows containing it – fixes the
+    order.
+    """
+
+    def __init__(
+        self,
+        df: Mapping[str, int],
+        cutoff: float,
+        scorer=fuzz.token_set_ratio,
+        min_similarity: float = 0.3,
+    ):
+        self.df = df
+        self.cutoff = cutoff
+        self.scorer = scorer
+        self.min_similarity = min_similarity
+        self._names: List[str] = []
+        self._grams: List[frozenset[str]] = []
+        self._keys: List[str] = []
+        self._blocks: Dict[Tuple[Hashable, str], List[int]] = {}
+
+    def _prefix(self, grams: frozenset[str]) -> List[str]:
+        rare = sorted(grams, key=lambda g: (self.df.get(g, 0), g))
+        # rounding down errs towards a longer prefix, never a missed pair
+        return rare[:len(rare) - int(self.min_similarity * len(rare)) + 1]
+
+    def best(self, cleaned: str, part: Hashable) -> Optional[str]:
+        grams = trigrams(cleaned)
+        if not grams:                       # can't clear the trigram floor
+            return None
+        candidates = sorted({
+            i for g in self._prefix(grams) for i in self._blocks.get((part, g), ())
+        })
+        best: Optional[Tuple[float, int]] = None
+        for i in candidates:                # insertion order: ties keep the first
+            other = self._grams[i]
+            if len(grams & other) / len(grams | other) < self.min_similarity:
+                continue
+            score = self.scorer(cleaned, self._names[i], score_cutoff=self.cutoff)
+            if score >= self.cutoff and (best is None or score > best[0]):
+                best = (score, i)
+        return self._keys[best[1]] if best else None
+
+    def add(self, cleaned: str, part: Hashable, key: str) -> None:
+        grams = trigrams(cleaned)
+        i = len(self._names)
+        self._names.append(cleaned)
+        self._grams.append(grams)
+        self._keys.append(key)
+        for g in self._prefix(grams):
+            self._blocks.setdefault((part, g), []).append(i)
+
+
+def plan_merges(kind: str, chunk_size: int = 5000) -> Dict[str, str]:
+    """
+    ``{duplicate key: survivor key}`` (as text) for one alias *kind* under
+    the current rules.  Rows are visited most-referenced first and either
+    match a survivor seen before or become one, so the spelling most offers
+    already use is kept and chains (a ≈ b ≈ c, a ≉ c) don't form.
+
+    Two passes over the rows: the first only counts trigram frequencies
+    for `_Survivors`' blocking, the second matches, so only the survivors
+    and the counts are held in memory.
+    """
+    df = Counter(
+        g
+        for _, name, cleaned, _ in _stream(_PLAN_SQL[kind], chunk_size)
+        for g in trigrams(cleaned or clean_name(name))
+    )
+    survivors = _Survivors(df, CUTOFFS[kind])
+    merges: Dict[str, str] = {}
+    for key, name, cleaned, part in _stream(_PLAN_SQL[kind], chunk_size):
+        cleaned = cleaned or clean_name(name)
+        hit = survivors.best(cleaned, part)
+        if hit:
+            merges[str(key)] = hit
+        else:
+            survivors.add(cleaned, part, str(key))
+    return merges
+
+
+def _merge_sql(kind: str) -> List[str]:
+    if kind == "company":
+        return [
+            """UPDATE offers o SET company_id = m.survivor::integer
+                 FROM merge_map m WHERE o.company_id = m.loser::integer""",
+            """DELETE FROM companies c USING merge_map m
+                WHERE c.id = m.loser::integer""",
+        ]
+    stmts = []
+    for table, col, extra in _LINKS[kind]:
+        cols = ", ".join(("offer_id", col, *extra))
+        copied = "".join(f", t.{c}" for c in extra)
+        stmts += [
+            # an offer linked to both spellings keeps the survivor's row
+            f"""INSERT INTO {table} ({cols})
+                SELECT t.offer_id, m.survivor{copied}
+                  FROM {table} t JOIN merge_map m ON t.{col} = m.loser
+                ON CONFLICT DO NOTHING""",
+            f"DELETE FROM {table} t USING merge_map m WHERE t.{col} = m.loser",
+        ]
+    table = MODELS[kind]._meta.db_table
+    return stmts + [f"DELETE FROM {table} c USING merge_map m WHERE c.name = m.loser"]
+
+
+@transaction.atomic
+def apply_merges(kind: str, merges: Mapping[str, str]) -> int:
+    """
+    Repoint every reference to a duplicate at its survivor and delete the
+    duplicates – a fixed number of statements whatever the number of rows.
+    Stored aliases follow their target.  Returns the rows deleted.
+    """
+    if not merges:
+        return 0
+    with connection.cursor() as cur:
+        cur.execute("DROP TABLE IF EXISTS merge_map")
+        cur.execute(
+            "CREATE TEMP TABLE merge_map (loser varchar PRIMARY KEY, survivor varchar) "
+            "ON COMMIT DROP"
+        )
+        cur.copy_expert("COPY merge_map FROM STDIN WITH (FORMAT csv)", _csv(merges.items()))
+        cur.execute("ANALYZE merge_map")
+        for stmt in _merge_sql(kind):
+            cur.execute(stmt)
+        deleted = cur.rowcount
+        cur.execute(
+            """UPDATE name_aliases a SET target = m.survivor
+                 FROM merge_map m WHERE a.kind = %s AND a.target = m.loser""",
+            [kind],
+        )
+    transaction.on_commit(_forget_in_memory)
+    return deleted
+
+
+def _forget_in_memory() -> None:
+    reset_indexes()
+    invalidate_aliases()
+
+
+# ──────────────────────────────────────────────────────────
+# Phase 4 – offers
+# ──────────────────────────────────────────────────────────
+_STAGES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "renorm_offers": (("id", "integer"), ("company_id", "integer")),
+    "renorm_categories": (
+        ("offer_id", "integer"), ("ord", "integer"), ("category_name", "varchar"),
+    ),
+    "renorm_skills": (
+        ("offer_id", "integer"), ("ord", "integer"), ("skill_name", "varchar"),
+        ("skill_level", "integer"),
+    ),
+    "renorm_optional_skills": (
+        ("offer_id", "integer"), ("ord", "integer"), ("skill_name", "varchar"),
+        ("skill_level", "integer"),
+    ),
+}
+
+# (link table, staging table, name column, extra columns)
+_OFFER_LINKS = [
+    ("offers_categories", "renorm_categories", "category_name", ()),
+    ("offers_skills", "renorm_skills", "skill_name", ("skill_level",)),
+    ("offers_optional_skills", "renorm_optional_skills", "skill_name", ("skill_level",)),
+]
+
+
+def _rewrite_sql() -> List[str]:
+    stmts = [
+        """UPDATE offers o SET company_id = s.company_id
+             FROM renorm_offers s
+            WHERE o.id = s.id AND o.company_id IS DISTINCT FROM s.company_id""",
+    ]
+    for table, stage, col, extra in _OFFER_LINKS:
+        cols = ", ".join(("offer_id", col, *extra))
+        stmts += [
+            # links the payload no longer produces …
+            f"""DELETE FROM {table} t USING renorm_offers s
+                 WHERE t.offer_id = s.id
+                   AND NOT EXISTS (SELECT 1 FROM {stage} w
+                                    WHERE w.offer_id = t.offer_id AND w.{col} = t.{col})""",
+            # … and new ones; rows that stay the same are not touched
+            f"""INSERT INTO {table} ({cols})
+                SELECT DISTINCT ON (offer_id, {col}) {cols}
+                  FROM {stage} ORDER BY offer_id, {col}, ord
+                ON CONFLICT DO NOTHING""",
+        ]
+    return stmts
+
+
+_REWRITE_SQL = _rewrite_sql()
+
+
+def _payload_builder() -> Callable[[str, Any], Mapping[str, Any] | None]:
+    """``(board, raw_json) → payload`` via the board scraper, None if impossible."""
+    scrapers: Dict[str, Any] = {}
+    lock = threading.Lock()
+
+    def build(board: str, raw: Any) -> Mapping[str, Any] | None:
+        with lock:
+            if board not in scrapers:
+                cls = SCRAPER_REGISTRY.get(board)
+                scrapers[board] = cls and cls(name=board, verbose=False)
+        if not raw or scrapers[board] is None:
+            return None
+        try:
+            return scrapers[board]._make_offer_payload(raw)
+        except (KeyError, TypeError, ValueError):
+            logger.debug("renormalize: cannot rebuild payload | board=%s raw=%s", board, raw)
+            return None
+
+    return build
+
+
+@transaction.atomic
+def _rewrite_offers(rows: Sequence[Mapping[str, Any]]) -> Dict[str, int]:
+    """
+    Normalize the payloads of *rows* (``{"id", "payload"}``) again and write
+    the differences with staging tables + ``COPY``.
+    """
+    payloads = [r["payload"] for r in rows]
+    skills = normalize_skills(
+        sk["name"]
+        for d in payloads
+        for sk in (*d.get("skills_required", []), *d.get("skills_optional", []))
+    )
+    categories = normalize_categories(raw for d in payloads for raw in d.get("categories", []))
+    companies: Dict[Tuple[str, str | None], int] = {}
+
+    staged: Dict[str, List[Tuple[Any, ...]]] = {table: [] for table in _STAGES}
+    for row in rows:
+        oid, d = row["id"], row["payload"]
+        key = (d["company_name"], d.get("company_country_code"))
+        if key not in companies:
+            companies[key] = normalize_company(*key).pk
+        staged["renorm_offers"].append((oid, companies[key]))
+        for i, raw in enumerate(d.get("categories", [])):
+            staged["renorm_categories"].append((oid, i, categories[raw].name))
+        for i, sk in enumerate(d.get("skills_required", [])):
+            # same coercion as the ingest paths: no level fails the offer
+            staged["renorm_skills"].append((
+                oid, i, skills[sk["name"]].name, int(sk.get("level")),
+            ))
+        for i, sk in enumerate(d.get("skills_optional", [])):
+            staged["renorm_optional_skills"].append((
+                oid, i, skills[sk["name"]].name, int(sk.get("level") or 1),
+            ))
+
+    counts: Dict[str, int] = {}
+    with connection.cursor() as cur:
+        for table, cols in _STAGES.items():
+            cur.execute(f"DROP TABLE IF EXISTS {table}")
+            cur.execute(
+                f"CREATE TEMP TABLE {table} "
+                f"({', '.join(f'{c} {t}' for c, t in cols)}) ON COMMIT DROP"
+            )
+            cur.copy_expert(
+                f"COPY {table} ({', '.join(c for c, _ in cols)}) "
+                r"FROM STDIN WITH (FORMAT csv, NULL '\N')",
+                _csv(staged[table]),
+            )
+        for stmt in _REWRITE_SQL:
+            cur.execute(stmt)
+            verb = stmt.split(None, 1)[0].lower()
+            counts[verb] = counts.get(verb, 0) + cur.rowcount
+    return counts
+
+
+class _Watermark:
+    """Highest offer id up to which every offer handed out has been finished."""
+
+    def __init__(self, start: int):
+        self.value = start
+        self._pending: deque[int] = deque()
+        self._finished: set[int] = set()
+        self._lock = threading.Lock()
+
+    def fed(self, oid: int) -> None:
+        with self._lock:
+            self._pending.append(oid)
+
+    def done(self, oid: int) -> None:
+        with self._lock:
+            self._finished.add(oid)
+            while self._pending and self._pending[0] in self._finished:
+                self.value = self._pending.popleft()
+                self._finished.discard(self.value)
+
+
+def renormalize_offers(
+    checkpoint: Checkpoint,
+    workers: int = 2,
+    normalize_workers: int = 0,
+    chunk_size: int = 500,
+    progress: Callable[[Dict[str, int]], None] | None = None,
+) -> Dict[str, int]:
+    """
+    Re-normalize every offer after ``checkpoint.state["last_offer_id"]``.
+
+    Offers are read in id order, *chunk_size* per query (keyset
+    pagination, so no transaction or cursor spans the run), their payloads
+    rebuilt from ``raw_json`` and handed to *workers* writer threads in
+    batches of *chunk_size*, each committed on its own.  With
+    ``normalize_workers`` the names of each batch are matched in a
+    `NormalizePool` first.  The checkpoint is saved after every page and at
+    the end; offers that fail are logged and listed under ``"failed"``.
+
+    *progress* is called with the running counters at every save.
+    """
+    build = _payload_builder()
+    mark = _Watermark(checkpoint.state["last_offer_id"])
+    counts = {"seen": 0, "skipped": 0, "failed": 0, "update": 0, "delete": 0, "insert": 0}
+    failed: List[int] = checkpoint.state["failed"]
+    lock = threading.Lock()
+    pool = NormalizePool(normalize_workers) if normalize_workers else None
+
+    def write(rows: Sequence[Mapping[str, Any]]) -> None:
+        try:
+            if pool:
+                pool.prenormalize([r["payload"] for r in rows])
+            done = _rewrite_offers(rows)
+        except Exception:
+            if len(rows) > 1:
+                raise                   # the queue retries them one by one
+            logger.exception("renormalize: offer %s failed", rows[0]["id"])
+            done = {"failed": 1}
+            with lock:
+                failed.append(rows[0]["id"])
+        with lock:
+            for k, v in done.items():
+                counts[k] += v
+
+    def save() -> None:
+        with lock:
+            checkpoint.state["last_offer_id"] = mark.value
+            checkpoint.save()
+            snapshot = dict(counts)
+        if progress:
+            progress(snapshot)
+
+    queue = IngestQueue(
+        writer=write,
+        workers=workers,
+        maxsize=4 * chunk_size * max(1, workers),
+        batch_size=chunk_size,
+        name="renormalize",
+    )
+    try:
+        last_read = mark.value
+        while True:
+            page = list(
+                Offers.objects.filter(id__gt=last_read)
+                .order_by("id")
+                .values_list("id", "job_board_name_id", "raw_json")[:chunk_size]
+            )
+            if not page:
+                break
+            for oid, board, raw in page:
+                mark.fed(oid)
+                payload = build(board, raw)
+                with lock:
+                    counts["seen"] += 1
+                    if payload is None:
+                        counts["skipped"] += 1
+                if payload is None:
+                    mark.done(oid)
+                else:
+                    queue.put({"id": oid, "payload": payload}, on_done=partial(mark.done, oid))
+            last_read = page[-1][0]
+            save()
+    finally:
+        queue.close()
+        if pool:
+            pool.close()
+        save()
+    return counts
+
+
+# ──────────────────────────────────────────────────────────
+# Phase 5 – prune
+# ──────────────────────────────────────────────────────────
+_PRUNE_SQL = {
+    "company": """
+        DELETE FROM companies c
+         WHERE NOT EXISTS (SELECT 1 FROM offers o WHERE o.company_id = c.id)""",
+    "skill": """
+        DELETE FROM skills s
+         WHERE NOT EXISTS (SELECT 1 FROM offers_skills t WHERE t.skill_name = s.name)
+           AND NOT EXISTS (SELECT 1 FROM offers_optional_skills t
+                            WHERE t.skill_name = s.name)""",
+    "category": """
+        DELETE FROM offer_categories c
+         WHERE NOT EXISTS (SELECT 1 FROM offers_categories t
+                            WHERE t.category_name = c.name)""",
+}
+
+
+@transaction.atomic
+def prune() -> Dict[str, int]:
+    """Delete canonical rows no offer references, and aliases pointing at them."""
+    deleted: Dict[str, int] = {}
+    with connection.cursor() as cur:
+        for kind, sql in _PRUNE_SQL.items():
+            cur.execute(sql)
+            deleted[kind] = cur.rowcount
+            model = MODELS[kind]
+            cur.execute(
+                f"""DELETE FROM name_aliases a
+                     WHERE a.kind = %s
+                       AND NOT EXISTS (SELECT 1 FROM {model._meta.db_table} c
+                                        WHERE c.{model._meta.pk.column}::text = a.target)""",
+                [kind],
+            )
+    transaction.on_commit(_forget_in_memory)
+    return deleted
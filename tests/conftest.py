@@ -0,0 +1,13 @@
+"""
+Shared test setup.
+
+The services import the Django models at module level, so Django is set up
+once here.  Nothing under ``tests/`` opens a database connection – code that
+queries is fed fake querysets instead.
+"""
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "offers_dashboard.settings")
+django.setup()
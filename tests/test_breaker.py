@@ -0,0 +1,114 @@
+import pytest
+import requests
+from django.db import OperationalError
+
+from job_market_tools.scraper import breaker
+from job_market_tools.scraper.breaker import CircuitBreaker, classify_error, retry_after
+from job_market_tools.services.ingest_queue import IngestFailed
+
+
+def _http_error(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(response=response)
+
+
+# ──────────────────────────────────────────────────────────
+# classify_error
+# ──────────────────────────────────────────────────────────
+@pytest.mark.parametrize("exc, kind", [
+    (_http_error(429), "rate_limited"),
+    (_http_error(503), "server"),
+    (_http_error(404), "client"),
+    (requests.ConnectionError(), "network"),
+    (requests.Timeout(), "network"),
+    (OperationalError(), "database"),
+    (KeyError("slug"), "error"),
+])
+def test_classify_error(exc, kind):
+    assert classify_error(exc) == kind
+
+
+def test_failed_ingest_is_classified_by_its_first_error():
+    errors = [OperationalError("server closed the connection"), ValueError()]
+    try:
+        raise IngestFailed(errors) from errors[0]
+    except IngestFailed as e:
+        assert classify_error(e) == "database"
+
+
+def test_retry_after_reads_the_header():
+    assert retry_after(_http_error(429, {"Retry-After": "30"})) == 30
+    assert retry_after(_http_error(429)) is None
+    assert retry_after(ValueError()) is None
+
+
+# ──────────────────────────────────────────────────────────
+# CircuitBreaker
+# ──────────────────────────────────────────────────────────
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen monotonic clock, advanced by hand; jitter always at its maximum."""
+    now = [1000.0]
+    monkeypatch.setattr(breaker.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(breaker.random, "uniform", lambda a, b: b)
+    return now
+
+
+def test_backoff_doubles_up_to_the_cap(clock):
+    cb = CircuitBreaker(threshold=10, backoff=5, max_backoff=30)
+
+    assert [cb.failure("network") for _ in range(5)] == [5, 10, 20, 30, 30]
+    assert cb.state == CircuitBreaker.CLOSED
+
+
+def test_jitter_keeps_at_least_half_the_delay(monkeypatch):
+    monkeypatch.setattr(breaker.random, "uniform", lambda a, b: a)
+    cb = CircuitBreaker(backoff=8)
+
+    assert cb.failure("network") == 4
+
+
+def test_opens_after_threshold_and_probes_once_cooled_down(clock):
+    cb = CircuitBreaker(threshold=3, backoff=1, cooldown=60)
+    cb.failure("server")
+    cb.failure("server")
+
+    assert cb.failure("server") == 60
+    assert cb.state == CircuitBreaker.OPEN
+    cb.before_call()
+    assert cb.state == CircuitBreaker.OPEN           # still cooling down
+
+    clock[0] += 60
+    cb.before_call()
+    assert cb.state == CircuitBreaker.HALF_OPEN
+
+
+def test_failed_probe_reopens_with_a_longer_cooldown(clock):
+    cb = CircuitBreaker(threshold=1, cooldown=60, max_backoff=900)
+    assert cb.failure("server") == 60
+    clock[0] += 60
+    cb.before_call()
+
+    assert cb.failure("server") == 120
+    assert cb.state == CircuitBreaker.OPEN
+
+
+def test_success_closes_and_reports_recovery(clock):
+    cb = CircuitBreaker(threshold=1)
+    assert cb.success() is False                     # nothing to recover from
+
+    cb.failure("database")
+    assert cb.success() is True
+    assert cb.snapshot() == {
+        "state": "closed", "failures": 0, "last_error": "database", "retry_in": None,
+    }
+    assert cb.failure("database") == cb.cooldown     # the outage count restarted
+
+
+def test_retry_after_is_a_lower_bound(clock):
+    cb = CircuitBreaker(backoff=5)
+
+    assert cb.failure("rate_limited", min_delay=90) == 90
+    assert cb.snapshot()["retry_in"] == 90
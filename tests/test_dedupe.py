@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import pytest
+
+from job_market_tools.services import dedupe
+from job_market_tools.services.dedupe import SeenUids, existing_uids
+
+
+class _FakeQuerySet:
+    """Just enough of a queryset for `SeenUids.warm`."""
+
+    def __init__(self, uids):
+        self.uids = uids
+
+    def filter(self, **kwargs):
+        return self
+
+    def exclude(self, **kwargs):
+        return self
+
+    def values_list(self, *fields, flat=False):
+        return self
+
+    def iterator(self, chunk_size=None):
+        return iter(self.uids)
+
+
+@pytest.fixture
+def stored(monkeypatch):
+    """Make `Offers.objects` return the UIDs in the returned list."""
+    uids = []
+    monkeypatch.setattr(dedupe, "Offers", SimpleNamespace(objects=_FakeQuerySet(uids)))
+    return uids
+
+
+def test_warm_loads_stored_uids(stored):
+    stored.extend(f"offer-{i}" for i in range(100))
+    seen = SeenUids("board")
+
+    assert seen.warm() == 100
+    assert len(seen) == 100
+    assert "offer-0" in seen and "offer-99" in seen
+    assert "offer-100" not in seen
+
+
+def test_warm_replaces_earlier_contents(stored):
+    seen = SeenUids("board")
+    seen.add("gone")
+    stored.append("kept")
+
+    seen.warm()
+
+    assert "kept" in seen
+    assert "gone" not in seen
+
+
+def test_add_is_idempotent():
+    seen = SeenUids("board")
+    seen.add("a")
+    seen.add("a")
+
+    assert "a" in seen
+    assert len(seen) == 1
+
+
+def test_add_merges_recent_into_sorted(monkeypatch):
+    monkeypatch.setattr(SeenUids, "MERGE_EVERY", 8)
+    seen = SeenUids("board")
+    uids = [f"offer-{i}" for i in range(20)]
+    for uid in uids:
+        seen.add(uid)
+
+    assert len(seen._sorted) == 16 and len(seen._recent) == 4
+    assert list(seen._sorted) == sorted(seen._sorted)
+    assert all(uid in seen for uid in uids)
+    assert "offer-20" not in seen
+    for uid in uids:                        # already merged: no duplicates
+        seen.add(uid)
+    assert len(seen) == 20
+
+
+def test_existing_uids_skips_the_query_when_the_filter_rules_all_out(monkeypatch):
+    class _NoQuery:
+        def __getattr__(self, name):
+            raise AssertionError("database queried")
+
+    monkeypatch.setattr(dedupe, "Offers", SimpleNamespace(objects=_NoQuery()))
+    seen = SeenUids("board")
+    seen.add("old")
+
+    assert existing_uids("board", ["new-1", "new-2"], seen=seen) == set()
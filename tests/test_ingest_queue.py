@@ -0,0 +1,115 @@
+import threading
+
+import pytest
+
+from job_market_tools.services.ingest_queue import IngestFailed, IngestQueue
+
+
+class _Writer:
+    """Records every call; raises for payloads whose ``bad`` key is set."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, payloads):
+        with self.lock:
+            self.calls.append([p["n"] for p in payloads])
+        if any(p.get("bad") for p in payloads):
+            raise ValueError("bad payload")
+
+
+@pytest.fixture
+def writer():
+    return _Writer()
+
+
+@pytest.fixture
+def make_queue(writer):
+    queues = []
+
+    def make(**kwargs):
+        q = IngestQueue(writer=writer, **{"workers": 1, "max_wait": 0.05, **kwargs})
+        queues.append(q)
+        return q
+
+    yield make
+    for q in queues:
+        q.close()
+
+
+def test_join_waits_for_every_payload_and_its_callback(make_queue, writer):
+    q = make_queue(workers=2, batch_size=4)
+    done = []
+    for n in range(10):
+        q.put({"n": n}, on_done=lambda n=n: done.append(n))
+
+    q.join()
+
+    assert sorted(done) == list(range(10))
+    assert sorted(n for call in writer.calls for n in call) == list(range(10))
+    assert all(len(call) <= 4 for call in writer.calls)
+    st = q.stats()
+    assert st["enqueued"] == st["written"] == 10 and st["failed"] == 0
+
+
+def test_failed_batch_is_retried_payload_by_payload(make_queue, writer):
+    q = make_queue(batch_size=10, max_wait=1)
+    done, failed = [], []
+    for n in range(5):
+        q.put({"n": n, "bad": n == 3},
+              on_done=lambda n=n: done.append(n), on_fail=lambda n=n: failed.append(n))
+
+    with pytest.raises(IngestFailed) as exc:
+        q.join()
+
+    assert writer.calls[0] == [0, 1, 2, 3, 4]
+    assert writer.calls[1:] == [[0], [1], [2], [3], [4]]
+    assert sorted(done) == [0, 1, 2, 4] and failed == [3]
+    assert len(exc.value.errors) == 1
+    assert isinstance(exc.value.__cause__, ValueError)
+    assert q.stats()["written"] == 4 and q.stats()["failed"] == 1
+
+
+def test_join_reports_each_failure_once(make_queue):
+    q = make_queue()
+    q.put({"n": 0, "bad": True})
+    with pytest.raises(IngestFailed):
+        q.join()
+
+    q.put({"n": 1})
+    q.join()                                # nothing new failed
+
+
+def test_a_failing_callback_does_not_stop_the_writer(make_queue):
+    q = make_queue()
+
+    def boom():
+        raise RuntimeError("callback")
+
+    done = []
+    q.put({"n": 0}, on_done=boom)
+    q.put({"n": 1}, on_done=lambda: done.append(1))
+    q.join()
+
+    assert done == [1]
+
+
+def test_close_drains_the_queue(writer):
+    q = IngestQueue(writer=writer, workers=2, batch_size=3, max_wait=0.05)
+    for n in range(20):
+        q.put({"n": n})
+
+    q.close()
+
+    assert sorted(n for call in writer.calls for n in call) == list(range(20))
+    assert not any(t.is_alive() for t in q._threads)
+
+
+def test_stats_reset(make_queue):
+    q = make_queue()
+    q.put({"n": 0})
+    q.join()
+
+    assert q.stats(reset=True)["written"] == 1
+    assert q.stats()["written"] == 0
@@ -0,0 +1,152 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from job_market_tools.db_schema.database import OfferSalaries, OffersCategories, OffersSkills
+from job_market_tools.services.offer_ingest import (
+    CHILD_MODELS,
+    _sync_children,
+    content_fingerprint,
+    sync_stats,
+)
+
+
+# ──────────────────────────────────────────────────────────
+# Child-table diffing
+# ──────────────────────────────────────────────────────────
+class _Rows(list):
+    def __init__(self, table, rows):
+        super().__init__(rows)
+        self.table = table
+
+    def delete(self):
+        self.table.deleted.extend(self)
+        self.table.rows = [r for r in self.table.rows if r not in self]
+
+
+class _Table:
+    """In-memory stand-in for a child model's manager."""
+
+    def __init__(self):
+        self.rows, self.deleted, self.created = [], [], []
+
+    def filter(self, offer_id__in=None, pk__in=None):
+        if pk__in is not None:
+            return _Rows(self, [r for r in self.rows if r.pk in pk__in])
+        return _Rows(self, [r for r in self.rows if r.offer_id in offer_id__in])
+
+    def bulk_create(self, rows):
+        self.created.extend(rows)
+        self.rows.extend(rows)
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    tables = {model: _Table() for model in CHILD_MODELS}
+    for model, table in tables.items():
+        monkeypatch.setattr(model, "objects", table)
+    sync_stats(reset=True)
+    return tables
+
+
+def _salary(offer_id, pk=None, **overrides):
+    fields = dict(currency_id="PLN", salary_min=100, salary_max=200, is_gross=True,
+                  unit_id="month", type_id="b2b")
+    return OfferSalaries(id=pk, offer_id=offer_id, **{**fields, **overrides})
+
+
+def _wanted(offer_id, rows):
+    """``rows_by_offer`` for one offer, with every child model present."""
+    return {offer_id: {model: rows.get(model, []) for model in CHILD_MODELS}}
+
+
+def test_unchanged_rows_are_kept(tables):
+    tables[OffersCategories].rows = [OffersCategories(offer_id=1, category_name_id="Backend")]
+    tables[OfferSalaries].rows = [_salary(1, pk=10)]
+
+    _sync_children(_wanted(1, {
+        OffersCategories: [OffersCategories(offer_id=1, category_name_id="Backend")],
+        OfferSalaries: [_salary(1)],
+    }))
+
+    assert all(not t.created and not t.deleted for t in tables.values())
+    stats = sync_stats()
+    assert stats["offers_categories"] == {"kept": 1, "inserted": 0, "deleted": 0}
+    assert stats["offer_salaries"] == {"kept": 1, "inserted": 0, "deleted": 0}
+
+
+def test_only_differing_rows_are_replaced(tables):
+    table = tables[OfferSalaries]
+    table.rows = [_salary(1, pk=10), _salary(1, pk=11, salary_max=300)]
+
+    _sync_children(_wanted(1, {OfferSalaries: [_salary(1), _salary(1, salary_max=400)]}))
+
+    assert [r.pk for r in table.deleted] == [11]
+    assert [r.salary_max for r in table.created] == [400]
+    assert sync_stats()["offer_salaries"] == {"kept": 1, "inserted": 1, "deleted": 1}
+
+
+def test_rows_are_compared_as_a_multiset(tables):
+    table = tables[OfferSalaries]
+    table.rows = [_salary(1, pk=10), _salary(1, pk=11)]
+
+    _sync_children(_wanted(1, {OfferSalaries: [_salary(1)]}))
+
+    assert len(table.deleted) == 1 and not table.created
+    assert len(table.rows) == 1
+
+
+def test_rows_of_other_offers_are_left_alone(tables):
+    table = tables[OfferSalaries]
+    table.rows = [_salary(2, pk=20)]
+
+    _sync_children(_wanted(1, {OfferSalaries: [_salary(1)]}))
+
+    assert not table.deleted
+    assert [r.offer_id for r in table.rows] == [2, 1]
+
+
+def test_signature_coerces_values_like_the_db(tables):
+    table = tables[OffersSkills]
+    table.rows = [OffersSkills(offer_id=1, skill_name_id="Python", skill_level_id=3)]
+
+    _sync_children(_wanted(1, {
+        OffersSkills: [OffersSkills(offer_id="1", skill_name_id="Python", skill_level_id="3")],
+    }))
+
+    assert not table.created and not table.deleted
+
+
+# ──────────────────────────────────────────────────────────
+# Payload fingerprints
+# ──────────────────────────────────────────────────────────
+PAYLOAD = {
+    "external_uid": "acme-python-dev",
+    "title": "Python developer",
+    "publish_date": datetime(2025, 1, 1, 10, tzinfo=timezone.utc),
+    "skills_required": [{"name": "Python", "level": 4}, {"name": "Django", "level": 3}],
+    "salaries": [{"currency": "PLN", "min": 100, "max": None}],
+}
+
+
+def test_fingerprint_ignores_key_order():
+    shuffled = {k: PAYLOAD[k] for k in reversed(PAYLOAD)}
+    shuffled["skills_required"] = [dict(reversed(sk.items())) for sk in PAYLOAD["skills_required"]]
+
+    assert content_fingerprint(shuffled) == content_fingerprint(PAYLOAD)
+
+
+@pytest.mark.parametrize("change", [
+    {"title": "Senior Python developer"},
+    {"publish_date": datetime(2025, 1, 2, 10, tzinfo=timezone.utc)},
+    {"skills_required": [{"name": "Python", "level": 5}, {"name": "Django", "level": 3}]},
+    {"salaries": [{"currency": "PLN", "min": 100, "max": 200}]},
+])
+def test_fingerprint_changes_with_the_content(change):
+    assert content_fingerprint({**PAYLOAD, **change}) != content_fingerprint(PAYLOAD)
+
+
+def test_fingerprint_is_a_sha256_hex_digest():
+    fp = content_fingerprint(PAYLOAD)
+
+    assert len(fp) == 64 and int(fp, 16) >= 0
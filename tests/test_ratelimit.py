@@ -0,0 +1,122 @@
+import pytest
+
+from job_market_tools.scraper import ratelimit
+from job_market_tools.scraper.ratelimit import (
+    RateLimiter,
+    SharedTokenBucket,
+    TokenBucket,
+    bucket_for,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Frozen clock for both bucket kinds.  ``sleep`` only records – the
+    callers behave like concurrent threads that all ask at the same instant.
+    """
+    now = [1000.0]
+    slept = []
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit.time, "time", lambda: now[0])
+    monkeypatch.setattr(ratelimit.time, "sleep", slept.append)
+    monkeypatch.setattr(ratelimit, "_buckets", {})
+    return now
+
+
+# ──────────────────────────────────────────────────────────
+# TokenBucket
+# ──────────────────────────────────────────────────────────
+def test_burst_then_evenly_spaced(clock):
+    bucket = TokenBucket(rate=2, burst=3)
+
+    assert [bucket.acquire() for _ in range(6)] == [0, 0, 0, 0.5, 1.0, 1.5]
+    assert bucket.throttled == 3 and bucket.waited == 3.0
+
+
+def test_refill_is_capped_at_the_burst(clock):
+    bucket = TokenBucket(rate=1, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock[0] += 3600
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 1.0]
+
+
+def test_pause_holds_every_token_back(clock):
+    bucket = TokenBucket(rate=1, burst=5)
+
+    bucket.pause(10)
+
+    assert bucket.acquire() == 11
+    clock[0] += 11
+    assert bucket.acquire() == 1            # spaced again, no burst after it
+
+
+def test_tighten_only_lowers_the_limits(clock):
+    bucket = TokenBucket(rate=5, burst=10)
+
+    bucket.tighten(rate=10, burst=20)
+    assert (bucket.rate, bucket.burst) == (5, 10)
+    bucket.tighten(rate=2)
+    assert (bucket.rate, bucket.burst) == (2, 2)
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+# ──────────────────────────────────────────────────────────
+# SharedTokenBucket
+# ──────────────────────────────────────────────────────────
+def test_shared_buckets_draw_from_one_budget(clock, tmp_path):
+    path = str(tmp_path / "board.example.bucket")
+    first = SharedTokenBucket(path, rate=1, burst=2)
+    second = SharedTokenBucket(path, rate=1, burst=2)     # another process
+
+    assert [first.acquire(), second.acquire(), first.acquire()] == [0, 0, 1.0]
+    assert second.acquire() == 2.0
+
+
+def test_garbled_state_file_means_a_full_bucket(clock, tmp_path):
+    path = tmp_path / "board.example.bucket"
+    path.write_text("not a bucket")
+    bucket = SharedTokenBucket(str(path), rate=1, burst=2)
+
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 1.0]
+
+
+# ──────────────────────────────────────────────────────────
+# Registry / RateLimiter
+# ──────────────────────────────────────────────────────────
+def test_one_bucket_per_host_and_the_strictest_limit_wins(clock):
+    bucket = bucket_for("board.example", rate=5)
+
+    assert bucket_for("board.example", rate=2) is bucket
+    assert bucket.rate == 2
+    assert bucket_for("other.example", rate=5) is not bucket
+
+
+def test_shared_dir_gives_a_shared_bucket(clock, tmp_path):
+    bucket = bucket_for("board.example", rate=1, shared_dir=str(tmp_path / "buckets"))
+
+    assert isinstance(bucket, SharedTokenBucket)
+    assert bucket.path == str(tmp_path / "buckets" / "board.example.bucket")
+
+
+def test_limiters_share_the_host_bucket(clock):
+    a, b = RateLimiter(rate=1, burst=1), RateLimiter(rate=1, burst=1)
+
+    assert a.acquire("https://board.example/api/offers?page=1") == 0
+    assert b.acquire("https://board.example/api/offers/42") == 1.0
+    assert a.acquire("https://other.example/") == 0
+    assert b.stats() == {"throttled": 1, "waited": 1.0}
+
+
+def test_pause_pauses_every_limiter_of_the_host(clock):
+    a, b = RateLimiter(rate=1, burst=5), RateLimiter(rate=1, burst=5)
+
+    a.pause("https://board.example/api/offers", 30)
+
+    assert b.acquire("https://board.example/api/offers/42") == 31
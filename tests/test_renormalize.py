@@ -0,0 +1,128 @@
+import random
+from collections import Counter
+
+import pytest
+from rapidfuzz import fuzz
+
+from job_market_tools.services import renormalize
+from job_market_tools.services.name_index import trigram_similarity, trigrams
+from job_market_tools.services.renormalize import _Survivors, plan_merges
+
+WORDS = ["acme", "soft", "software", "house", "data", "labs", "cloud", "systems",
+         "group", "it", "tech", "solutions", "net", "dev", "polska"]
+
+
+def _random_names(rng, n):
+    names = []
+    for _ in range(n):
+        words = rng.sample(WORDS, rng.randint(1, 3))
+        if rng.random() < 0.3:                  # a typo
+            w = rng.randrange(len(words))
+            words[w] = words[w][:-1] or words[w]
+        names.append(" ".join(words))
+    return names
+
+
+def _full_scan(survivors, cleaned, part, cutoff):
+    """What `_Survivors.best` must return: every survivor scored, first best wins."""
+    best = None
+    for name, p, key in survivors:
+        if p != part or trigram_similarity(cleaned, name) < 0.3:
+            continue
+        score = fuzz.token_set_ratio(cleaned, name, score_cutoff=cutoff)
+        if score >= cutoff and (best is None or score > best[0]):
+            best = (score, key)
+    return best and best[1]
+
+
+# ──────────────────────────────────────────────────────────
+# _Survivors
+# ──────────────────────────────────────────────────────────
+@pytest.mark.parametrize("cutoff", [80, 90])
+def test_survivors_match_like_a_full_scan(cutoff):
+    rng = random.Random(cutoff)
+    rows = [(name, rng.choice("ab"), str(i)) for i, name in enumerate(_random_names(rng, 400))]
+    df = Counter(g for name, _, _ in rows for g in trigrams(name))
+    index, seen = _Survivors(df, cutoff), []
+
+    for name, part, key in rows:
+        hit = index.best(name, part)
+        assert hit == _full_scan(seen, name, part, cutoff), name
+        if hit is None:
+            index.add(name, part, key)
+            seen.append((name, part, key))
+    assert 0 < len(seen) < len(rows)
+
+
+def test_survivors_respect_the_trigram_floor():
+    # token_set_ratio scores a subset 100, the trigram floor rejects it
+    index = _Survivors(Counter(), cutoff=90)
+    index.add("it solutions polska group", "pl", "1")
+
+    assert fuzz.token_set_ratio("it", "it solutions polska group") == 100
+    assert index.best("it", "pl") is None
+
+
+def test_survivors_only_match_within_a_partition():
+    index = _Survivors(Counter(), cutoff=90)
+    index.add("acme software", "pl", "1")
+
+    assert index.best("acme software", "pl") == "1"
+    assert index.best("acme software", "de") is None
+
+
+def test_names_without_trigrams_never_match():
+    index = _Survivors(Counter(), cutoff=80)
+    index.add("", "", "1")
+
+    assert index.best("", "") is None
+
+
+# ──────────────────────────────────────────────────────────
+# plan_merges
+# ──────────────────────────────────────────────────────────
+@pytest.fixture
+def rows(monkeypatch):
+    """``(key, name, name_clean, partition)`` rows `plan_merges` reads, in order."""
+    rows = []
+    monkeypatch.setattr(renormalize, "_stream", lambda sql, chunk_size=5000: iter(rows))
+    return rows
+
+
+def test_plan_merges_keeps_the_first_spelling(rows):
+    rows += [
+        (1, "Acme Software", "acme software", "PL"),
+        (2, "ACME Software House", "acme software house", "PL"),
+        (3, "Globex", "globex", "PL"),
+    ]
+
+    assert plan_merges("company") == {"2": "1"}
+
+
+def test_plan_merges_does_not_chain(rows):
+    # 2 ≈ 1 and 3 ≈ 2, but 3 ≉ 1: 3 must not be merged through 2
+    rows += [
+        (1, "Acme Software", "acme software", "PL"),
+        (2, "Acme Software House", "acme software house", "PL"),
+        (3, "Software House", "software house", "PL"),
+    ]
+
+    assert plan_merges("company") == {"2": "1"}
+
+
+def test_plan_merges_keeps_partitions_apart(rows):
+    rows += [
+        (1, "Acme Software", "acme software", "PL"),
+        (2, "Acme Software", "acme software", "DE"),
+    ]
+
+    assert plan_merges("company") == {}
+
+
+def test_plan_merges_cleans_rows_without_a_stored_clean_name(rows):
+    rows += [
+        ("Python", "Python", "python", ""),
+        ("python 3", "python 3", None, ""),
+    ]
+
+    assert plan_merges("skill") == {"python 3": "Python"}